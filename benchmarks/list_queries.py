@@ -0,0 +1,111 @@
+"""Latency of `ModelAdmin.list` with sequential and concurrent count/page queries.
+
+Every statement is delayed by `--latency` milliseconds to simulate
+the network round trip to a database server.
+
+    python -m benchmarks.list_queries --latency 5 --requests 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, List
+
+import anyio
+from sqlalchemy import Column, Integer, String, create_engine, event, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.util import await_only
+from starlette.applications import Starlette
+
+from sqladmin import Admin, ModelAdmin
+
+Base = declarative_base()  # type: Any
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class UserAdmin(ModelAdmin, model=User):
+    column_list = [User.id, User.name]
+
+
+async def sequential_list(model_admin: ModelAdmin) -> None:
+    # Count, then rows: the behaviour before queries were run together
+    stmt = select(User).order_by(User.id).limit(11)
+    await model_admin.count()
+    await model_admin._run_query(stmt)
+
+
+async def concurrent_list(model_admin: ModelAdmin) -> None:
+    await model_admin.list(page=1, page_size=10)
+
+
+async def measure(
+    func: Callable[[ModelAdmin], Awaitable[None]],
+    model_admin: ModelAdmin,
+    requests: int,
+) -> List[float]:
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await func(model_admin)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(name: str, timings: List[float]) -> None:
+    timings = sorted(timings)
+    p50 = statistics.median(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"{name:<24} p50 {p50:8.2f} ms   p99 {p99:8.2f} ms")
+
+
+async def main(latency: float, requests: int) -> None:
+    sync_engine = create_engine(
+        "sqlite:///bench.db", connect_args={"check_same_thread": False}
+    )
+    async_engine = create_async_engine("sqlite+aiosqlite:///bench.db")
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def sync_delay(*args: Any) -> None:
+        time.sleep(latency / 1000)
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def async_delay(*args: Any) -> None:
+        await_only(asyncio.sleep(latency / 1000))
+
+    Base.metadata.drop_all(sync_engine)
+    Base.metadata.create_all(sync_engine)
+    with sync_engine.begin() as conn:
+        conn.execute(
+            User.__table__.insert(), [{"name": f"User {i}"} for i in range(1000)]
+        )
+
+    for engine in (async_engine, sync_engine):
+        admin = Admin(Starlette(), engine)
+        admin.register_model(UserAdmin)
+        model_admin = admin.model_admins[0]
+        kind = "async" if model_admin.async_engine else "sync"
+
+        report(
+            f"{kind} sequential", await measure(sequential_list, model_admin, requests)
+        )
+        report(
+            f"{kind} concurrent", await measure(concurrent_list, model_admin, requests)
+        )
+
+    Base.metadata.drop_all(sync_engine)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=5, help="milliseconds")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    anyio.run(main, args.latency, args.requests)
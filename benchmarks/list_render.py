@@ -0,0 +1,169 @@
+"""Render time of the rows of `list.html`, from row view-models
+and from ORM objects with `url_for` and attribute lookups per row.
+
+    python -m benchmarks.list_render --rows 10 100 500
+"""
+import argparse
+import timeit
+from typing import Any, Callable, Dict, List
+
+from jinja2 import Template
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+from starlette.applications import Starlette
+from starlette.requests import Request
+
+from sqladmin import Admin, ModelAdmin
+from sqladmin.pagination import PK_PLACEHOLDER, Pagination
+
+Base = declarative_base()  # type: Any
+
+# Rows of `list.html` before row view-models
+LEGACY_ROWS = """
+          {% for row in pagination.rows %}
+          {% set pk = model_admin.get_pk_value(row) %}
+          <tr>
+            <td><input class="form-check-input m-0 align-middle select-row" type="checkbox" value="{{ pk }}" aria-label="Select item"></td>
+            <td class="text-end">
+              {% if model_admin.can_view_details %}
+              <a href="{{ url_for('admin:details', identity=model_admin.identity, pk=pk) }}" data-bs-toggle="tooltip" data-bs-placement="top" title="View">
+                <span class="me-1"><i class="fas fa-eye"></i></span>
+              </a>
+              {% endif %}
+              {% if model_admin.can_edit %}
+              <a href="{{ url_for('admin:edit', identity=model_admin.identity, pk=pk) }}" data-bs-toggle="tooltip" data-bs-placement="top" title="Edit">
+                <span class="me-1"><i class="fas fa-edit"></i></span>
+              </a>
+              {% endif %}
+              {% if model_admin.can_delete %}
+              <a href="#" data-name="{{ model_admin.name }}" data-pk="{{ pk }}" data-url="{{ url_for('admin:delete', identity=model_admin.identity, pk=pk) }}" data-bs-toggle="modal" data-bs-target="#modal-delete" title="Delete">
+                <span class="me-1"><i class="fas fa-trash"></i></span>
+              </a>
+              {% endif %}
+            </td>
+            {% for column in model_admin.list_columns %}
+            <td>{{ model_admin.get_attr_value(row, column.prop) }}</td>
+            {% endfor %}
+          </tr>
+          {% endfor %}
+"""  # noqa: E501
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    email = Column(String)
+
+    addresses = relationship("Address")
+
+
+class Address(Base):
+    __tablename__ = "addresses"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+
+    def __str__(self) -> str:
+        return f"Address {self.id}"
+
+
+class UserAdmin(ModelAdmin, model=User):
+    column_list = [User.id, User.name, User.email, User.addresses]
+
+
+def make_request(app: Starlette) -> Request:
+    scope = {
+        "type": "http",
+        "app": app,
+        "router": app.router,
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "root_path": "",
+        "path": "/admin/user/list",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "path_params": {"identity": "user"},
+    }
+    return Request(scope)
+
+
+def make_rows(size: int) -> List[Any]:
+    return [
+        User(
+            id=i,
+            name=f"User {i}",
+            email=f"user{i}@example.com",
+            addresses=[Address(id=i * 2), Address(id=i * 2 + 1)],
+        )
+        for i in range(size)
+    ]
+
+
+def legacy_template(admin: Admin) -> Template:
+    env = admin.templates.env
+    source, _, _ = env.loader.get_source(env, "list.html")  # type: ignore
+    start = source.index("<tbody>") + len("<tbody>")
+    end = source.index("</tbody>")
+    return env.from_string(source[:start] + LEGACY_ROWS + source[end:])
+
+
+def render(
+    template: Template, context: Dict[str, Any], build_views: bool
+) -> Callable[[], None]:
+    request, model_admin = context["request"], context["model_admin"]
+    pagination = context["pagination"]
+
+    def run() -> None:
+        if build_views:
+            url_templates = {
+                name: request.url_for(
+                    f"admin:{name}", identity="user", pk=PK_PLACEHOLDER
+                )
+                for name in ("details", "edit", "delete")
+            }
+            pagination.row_views = model_admin.get_row_views(
+                pagination.rows, url_templates
+            )
+        template.render(context)
+
+    return run
+
+
+def report(name: str, func: Callable[[], None], number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{name:<32} {seconds * 1000:10.3f} ms")
+
+
+def main(sizes: List[int], number: int) -> None:
+    app = Starlette()
+    admin = Admin(app, create_engine("sqlite://"))
+    admin.register_model(UserAdmin)
+    model_admin = admin.model_admins[0]
+
+    legacy = legacy_template(admin)
+    current = admin.templates.get_template("list.html")
+
+    for size in sizes:
+        rows = make_rows(size)
+        pagination = Pagination(rows=rows, page=1, page_size=size, count=size)
+        context = {
+            "request": make_request(app),
+            "model_admin": model_admin,
+            "pagination": pagination,
+        }
+
+        report(f"{size} rows, ORM objects", render(legacy, context, False), number)
+        report(f"{size} rows, row view-models", render(current, context, True), number)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    main(args.rows, args.number)
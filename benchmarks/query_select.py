@@ -0,0 +1,94 @@
+"""Cost of resolving and validating submitted choices of QuerySelect fields.
+
+    python -m benchmarks.query_select --choices 10000 100000 --selected 1000
+"""
+import argparse
+import timeit
+from typing import Any, Callable, List, Tuple
+
+from sqlalchemy import Column, Integer
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import make_transient_to_detached
+from wtforms import Form
+
+from sqladmin.fields import QuerySelectField, QuerySelectMultipleField
+
+Base = declarative_base()  # type: Any
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+
+
+class DummyData(dict):
+    def getlist(self, key: str) -> List[str]:
+        return self[key]
+
+
+def make_object_list(size: int) -> List[Tuple[str, Any]]:
+    object_list = []
+    for i in range(size):
+        user = User(id=i)
+        make_transient_to_detached(user)
+        object_list.append((str(i), user))
+    return object_list
+
+
+def select_one(object_list: List[Tuple[str, Any]]) -> Callable[[], None]:
+    class F(Form):
+        user = QuerySelectField()
+
+    pk = str(len(object_list) - 1)
+
+    def run() -> None:
+        form = F(DummyData(user=[pk]))
+        form.user._object_list = object_list
+        assert form.validate()
+
+    return run
+
+
+def select_many(
+    object_list: List[Tuple[str, Any]], selected: int
+) -> Callable[[], None]:
+    class F(Form):
+        users = QuerySelectMultipleField()
+
+    step = max(len(object_list) // selected, 1)
+    pks = [pk for pk, _ in object_list[::step]][:selected]
+
+    def run() -> None:
+        form = F(DummyData(users=pks))
+        form.users._object_list = object_list
+        assert form.validate()
+        assert len(form.users.data) == len(pks)
+
+    return run
+
+
+def report(name: str, func: Callable[[], None], number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{name:<32} {seconds * 1000:10.3f} ms")
+
+
+def main(choices: List[int], selected: int, number: int) -> None:
+    for size in choices:
+        object_list = make_object_list(size)
+        report(f"{size} choices, select one", select_one(object_list), number)
+        report(
+            f"{size} choices, select {selected}",
+            select_many(object_list, selected),
+            number,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--choices", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--selected", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    main(args.choices, args.selected, args.number)
@@ -0,0 +1,119 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import inspect, or_, select
+from sqlalchemy.orm import RelationshipProperty, Session
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.selectable import Select
+
+from sqladmin.exceptions import InvalidColumnError, InvalidCursorError
+from sqladmin.pagination import Cursor
+
+__all__ = [
+    "QueryAjaxModelLoader",
+]
+
+
+class QueryAjaxModelLoader:
+    """Search and page the related objects of a relationship field.
+
+    Objects are matched when any of `fields` starts with the search term,
+    case insensitive, and are paged by primary key.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        prop: RelationshipProperty,
+        fields: Sequence[Union[str, InstrumentedAttribute]],
+        page_size: int = 10,
+    ) -> None:
+        self.name = name
+        self.model = prop.mapper.class_
+        self.page_size = page_size
+
+        mapper = prop.mapper
+        self.pk: InstrumentedAttribute = getattr(
+            self.model, mapper.get_property_by_column(mapper.primary_key[0]).key
+        )
+
+        assert fields, f"No search fields for '{name}' in form_ajax_refs."
+        self.fields = [self._get_field(field) for field in fields]
+
+    def _get_field(
+        self, field: Union[str, InstrumentedAttribute]
+    ) -> InstrumentedAttribute:
+        key = field if isinstance(field, str) else field.key
+        if key not in inspect(self.model).column_attrs:
+            raise InvalidColumnError(
+                f"Model '{self.model.__name__}' has no column '{key}'."
+            )
+
+        return getattr(self.model, key)
+
+    def get_pk(self, obj: Any) -> str:
+        return str(getattr(obj, self.pk.key))
+
+    def format(self, obj: Any) -> Dict[str, str]:
+        return {"id": self.get_pk(obj), "text": str(obj)}
+
+    def get_list_query(self, term: str, cursor: Optional[Cursor]) -> Select:
+        stmt = select(self.model).order_by(self.pk).limit(self.page_size + 1)
+
+        if term:
+            pattern = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            stmt = stmt.where(
+                or_(*[f.ilike(f"{pattern}%", escape="\\") for f in self.fields])
+            )
+
+        if cursor is not None:
+            try:
+                (value,) = cursor.values
+                stmt = stmt.where(self.pk > self._coerce_pk(value))
+            except (TypeError, ValueError):
+                raise InvalidCursorError("Invalid pagination cursor.")
+
+        return stmt
+
+    def get_list(
+        self, session: Session, term: str, cursor: Optional[Cursor] = None
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        stmt = self.get_list_query(term, cursor)
+        objects = session.execute(stmt).scalars().all()
+
+        next_cursor = None
+        if len(objects) > self.page_size:
+            objects = objects[: self.page_size]
+            page = cursor.page + 1 if cursor else 2
+            last = getattr(objects[-1], self.pk.key)
+            next_cursor = Cursor(page, [last]).encode()
+
+        return [self.format(obj) for obj in objects], next_cursor
+
+    def get_objects(
+        self, session: Session, pks: Sequence[str]
+    ) -> List[Tuple[str, Any]]:
+        """Load the objects of the submitted primary keys."""
+
+        values = []
+        for pk in pks:
+            try:
+                values.append(self._coerce_pk(pk))
+            except (TypeError, ValueError):
+                continue
+
+        if not values:
+            return []
+
+        stmt = select(self.model).where(self.pk.in_(values))
+        return [(self.get_pk(obj), obj) for obj in session.execute(stmt).scalars()]
+
+    def _coerce_pk(self, value: Any) -> Any:
+        try:
+            python_type = self.pk.type.python_type
+        except NotImplementedError:  # pragma: no cover
+            return value
+
+        if isinstance(value, python_type):
+            return value
+
+        return python_type(value)
@@ -1,16 +1,44 @@
-from typing import TYPE_CHECKING, List, Type, Union
-
-from jinja2 import ChoiceLoader, FileSystemLoader, PackageLoader
-from sqlalchemy.engine import Engine
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+from urllib.parse import urlencode
+
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    PackageLoader,
+    pass_context,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 from starlette.applications import Starlette
+from starlette.datastructures import UploadFile
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from starlette.responses import RedirectResponse, Response
+from starlette.responses import (
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.routing import Mount, Route
-from starlette.staticfiles import StaticFiles
 from starlette.templating import Jinja2Templates
+from wtforms import Form
+
+from sqladmin.assets import StaticAssets
+from sqladmin.caching import ListCache
+from sqladmin.exceptions import (
+    InvalidCursorError,
+    InvalidFilterError,
+    InvalidModelError,
+)
+from sqladmin.pagination import PK_PLACEHOLDER
+from sqladmin.workers import WorkerPool, WorkerStats
 
 if TYPE_CHECKING:
     from sqladmin.models import ModelAdmin
@@ -18,9 +46,45 @@ if TYPE_CHECKING:
 
 __all__ = [
     "Admin",
+    "PoolStats",
 ]
 
 
+@dataclass(frozen=True)
+class PoolStats:
+    """Connection pool usage of the Admin engine.
+
+    Counters the pool class does not keep, like `overflow`
+    of a `NullPool`, are `None`.
+    """
+
+    size: Optional[int]
+    checked_in: Optional[int]
+    checked_out: Optional[int]
+    overflow: Optional[int]
+
+
+def _etag_headers(etag: Optional[str]) -> Dict[str, str]:
+    if etag is None:
+        return {}
+    # Pages depend on the user, browsers revalidate them on every visit
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+
+    # Weak comparison, as required for If-None-Match
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == opaque_tag:
+            return True
+    return False
+
+
 class BaseAdmin:
     """Base class for implementing Admin interface.
 
@@ -35,23 +99,74 @@ class BaseAdmin:
         base_url: str = "/admin",
         title: str = "Admin",
         logo_url: str = None,
+        session_options: Optional[Dict[str, Any]] = None,
+        pool_pre_ping: bool = False,
+        statement_timeout: Optional[float] = None,
+        sync_worker_limit: Optional[int] = None,
+        production: bool = False,
+        templates_cache_dir: Optional[str] = None,
+        compiled_templates: Optional[str] = None,
+        list_cache: Optional[ListCache] = None,
     ) -> None:
         self.app = app
         self.engine = engine
         self.base_url = base_url
-        self._model_admins: List["ModelAdmin"] = []
-
-        self.templates = Jinja2Templates("templates")
-        self.templates.env.loader = ChoiceLoader(
-            [
-                FileSystemLoader("templates"),
-                PackageLoader("sqladmin", "templates"),
-            ]
+        self.statement_timeout = statement_timeout
+        self.list_cache = list_cache
+        self._model_admins: Dict[str, "ModelAdmin"] = {}
+
+        bind = engine
+        if pool_pre_ping:
+            # Sessions connect through an engine sharing the pool,
+            # its events do not apply to the connections of the application
+            bind = engine.execution_options()
+            sync_bind = bind.sync_engine if isinstance(bind, AsyncEngine) else bind
+            event.listen(sync_bind, "engine_connect", self._ping_connection)
+
+        # One session factory shared by all ModelAdmins of this Admin
+        self.session_class: Type[Session] = type("AdminSession", (Session,), {})
+        options = {"expire_on_commit": False, **(session_options or {})}
+        if isinstance(bind, Engine):
+            self.sessionmaker = sessionmaker(
+                bind=bind, class_=self.session_class, **options
+            )
+        else:
+            self.sessionmaker = sessionmaker(
+                bind=bind,
+                class_=AsyncSession,
+                sync_session_class=self.session_class,
+                **options,
+            )
+
+        if statement_timeout is not None:
+            assert self._sync_engine.dialect.name == "postgresql", (
+                "statement_timeout is only supported for PostgreSQL, "
+                f"not '{self._sync_engine.dialect.name}'."
+            )
+            event.listen(self.session_class, "after_begin", self._set_timeout)
+
+        # Worker threads apart from the application, for sync engines
+        self.workers = WorkerPool.for_engine(self._sync_engine, sync_worker_limit)
+
+        bundled: BaseLoader = PackageLoader("sqladmin", "templates")
+        if compiled_templates is not None:
+            bundled = ModuleLoader(compiled_templates)
+
+        env_options: Dict[str, Any] = {}
+        if production:
+            # Templates are not checked for changes and compiled once per machine
+            env_options["auto_reload"] = False
+            env_options["bytecode_cache"] = FileSystemBytecodeCache(templates_cache_dir)
+
+        self.templates = Jinja2Templates(
+            "templates",
+            loader=ChoiceLoader([FileSystemLoader("templates"), bundled]),
+            **env_options,
         )
         self.templates.env.globals["min"] = min
         self.templates.env.globals["admin_title"] = title
         self.templates.env.globals["admin_logo_url"] = logo_url
-        self.templates.env.globals["model_admins"] = self.model_admins
+        self.templates.env.globals["model_admins"] = self._model_admins.values()
 
     @property
     def model_admins(self) -> List["ModelAdmin"]:
@@ -61,14 +176,66 @@ class BaseAdmin:
             List of ModelAdmin classes registered in Admin.
         """
 
-        return self._model_admins
+        return list(self._model_admins.values())
 
-    def _find_model_admin(self, identity: str) -> "ModelAdmin":
-        for model_admin in self.model_admins:
-            if model_admin.identity == identity:
-                return model_admin
+    @property
+    def _sync_engine(self) -> Engine:
+        if isinstance(self.engine, AsyncEngine):
+            return self.engine.sync_engine
+        return self.engine
+
+    def _set_timeout(
+        self, session: Session, transaction: Any, conn: Connection
+    ) -> None:
+        # Scoped to the transaction, other users of the engine are not affected
+        assert self.statement_timeout is not None
+        timeout = int(self.statement_timeout * 1000)
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout}")
+
+    def _ping_connection(self, connection: Connection, branch: bool) -> None:
+        if branch:
+            return
 
-        raise HTTPException(status_code=404)
+        try:
+            self._sync_engine.dialect.do_ping(connection.connection)
+        except Exception:
+            # The connection checks out another one from the pool on first use
+            connection.invalidate()
+
+    def pool_stats(self) -> PoolStats:
+        """Get connection pool usage of the engine.
+
+        Returns:
+            Pool size, idle and checked out connections and overflow.
+        """
+
+        pool = self._sync_engine.pool
+
+        def get(name: str) -> Optional[int]:
+            method = getattr(pool, name, None)
+            return method() if callable(method) else None
+
+        return PoolStats(
+            size=get("size"),
+            checked_in=get("checkedin"),
+            checked_out=get("checkedout"),
+            overflow=get("overflow"),
+        )
+
+    def worker_stats(self) -> WorkerStats:
+        """Get usage of the worker threads running queries of sync engines.
+
+        Returns:
+            Thread limit, busy threads, queued calls and queue wait times.
+        """
+
+        return self.workers.stats()
+
+    def _find_model_admin(self, identity: str) -> "ModelAdmin":
+        try:
+            return self._model_admins[identity]
+        except KeyError:
+            raise HTTPException(status_code=404)
 
     def register_model(self, model: Type["ModelAdmin"]) -> None:
         """Register ModelAdmin to the Admin.
@@ -76,6 +243,10 @@ class BaseAdmin:
         Args:
             model: ModelAdmin class to register in Admin.
 
+        Raises:
+            InvalidModelError: Another ModelAdmin has the same identity.
+            AssertionError: `search_backend` does not support the database.
+
         ???+ usage
             ```python
             from sqladmin import Admin, ModelAdmin
@@ -87,44 +258,58 @@ class BaseAdmin:
             ```
         """
 
-        # Set database engine from Admin instance
+        if model.identity in self._model_admins:
+            raise InvalidModelError(
+                f"ModelAdmin with identity '{model.identity}' is already registered."
+            )
+
+        # Set database engine and sessions from Admin instance
         model.engine = self.engine
-        if isinstance(model.engine, Engine):
-            model.sessionmaker = sessionmaker(bind=model.engine, class_=Session)
-            model.async_engine = False
-        else:
-            model.sessionmaker = sessionmaker(bind=model.engine, class_=AsyncSession)
-            model.async_engine = True
+        model.sessionmaker = self.sessionmaker
+        model.workers = self.workers
+        model.list_cache = self.list_cache
+        model.async_engine = isinstance(self.engine, AsyncEngine)
 
-        self._model_admins.append((model()))
+        model_admin = model()
+        model_admin.search_backend.validate(model_admin)
+        self._model_admins[model.identity] = model_admin
 
 
 class BaseAdminView(BaseAdmin):
-    async def _list(self, request: Request) -> None:
-        model_admin = self._find_model_admin(request.path_params["identity"])
+    async def _list(self, request: Request, model_admin: "ModelAdmin") -> None:
         if not model_admin.is_accessible(request):
             raise HTTPException(status_code=403)
 
-    async def _create(self, request: Request) -> None:
-        model_admin = self._find_model_admin(request.path_params["identity"])
+    async def _create(self, request: Request, model_admin: "ModelAdmin") -> None:
         if not model_admin.can_create or not model_admin.is_accessible(request):
             raise HTTPException(status_code=403)
 
-    async def _details(self, request: Request) -> None:
-        model_admin = self._find_model_admin(request.path_params["identity"])
+    async def _details(self, request: Request, model_admin: "ModelAdmin") -> None:
         if not model_admin.can_view_details or not model_admin.is_accessible(request):
             raise HTTPException(status_code=403)
 
-    async def _delete(self, request: Request) -> None:
-        model_admin = self._find_model_admin(request.path_params["identity"])
+    async def _delete(self, request: Request, model_admin: "ModelAdmin") -> None:
         if not model_admin.can_delete or not model_admin.is_accessible(request):
             raise HTTPException(status_code=403)
 
-    async def _edit(self, request: Request) -> None:
-        model_admin = self._find_model_admin(request.path_params["identity"])
+    async def _edit(self, request: Request, model_admin: "ModelAdmin") -> None:
         if not model_admin.can_edit or not model_admin.is_accessible(request):
             raise HTTPException(status_code=403)
 
+    async def _import(self, request: Request, model_admin: "ModelAdmin") -> None:
+        can_import = model_admin.can_import and model_admin.can_create
+        if not can_import or not model_admin.is_accessible(request):
+            raise HTTPException(status_code=403)
+
+    async def _export(self, request: Request, model_admin: "ModelAdmin") -> None:
+        if not model_admin.can_export or not model_admin.is_accessible(request):
+            raise HTTPException(status_code=403)
+
+    async def _lookup(self, request: Request, model_admin: "ModelAdmin") -> None:
+        can_use_forms = model_admin.can_create or model_admin.can_edit
+        if not can_use_forms or not model_admin.is_accessible(request):
+            raise HTTPException(status_code=403)
+
 
 class Admin(BaseAdminView):
     """Main entrypoint to admin interface.
@@ -156,6 +341,14 @@ class Admin(BaseAdminView):
         base_url: str = "/admin",
         title: str = "Admin",
         logo_url: str = None,
+        session_options: Optional[Dict[str, Any]] = None,
+        pool_pre_ping: bool = False,
+        statement_timeout: Optional[float] = None,
+        sync_worker_limit: Optional[int] = None,
+        production: bool = False,
+        templates_cache_dir: Optional[str] = None,
+        compiled_templates: Optional[str] = None,
+        list_cache: Optional[ListCache] = None,
     ) -> None:
         """
         Args:
@@ -164,14 +357,51 @@ class Admin(BaseAdminView):
             base_url: Base URL for Admin interface.
             title: Admin title.
             logo_url: URL of logo to be displayed instead of title.
+            session_options: Arguments of the `sessionmaker` shared by all
+                ModelAdmins, like `autoflush`. `expire_on_commit` is `False`
+                unless set.
+            pool_pre_ping: Test the connections of admin sessions
+                when they are checked out of the pool and replace the stale ones.
+            statement_timeout: Timeout of every statement in seconds,
+                PostgreSQL only.
+            sync_worker_limit: Number of worker threads running queries
+                of a sync engine. Default is the number of connections
+                the engine pool can open.
+            production: Do not check templates for changes and cache
+                compiled templates on disk.
+            templates_cache_dir: Directory of compiled templates cache
+                in production, default is a temporary directory.
+            compiled_templates: Directory of the bundled templates compiled
+                with `python -m sqladmin.templating <directory>`.
+            list_cache: Cache of `List` page results, invalidated
+                by changes made through the admin.
         """
 
         assert isinstance(engine, (Engine, AsyncEngine))
         super().__init__(
-            app=app, engine=engine, base_url=base_url, title=title, logo_url=logo_url
+            app=app,
+            engine=engine,
+            base_url=base_url,
+            title=title,
+            logo_url=logo_url,
+            session_options=session_options,
+            pool_pre_ping=pool_pre_ping,
+            statement_timeout=statement_timeout,
+            sync_worker_limit=sync_worker_limit,
+            production=production,
+            templates_cache_dir=templates_cache_dir,
+            compiled_templates=compiled_templates,
+            list_cache=list_cache,
         )
 
-        statics = StaticFiles(packages=["sqladmin"])
+        statics = StaticAssets(packages=["sqladmin"])
+
+        @pass_context
+        def static_url(context: Dict[str, Any], path: str) -> str:
+            request = context["request"]
+            return request.url_for("admin:statics", path=statics.fingerprint(path))
+
+        self.templates.env.globals["static_url"] = static_url
 
         def http_exception(request: Request, exc: Exception) -> Response:
             assert isinstance(exc, HTTPException)
@@ -189,6 +419,7 @@ class Admin(BaseAdminView):
                 Mount("/statics", app=statics, name="statics"),
                 Route("/", endpoint=self.index, name="index"),
                 Route("/{identity}/list", endpoint=self.list, name="list"),
+                Route("/{identity}/export", endpoint=self.export, name="export"),
                 Route(
                     "/{identity}/details/{pk}", endpoint=self.details, name="details"
                 ),
@@ -198,6 +429,12 @@ class Admin(BaseAdminView):
                     name="delete",
                     methods=["DELETE"],
                 ),
+                Route(
+                    "/{identity}/delete",
+                    endpoint=self.bulk_delete,
+                    name="bulk_delete",
+                    methods=["DELETE"],
+                ),
                 Route(
                     "/{identity}/create",
                     endpoint=self.create,
@@ -210,6 +447,15 @@ class Admin(BaseAdminView):
                     name="edit",
                     methods=["GET", "POST"],
                 ),
+                Route(
+                    "/{identity}/lookup/{field}", endpoint=self.lookup, name="lookup"
+                ),
+                Route(
+                    "/{identity}/import",
+                    endpoint=self.import_csv,
+                    name="import",
+                    methods=["GET", "POST"],
+                ),
             ],
             exception_handlers={HTTPException: http_exception},
         )
@@ -221,34 +467,104 @@ class Admin(BaseAdminView):
         return self.templates.TemplateResponse("index.html", {"request": request})
 
     async def list(self, request: Request) -> Response:
-        """List route to display paginated Model instances."""
-
-        await self._list(request)
+        """List route to display paginated Model instances,
+        filtered by the search term of the `q` parameter and `column_filters`.
+        """
 
         model_admin = self._find_model_admin(request.path_params["identity"])
+        await self._list(request, model_admin)
 
         page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("page_size", 0))
+        cursor = request.query_params.get("cursor")
+        search = request.query_params.get("q", "").strip()
+
+        try:
+            filters = model_admin.get_filter_values(request.query_params)
+            etag, count = await model_admin._get_list_etag(
+                page, page_size, cursor, search, filters
+            )
+            if etag is not None and _etag_matches(request, etag):
+                return Response(status_code=304, headers=_etag_headers(etag))
+
+            # Counted once for the ETag and the page
+            pagination = await model_admin.list(
+                page,
+                page_size,
+                cursor=cursor,
+                search=search,
+                filters=filters,
+                count=count,
+            )
+        except (InvalidCursorError, InvalidFilterError):
+            raise HTTPException(status_code=400)
 
-        pagination = await model_admin.list(page, page_size)
         pagination.add_pagination_urls(request.url)
 
+        # Row URLs are built from one URL per action instead of per row
+        identity = model_admin.identity
+        url_templates = {
+            name: request.url_for(f"admin:{name}", identity=identity, pk=PK_PLACEHOLDER)
+            for name in ("details", "edit", "delete")
+        }
+        pagination.row_views = model_admin.get_row_views(pagination.rows, url_templates)
+
+        # Search and filters of the page, kept by the export links
+        params = [(name, v) for name, values in filters.items() for v in values]
+        if search:
+            params.insert(0, ("q", search))
+
         context = {
             "request": request,
             "model_admin": model_admin,
             "pagination": pagination,
+            "search": search,
+            "filters": filters,
+            "list_query": urlencode(params),
         }
 
-        return self.templates.TemplateResponse(model_admin.list_template, context)
+        return self.templates.TemplateResponse(
+            model_admin.list_template, context, headers=_etag_headers(etag)
+        )
+
+    async def export(self, request: Request) -> Response:
+        """Export route streaming all rows of `List` page as CSV or JSON Lines."""
+
+        identity = request.path_params["identity"]
+        model_admin = self._find_model_admin(identity)
+        await self._export(request, model_admin)
+
+        export_type = request.query_params.get("format", "csv")
+        if export_type not in model_admin.export_types:
+            raise HTTPException(status_code=400)
+
+        media_types = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+        filename = f"{identity}.{export_type}"
+        search = request.query_params.get("q", "").strip()
+
+        try:
+            filters = model_admin.get_filter_values(request.query_params)
+        except InvalidFilterError:
+            raise HTTPException(status_code=400)
+
+        return StreamingResponse(
+            model_admin.export(export_type, search=search, filters=filters),
+            media_type=media_types[export_type],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
 
     async def details(self, request: Request) -> Response:
         """Details route."""
 
-        await self._details(request)
-
         model_admin = self._find_model_admin(request.path_params["identity"])
+        await self._details(request, model_admin)
+
+        pk = request.path_params["pk"]
+        etag = await model_admin.get_details_etag(pk)
+        if etag is not None and _etag_matches(request, etag):
+            return Response(status_code=304, headers=_etag_headers(etag))
 
-        model = await model_admin.get_model_by_pk(request.path_params["pk"])
+        model = await model_admin.get_details_model(pk)
         if not model:
             raise HTTPException(status_code=404)
 
@@ -259,34 +575,54 @@ class Admin(BaseAdminView):
             "title": model_admin.name,
         }
 
-        return self.templates.TemplateResponse(model_admin.details_template, context)
+        return self.templates.TemplateResponse(
+            model_admin.details_template, context, headers=_etag_headers(etag)
+        )
 
     async def delete(self, request: Request) -> Response:
         """Delete route."""
 
-        await self._delete(request)
-
         identity = request.path_params["identity"]
         model_admin = self._find_model_admin(identity)
+        await self._delete(request, model_admin)
 
-        model = await model_admin.get_model_by_pk(request.path_params["pk"])
-        if not model:
+        # Deleted in one transaction without loading the row first,
+        # unless delete_model is overridden
+        try:
+            deleted = await model_admin.delete_models([request.path_params["pk"]])
+        except ValueError:
+            deleted = 0
+
+        if not deleted:
             raise HTTPException(status_code=404)
 
-        await model_admin.delete_model(model)
+        return Response(content=request.url_for("admin:list", identity=identity))
+
+    async def bulk_delete(self, request: Request) -> Response:
+        """Bulk delete route, primary keys are sent as `pks` form values."""
+
+        identity = request.path_params["identity"]
+        model_admin = self._find_model_admin(identity)
+        await self._delete(request, model_admin)
+
+        form = await request.form()
+        try:
+            await model_admin.delete_models(form.getlist("pks"))
+        except ValueError:
+            raise HTTPException(status_code=400)
 
         return Response(content=request.url_for("admin:list", identity=identity))
 
     async def create(self, request: Request) -> Response:
         """Create model endpoint."""
 
-        await self._create(request)
-
         identity = request.path_params["identity"]
         model_admin = self._find_model_admin(identity)
+        await self._create(request, model_admin)
 
         Form = await model_admin.scaffold_form()
         form = Form(await request.form())
+        await self._load_form_choices(request, model_admin, form)
 
         context = {
             "request": request,
@@ -315,14 +651,9 @@ class Admin(BaseAdminView):
     async def edit(self, request: Request) -> Response:
         """Edit model endpoint."""
 
-        await self._edit(request)
-
         identity = request.path_params["identity"]
         model_admin = self._find_model_admin(identity)
-
-        model = await model_admin.get_model_by_pk(request.path_params["pk"])
-        if not model:
-            raise HTTPException(status_code=404)
+        await self._edit(request, model_admin)
 
         Form = await model_admin.scaffold_form()
         context = {
@@ -331,20 +662,94 @@ class Admin(BaseAdminView):
         }
 
         if request.method == "GET":
-            context["form"] = Form(obj=model)
+            model = await model_admin.get_model_by_pk(request.path_params["pk"])
+            if not model:
+                raise HTTPException(status_code=404)
+
+            form = Form(obj=model)
+            await self._load_form_choices(request, model_admin, form)
+            context["form"] = form
             return self.templates.TemplateResponse(model_admin.edit_template, context)
 
         form = Form(await request.form())
+        await self._load_form_choices(request, model_admin, form)
         if not form.validate():
+            if not await model_admin.get_model_by_pk(request.path_params["pk"]):
+                raise HTTPException(status_code=404)
+
             return self.templates.TemplateResponse(
                 model_admin.edit_template,
                 context,
                 status_code=400,
             )
 
-        await model_admin.update_model(pk=request.path_params["pk"], data=form.data)
+        # The row is loaded, if at all, in the transaction updating it
+        try:
+            await model_admin.update_model(pk=request.path_params["pk"], data=form.data)
+        except NoResultFound:
+            raise HTTPException(status_code=404)
 
         return RedirectResponse(
             request.url_for("admin:list", identity=identity),
             status_code=302,
         )
+
+    async def import_csv(self, request: Request) -> Response:
+        """Import route inserting the rows of an uploaded CSV file."""
+
+        model_admin = self._find_model_admin(request.path_params["identity"])
+        await self._import(request, model_admin)
+
+        context = {
+            "request": request,
+            "model_admin": model_admin,
+        }
+
+        if request.method == "GET":
+            return self.templates.TemplateResponse(model_admin.import_template, context)
+
+        form = await request.form()
+        upload = form.get("file")
+
+        try:
+            if not isinstance(upload, UploadFile):
+                raise ValueError("No CSV file uploaded.")
+            context["report"] = await model_admin.import_csv(upload.file)
+        except ValueError as exc:
+            context["error"] = str(exc)
+            return self.templates.TemplateResponse(
+                model_admin.import_template, context, status_code=400
+            )
+
+        return self.templates.TemplateResponse(model_admin.import_template, context)
+
+    async def lookup(self, request: Request) -> Response:
+        """Lookup route searching related objects of `form_ajax_refs` fields."""
+
+        model_admin = self._find_model_admin(request.path_params["identity"])
+        await self._lookup(request, model_admin)
+
+        name = request.path_params["field"]
+        if name not in model_admin.form_ajax_refs:
+            raise HTTPException(status_code=404)
+
+        term = request.query_params.get("q", "")
+        cursor = request.query_params.get("cursor")
+
+        try:
+            results, next_cursor = await model_admin.lookup(name, term, cursor)
+        except InvalidCursorError:
+            raise HTTPException(status_code=400)
+
+        return JSONResponse({"results": results, "next_cursor": next_cursor})
+
+    async def _load_form_choices(
+        self, request: Request, model_admin: "ModelAdmin", form: Form
+    ) -> None:
+        await model_admin.load_form_choices(form)
+
+        for name in model_admin.form_ajax_refs:
+            if name in form:
+                form[name].lookup_url = request.url_for(
+                    "admin:lookup", identity=model_admin.identity, field=name
+                )
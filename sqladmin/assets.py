@@ -0,0 +1,227 @@
+"""Static files with content hashed URLs and precompressed variants.
+
+Compress the bundled static files before building the package:
+
+    python -m sqladmin.assets
+"""
+import argparse
+import gzip
+import hashlib
+import io
+import os
+import posixpath
+import re
+from mimetypes import guess_type
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+__all__ = [
+    "StaticAssets",
+    "compress_directory",
+]
+
+# Fingerprinted URLs never change content, clients keep them for a year
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Preferred first, served when the client accepts them
+ENCODINGS: List[Tuple[str, str]] = [("br", ".br"), ("gzip", ".gz")]
+
+COMPRESSIBLE = {".css", ".js", ".json", ".map", ".svg", ".txt", ".html"}
+
+FINGERPRINT = re.compile(r"^(?P<name>.+)\.(?P<digest>[0-9a-f]{12})(?P<ext>\.[^./]+)$")
+
+
+class StaticAssets(StaticFiles):
+    """`StaticFiles` serving fingerprinted paths and precompressed files.
+
+    `fingerprint("js/main.js")` returns `js/main.<hash>.js`, which is
+    served from `js/main.js` with `Cache-Control: immutable`.
+    A `.br` or `.gz` file next to the requested one is served instead
+    when the client accepts that encoding.
+
+    Files are hashed when the instance is created,
+    files added later are served without a fingerprint.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Hashed once, static files do not change while running
+        self._digests = self._hash_directories()
+
+    def fingerprint(self, path: str) -> str:
+        """Add the content hash of `path` before its extension."""
+
+        digest = self._get_digest(path)
+        if digest is None:
+            return path
+
+        name, ext = posixpath.splitext(path)
+        return f"{name}.{digest}{ext}"
+
+    def _get_digest(self, path: str) -> Optional[str]:
+        return self._digests.get(os.path.normpath(path))
+
+    def _hash_directories(self) -> Dict[str, str]:
+        digests: Dict[str, str] = {}
+        compressed = tuple(suffix for _, suffix in ENCODINGS)
+
+        # Earlier directories take precedence, as in lookup_path
+        for directory in reversed(self.all_directories):
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    if name.endswith(compressed):
+                        continue
+
+                    full_path = os.path.join(root, name)
+                    with open(full_path, "rb") as file:
+                        digest = hashlib.sha256(file.read()).hexdigest()[:12]
+                    digests[os.path.relpath(full_path, directory)] = digest
+
+        return digests
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        immutable = False
+
+        match = FINGERPRINT.match(path)
+        if match:
+            path = match["name"] + match["ext"]
+            # Outdated hashes get the current file, but not for a year
+            immutable = self._get_digest(path) == match["digest"]
+
+        response = await super().get_response(path, scope)
+        if immutable:
+            response.headers["cache-control"] = IMMUTABLE
+
+        return response
+
+    def file_response(
+        self,
+        full_path: Union[str, "os.PathLike[str]"],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        accepted = _get_accepted_encodings(request_headers.get("accept-encoding", ""))
+        media_type = guess_type(str(full_path))[0] or "text/plain"
+
+        response = None
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+
+            compressed = f"{full_path}{suffix}"
+            try:
+                compressed_stat = os.stat(compressed)
+            except FileNotFoundError:
+                continue
+
+            # Compressed files older than the original are out of date
+            if compressed_stat.st_mtime < stat_result.st_mtime:
+                continue
+
+            response = FileResponse(
+                compressed,
+                status_code=status_code,
+                stat_result=compressed_stat,
+                method=scope["method"],
+                media_type=media_type,
+            )
+            response.headers["content-encoding"] = encoding
+            break
+
+        if response is None:
+            response = FileResponse(
+                full_path,
+                status_code=status_code,
+                stat_result=stat_result,
+                method=scope["method"],
+                media_type=media_type,
+            )
+
+        response.headers["vary"] = "Accept-Encoding"
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def _get_accepted_encodings(header: str) -> Set[str]:
+    accepted = set()
+    for item in header.split(","):
+        encoding, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        if quality > 0:
+            accepted.add(encoding.strip().lower())
+
+    return accepted
+
+
+def _gzip(data: bytes) -> bytes:
+    buffer = io.BytesIO()
+    # mtime=0 keeps builds reproducible
+    with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=9, mtime=0) as file:
+        file.write(data)
+    return buffer.getvalue()
+
+
+def compress_directory(directory: str) -> List[str]:
+    """Write `.gz` files, and `.br` files when `brotli` is installed,
+    next to the text files of `directory`.
+
+    Returns:
+        Paths of the written files.
+    """
+
+    written = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if os.path.splitext(name)[1] not in COMPRESSIBLE:
+                continue
+
+            path = os.path.join(root, name)
+            with open(path, "rb") as file:
+                data = file.read()
+
+            variants = [(".gz", _gzip(data))]
+            if brotli is not None:
+                variants.append((".br", brotli.compress(data)))
+
+            for suffix, compressed in variants:
+                if len(compressed) >= len(data):
+                    continue
+                with open(path + suffix, "wb") as file:
+                    file.write(compressed)
+                written.append(path + suffix)
+
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=os.path.join(os.path.dirname(__file__), "statics"),
+        help="directory of static files, the bundled ones by default",
+    )
+    args = parser.parse_args()
+
+    for path in compress_directory(args.directory):
+        print(path)
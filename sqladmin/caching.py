@@ -0,0 +1,177 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+__all__ = [
+    "ListCache",
+    "MemoryListCache",
+]
+
+
+class ListCache:
+    """Base class for caches of `List` page results.
+
+    Entries are tagged with the tables the page depends on:
+    the table of the model and the tables of its relationships.
+    Rows inserted, updated or deleted through the admin invalidate
+    every entry sharing a table with the changed model.
+
+    Values are the row count and the ORM objects of a page,
+    backends of shared caches have to pickle them.
+
+    Every invalidation bumps the generation of its tags. Pages are queried
+    after reading the generation of their tags and stored with it,
+    so a page queried before a change is not stored after its invalidation.
+    """
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def get_generation(self, tags: Iterable[str]) -> Any:
+        """Return a value that changes whenever any of `tags` is invalidated."""
+
+        raise NotImplementedError()  # pragma: no cover
+
+    async def set(
+        self, key: str, value: Any, tags: Iterable[str], generation: Any = None
+    ) -> None:
+        """Store `value` unless `generation` of `tags` is no longer current.
+
+        Without `generation` the value is stored unconditionally.
+        """
+
+        raise NotImplementedError()  # pragma: no cover
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """Remove the entries tagged with any of `tags`."""
+
+        raise NotImplementedError()  # pragma: no cover
+
+
+class _Entry(NamedTuple):
+    value: Any
+    tags: Set[str]
+    size: int
+    expires: float
+
+
+class MemoryListCache(ListCache):
+    """In-process cache of `List` page results.
+
+    Entries expire after `ttl` seconds. The least recently used entries
+    are evicted beyond `max_entries` entries or `max_bytes`
+    of estimated memory.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        max_entries: int = 1000,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._generations: Dict[str, int] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Estimated memory of the cached values in bytes."""
+
+        return self._size
+
+    async def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if entry.expires <= time.monotonic():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return entry.value
+
+    async def get_generation(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        with self._lock:
+            return self._get_generation(tags)
+
+    async def set(
+        self, key: str, value: Any, tags: Iterable[str], generation: Any = None
+    ) -> None:
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        tags = set(tags)
+        with self._lock:
+            # Invalidated while the page was queried
+            if generation is not None and self._get_generation(tags) != generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            entry = _Entry(value, tags, size, time.monotonic() + self.ttl)
+            self._entries[key] = entry
+            self._size += size
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+
+    def _get_generation(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(self._generations.get(tag, 0) for tag in sorted(tags))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+        for tag in entry.tags:
+            keys = self._tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+
+def _estimate_size(value: Any, depth: int = 6, seen: Optional[Set[int]] = None) -> int:
+    # Follows containers and object attributes, like loaded relationships.
+    # ORM state is skipped and shared objects are counted once
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if depth == 0 or isinstance(value, (str, bytes, int, float)):
+        return size
+
+    if isinstance(value, dict):
+        items: Iterable[Any] = [*value.keys(), *value.values()]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+    elif hasattr(value, "__dict__"):
+        size += sys.getsizeof(vars(value))
+        items = [v for k, v in vars(value).items() if not k.startswith("_sa_")]
+    else:
+        return size
+
+    return size + sum(_estimate_size(item, depth - 1, seen) for item in items)
@@ -0,0 +1,146 @@
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from sqladmin.models import ModelAdmin
+
+
+__all__ = [
+    "CachedCount",
+    "CountStrategy",
+    "EstimatedCount",
+    "ExactCount",
+    "NoCount",
+    "RowCount",
+]
+
+
+@dataclass
+class RowCount:
+    """Number of rows in `List` page.
+
+    `value` is `None` when the number of rows is not known.
+    """
+
+    value: Optional[int]
+    estimated: bool = False
+
+
+class CountStrategy:
+    """Base class for counting rows of `List` page.
+
+    Strategies run inside a worker thread or a greenlet
+    with a synchronous `Session` for both sync and async engines.
+    """
+
+    def count(self, session: Session, model_admin: "ModelAdmin") -> RowCount:
+        raise NotImplementedError()  # pragma: no cover
+
+    def invalidate(self, model_admin: "ModelAdmin") -> None:
+        """Called after rows of the model are inserted or deleted."""
+
+
+class ExactCount(CountStrategy):
+    """Count rows with `SELECT count(pk)` on every request.
+    This is the default strategy.
+    """
+
+    def count(self, session: Session, model_admin: "ModelAdmin") -> RowCount:
+        stmt = model_admin.get_count_query()
+        return RowCount(session.execute(stmt).scalar_one())
+
+
+class CachedCount(ExactCount):
+    """Exact count cached for `ttl` seconds.
+    The cache is invalidated when rows are inserted or deleted through the admin.
+    """
+
+    def __init__(self, ttl: float = 60) -> None:
+        self.ttl = ttl
+        self._cache: Dict[str, Tuple[float, int]] = {}
+
+    def count(self, session: Session, model_admin: "ModelAdmin") -> RowCount:
+        cached = self._cache.get(model_admin.identity)
+        if cached is not None and cached[0] > time.monotonic():
+            return RowCount(cached[1])
+
+        row_count = super().count(session, model_admin)
+        assert row_count.value is not None
+
+        self._cache[model_admin.identity] = (
+            time.monotonic() + self.ttl,
+            row_count.value,
+        )
+        return row_count
+
+    def invalidate(self, model_admin: "ModelAdmin") -> None:
+        self._cache.pop(model_admin.identity, None)
+
+
+class EstimatedCount(ExactCount):
+    """Read an estimated row count from the database statistics.
+
+    Supported on PostgreSQL (`pg_class.reltuples`), SQLite (`sqlite_stat1`)
+    and MySQL (`information_schema.tables`). Tables with less than `threshold`
+    estimated rows, or without statistics, are counted exactly.
+    """
+
+    def __init__(self, threshold: int = 10000) -> None:
+        self.threshold = threshold
+
+    def count(self, session: Session, model_admin: "ModelAdmin") -> RowCount:
+        estimate = self.estimate(session, model_admin)
+        if estimate is None or estimate < self.threshold:
+            return super().count(session, model_admin)
+
+        return RowCount(estimate, estimated=True)
+
+    def estimate(self, session: Session, model_admin: "ModelAdmin") -> Optional[int]:
+        dialect = session.get_bind().dialect
+        table = inspect(model_admin.model).local_table
+
+        try:
+            if dialect.name == "postgresql":
+                stmt = text(
+                    "SELECT reltuples FROM pg_class WHERE oid = CAST(:name AS regclass)"
+                )
+                name = dialect.identifier_preparer.format_table(table)
+                value = session.execute(stmt, {"name": name}).scalar()
+            elif dialect.name == "sqlite":
+                stmt = text("SELECT stat FROM sqlite_stat1 WHERE tbl = :name")
+                stats = session.execute(stmt, {"name": table.name}).scalars().all()
+                value = max((int(s.split()[0]) for s in stats), default=None)
+            elif dialect.name in ("mysql", "mariadb"):
+                stmt = text(
+                    "SELECT table_rows FROM information_schema.tables "
+                    "WHERE table_schema = COALESCE(:schema, DATABASE()) "
+                    "AND table_name = :name"
+                )
+                params = {"schema": table.schema, "name": table.name}
+                value = session.execute(stmt, params).scalar()
+            else:
+                return None
+        except DBAPIError:
+            # No statistics table, e.g. SQLite before running ANALYZE
+            session.rollback()
+            return None
+
+        if value is None or value < 0:
+            return None
+
+        return int(value)
+
+
+class NoCount(CountStrategy):
+    """Skip counting rows, `List` page will not show a total.
+    No query is made for the count, the next page is found
+    by fetching one extra row with the page.
+    """
+
+    def count(self, session: Session, model_admin: "ModelAdmin") -> RowCount:
+        return RowCount(None)
@@ -4,3 +4,11 @@ class InvalidModelError(Exception):
 
 class InvalidColumnError(Exception):
     pass
+
+
+class InvalidCursorError(Exception):
+    pass
+
+
+class InvalidFilterError(Exception):
+    pass
@@ -2,7 +2,17 @@ import datetime
 import json
 import operator
 import time
-from typing import Any, Callable, Generator, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from sqlalchemy import inspect
 from wtforms import Form, ValidationError, fields, widgets
@@ -10,7 +20,12 @@ from wtforms import Form, ValidationError, fields, widgets
 from sqladmin import widgets as sqladmin_widgets
 from sqladmin.helpers import as_str
 
+if TYPE_CHECKING:
+    from sqladmin.ajax import QueryAjaxModelLoader
+
 __all__ = [
+    "AjaxSelectField",
+    "AjaxSelectMultipleField",
     "DateField",
     "DateTimeField",
     "JSONField",
@@ -309,13 +324,32 @@ class QuerySelectField(fields.SelectFieldBase):
         self._data: Optional[tuple]
         self._formdata: Optional[Union[str, List[str]]]
 
+    @property
+    def _object_list(self) -> List[Tuple[str, Any]]:
+        return self.__object_list
+
+    @_object_list.setter
+    def _object_list(self, object_list: List[Tuple[str, Any]]) -> None:
+        # Index by primary key once, lookups would scan the list otherwise
+        self.__object_list = object_list
+        self._object_index: Dict[str, Any] = {}
+        for pk, obj in object_list:
+            self._object_index.setdefault(pk, obj)
+
+    def _is_choice(self, obj: Any) -> bool:
+        identity = inspect(obj).identity
+        if identity is not None:
+            return self._object_index.get(str(identity[0])) == obj
+
+        # Objects without identity can only be compared one by one
+        return any(obj == choice for _, choice in self._object_list)
+
     @property
     def data(self) -> Optional[tuple]:
         if self._formdata is not None:
-            for pk, obj in self._object_list:
-                if pk == self._formdata:
-                    self.data = obj
-                    break
+            obj = self._object_index.get(self._formdata)  # type: ignore
+            if obj is not None:
+                self.data = obj
         return self._data
 
     @data.setter
@@ -343,10 +377,7 @@ class QuerySelectField(fields.SelectFieldBase):
     def pre_validate(self, form: Form) -> None:
         data = self.data
         if data is not None:
-            for _, obj in self._object_list:
-                if data == obj:
-                    break
-            else:  # pragma: no cover
+            if not self._is_choice(data):  # pragma: no cover
                 raise ValidationError(self.gettext("Not a valid choice"))
         elif self._formdata or not self.allow_blank:
             raise ValidationError(self.gettext("Not a valid choice"))
@@ -391,14 +422,9 @@ class QuerySelectMultipleField(QuerySelectField):
     def data(self) -> Optional[tuple]:
         formdata = self._formdata
         if formdata is not None:
-            data = []
-            for pk, obj in self._object_list:
-                if not formdata:
-                    break
-                elif pk in formdata:
-                    formdata.remove(pk)
-                    data.append(obj)
-            if formdata:
+            index = self._object_index
+            data = [index[pk] for pk in formdata if pk in index]
+            if len(data) < len(formdata):
                 self._invalid_formdata = True
             self.data = data or self._data  # type: ignore
         return self._data
@@ -410,19 +436,66 @@ class QuerySelectMultipleField(QuerySelectField):
 
     def iter_choices(self) -> Generator[Tuple[str, Any, bool], None, None]:
         if self.data is not None:
-            primary_keys = [str(inspect(m).identity[0]) for m in self.data]
+            primary_keys = {str(inspect(m).identity[0]) for m in self.data}
             for pk, obj in self._object_list:
                 yield (pk, self.get_label(obj), pk in primary_keys)
 
     def process_formdata(self, valuelist: List[str]) -> None:
-        self._formdata = list(set(valuelist))
+        # Drop duplicates, keeping the submitted order
+        self._formdata = list(dict.fromkeys(valuelist))
 
     def pre_validate(self, form: Form) -> None:
+        # Resolving the submitted primary keys flags unknown ones
+        data = self.data
         if self._invalid_formdata:
             raise ValidationError(self.gettext("Not a valid choice"))
-        elif self.data:
-            pk_list = [x[0] for x in self._object_list]
-            for v in self.data:
+        elif data:
+            index = self._object_index
+            for v in data:
                 identity = inspect(v).identity
-                if identity and str(identity[0]) not in pk_list:  # pragma: no cover
+                if identity and str(identity[0]) not in index:  # pragma: no cover
                     raise ValidationError(self.gettext("Not a valid choice"))
+
+
+class AjaxSelectField(QuerySelectField):
+    """
+    QuerySelectField searching choices on demand from the lookup endpoint.
+    Only the selected object is loaded and rendered as an option.
+    """
+
+    widget = sqladmin_widgets.AjaxSelectWidget()
+
+    def __init__(
+        self, loader: "QueryAjaxModelLoader", label: str = None, **kwargs: Any
+    ) -> None:
+        super().__init__(label=label, **kwargs)
+        self.loader = loader
+        self.lookup_url = ""
+
+    @property
+    def selected_pks(self) -> List[str]:
+        """Primary keys submitted with the form."""
+
+        return [pk for pk in self.raw_data or [] if pk and pk != "__None"]
+
+
+class AjaxSelectMultipleField(QuerySelectMultipleField):
+    """
+    QuerySelectMultipleField searching choices on demand from the lookup endpoint.
+    Only the selected objects are loaded and rendered as options.
+    """
+
+    widget = sqladmin_widgets.AjaxSelectWidget(multiple=True)
+
+    def __init__(
+        self, loader: "QueryAjaxModelLoader", label: str = None, **kwargs: Any
+    ) -> None:
+        super().__init__(label=label, **kwargs)
+        self.loader = loader
+        self.lookup_url = ""
+
+    @property
+    def selected_pks(self) -> List[str]:
+        """Primary keys submitted with the form."""
+
+        return [pk for pk in self.raw_data or [] if pk]
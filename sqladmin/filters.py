@@ -0,0 +1,170 @@
+import datetime
+from typing import Any, ClassVar, List, Mapping, Sequence, Tuple
+
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer, Numeric, Time
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.elements import ClauseElement
+
+from sqladmin.exceptions import InvalidFilterError
+
+__all__ = [
+    "BooleanFilter",
+    "ColumnFilter",
+    "EqualFilter",
+    "InFilter",
+    "RangeFilter",
+    "get_column_filter",
+]
+
+# Values of query parameters by name
+FilterValues = Mapping[str, Sequence[str]]
+
+
+class ColumnFilter:
+    """Filter of `List` page on one column.
+
+    Values are read from query parameters named `<column>__<operation>`,
+    like `age__gte=18`. Nullable columns also have the `null` operation,
+    `true` matches `NULL` values and `false` the others.
+    """
+
+    operations: ClassVar[Tuple[str, ...]] = ("eq",)
+    input_type = "text"
+
+    def __init__(self, column: InstrumentedAttribute, label: str) -> None:
+        self.column = column
+        self.key = column.key
+        self.label = label
+        self.nullable = any(c.nullable for c in column.prop.columns)
+        self.choices: List[Tuple[str, str]] = []
+
+    def param(self, operation: str) -> str:
+        return f"{self.key}__{operation}"
+
+    @property
+    def params(self) -> List[str]:
+        operations = self.operations + (("null",) if self.nullable else ())
+        return [self.param(operation) for operation in operations]
+
+    def get_clauses(self, values: FilterValues) -> List[ClauseElement]:
+        """Predicates of the parameter `values`, empty values are ignored.
+
+        Raises:
+            InvalidFilterError: A value cannot be converted to the column type.
+        """
+
+        clauses: List[ClauseElement] = []
+        if self.nullable:
+            for value in [v for v in values.get(self.param("null"), []) if v][-1:]:
+                is_null = self._coerce_bool(value)
+                column = self.column
+                clauses.append(column.is_(None) if is_null else column.isnot(None))
+
+        for operation in self.operations:
+            operation_values = [v for v in values.get(self.param(operation), []) if v]
+            if operation_values:
+                clauses.append(self.get_clause(operation, operation_values))
+
+        return clauses
+
+    def get_clause(self, operation: str, values: Sequence[str]) -> ClauseElement:
+        # The last value wins, as with a single form field
+        return self.column == self.coerce(values[-1])
+
+    def coerce(self, value: str) -> Any:
+        try:
+            python_type = self.column.type.python_type
+        except NotImplementedError:  # pragma: no cover
+            return value
+
+        try:
+            if python_type in (datetime.datetime, datetime.date, datetime.time):
+                return python_type.fromisoformat(value)
+            return python_type(value)
+        except (TypeError, ValueError, ArithmeticError):
+            raise InvalidFilterError(f"Invalid value for filter '{self.key}'.")
+
+    def _coerce_bool(self, value: str) -> bool:
+        if value in ("true", "1"):
+            return True
+        elif value in ("false", "0"):
+            return False
+        raise InvalidFilterError(f"Invalid value for filter '{self.key}'.")
+
+
+class EqualFilter(ColumnFilter):
+    """Rows with the column equal to `<column>__eq`."""
+
+
+class BooleanFilter(ColumnFilter):
+    """Rows with the column equal to `<column>__eq`, `true` or `false`."""
+
+    input_type = "select"
+
+    def __init__(self, column: InstrumentedAttribute, label: str) -> None:
+        super().__init__(column, label)
+        self.choices = [("true", "Yes"), ("false", "No")]
+
+    def coerce(self, value: str) -> Any:
+        return self._coerce_bool(value)
+
+
+class RangeFilter(ColumnFilter):
+    """Rows with the column equal to `<column>__eq`,
+    or between `<column>__gte` and `<column>__lte` inclusive.
+    """
+
+    operations = ("eq", "gte", "lte")
+
+    def __init__(self, column: InstrumentedAttribute, label: str) -> None:
+        super().__init__(column, label)
+        if isinstance(column.type, DateTime):
+            self.input_type = "datetime-local"
+        elif isinstance(column.type, Date):
+            self.input_type = "date"
+        elif isinstance(column.type, Time):
+            self.input_type = "time"
+        else:
+            self.input_type = "number"
+
+    def get_clause(self, operation: str, values: Sequence[str]) -> ClauseElement:
+        if operation == "gte":
+            return self.column >= self.coerce(values[-1])
+        elif operation == "lte":
+            return self.column <= self.coerce(values[-1])
+        return super().get_clause(operation, values)
+
+
+class InFilter(ColumnFilter):
+    """Rows with the column equal to any of the `<column>__in` values,
+    for `Enum` columns.
+    """
+
+    operations = ("in",)
+    input_type = "select"
+
+    def __init__(self, column: InstrumentedAttribute, label: str) -> None:
+        super().__init__(column, label)
+        self.choices = [(value, value) for value in column.type.enums]
+
+    def get_clause(self, operation: str, values: Sequence[str]) -> ClauseElement:
+        return self.column.in_([self.coerce(value) for value in values])
+
+    def coerce(self, value: str) -> Any:
+        if value not in self.column.type.enums:
+            raise InvalidFilterError(f"Invalid value for filter '{self.key}'.")
+
+        enum_class = self.column.type.enum_class
+        return enum_class[value] if enum_class is not None else value
+
+
+def get_column_filter(column: InstrumentedAttribute, label: str) -> ColumnFilter:
+    """Filter matching the type of `column`."""
+
+    if isinstance(column.type, Boolean):
+        return BooleanFilter(column, label)
+    elif isinstance(column.type, Enum):
+        return InFilter(column, label)
+    elif isinstance(column.type, (Integer, Numeric, Float, Date, DateTime, Time)):
+        return RangeFilter(column, label)
+    return EqualFilter(column, label)
@@ -1,11 +1,18 @@
 import inspect
-from typing import Any, Callable, Dict, Sequence, Type, Union, no_type_check
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    no_type_check,
+)
 
-import anyio
-from sqlalchemy import inspect as sqlalchemy_inspect, select
-from sqlalchemy.engine import Engine
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
-from sqlalchemy.orm import ColumnProperty, Mapper, RelationshipProperty, Session
+from sqlalchemy import inspect as sqlalchemy_inspect
+from sqlalchemy.orm import ColumnProperty, Mapper, RelationshipProperty
 from sqlalchemy.sql.schema import Column
 from wtforms import (
     BooleanField,
@@ -22,7 +29,13 @@ from wtforms import (
 )
 from wtforms.fields.core import UnboundField
 
-from sqladmin.fields import QuerySelectField, QuerySelectMultipleField
+from sqladmin.ajax import QueryAjaxModelLoader
+from sqladmin.fields import (
+    AjaxSelectField,
+    AjaxSelectMultipleField,
+    QuerySelectField,
+    QuerySelectMultipleField,
+)
 
 
 @no_type_check
@@ -60,12 +73,13 @@ class ModelConverterBase:
             f"Could not find field converter for column {column.name} ({types[0]!r})."
         )
 
-    async def convert(
+    def convert(
         self,
         model: type,
         mapper: Mapper,
         prop: Union[ColumnProperty, RelationshipProperty],
-        engine: Union[Engine, AsyncEngine],
+        loader: Optional[QueryAjaxModelLoader] = None,
+        foreign_keys: bool = False,
     ) -> UnboundField:
         kwargs: Dict = {
             "validators": [],
@@ -81,7 +95,7 @@ class ModelConverterBase:
             assert len(prop.columns) == 1, "Multiple-column properties not supported"
             column = prop.columns[0]
 
-            if column.primary_key or column.foreign_keys:
+            if column.primary_key or column.foreign_keys and not foreign_keys:
                 return
 
             default = getattr(column, "default", None)
@@ -115,27 +129,12 @@ class ModelConverterBase:
 
             kwargs["allow_blank"] = nullable
 
-            pk = mapper.primary_key[0].name
-            stmt = select(prop.mapper.class_)
-
-            if isinstance(engine, Engine):
-                with Session(engine) as session:
-                    objects = await anyio.to_thread.run_sync(session.execute, stmt)
-                    object_list = [
-                        (str(self.get_pk(obj, pk)), obj)
-                        for obj in objects.scalars().all()
-                    ]
-                    kwargs["object_list"] = object_list
+            # Choices are loaded on every request by ModelAdmin.load_form_choices
+            if loader is not None:
+                kwargs["loader"] = loader
+                converter = self.converters[f"AJAX_{prop.direction.name}"]
             else:
-                async with AsyncSession(engine) as session:
-                    objects = await session.execute(stmt)
-                    object_list = [
-                        (str(self.get_pk(obj, pk)), obj)
-                        for obj in objects.scalars().all()
-                    ]
-                    kwargs["object_list"] = object_list
-
-            converter = self.converters[prop.direction.name]
+                converter = self.converters[prop.direction.name]
 
         assert converter is not None
 
@@ -143,9 +142,6 @@ class ModelConverterBase:
             model=model, mapper=mapper, prop=prop, column=column, field_args=kwargs
         )
 
-    def get_pk(self, o: Any, pk_name: str) -> Any:
-        return getattr(o, pk_name)
-
 
 class ModelConverter(ModelConverterBase):
     @classmethod
@@ -225,29 +221,42 @@ class ModelConverter(ModelConverterBase):
     def conv_ManyToMany(self, field_args: Dict, **kwargs: Any) -> Field:
         return QuerySelectMultipleField(**field_args)
 
+    @converts("AJAX_MANYTOONE")
+    def conv_AjaxManyToOne(self, field_args: Dict, **kwargs: Any) -> Field:
+        return AjaxSelectField(**field_args)
 
-async def get_model_form(
+    @converts("AJAX_MANYTOMANY", "AJAX_ONETOMANY")
+    def conv_AjaxManyToMany(self, field_args: Dict, **kwargs: Any) -> Field:
+        return AjaxSelectMultipleField(**field_args)
+
+
+def get_model_form(
     model: type,
-    engine: Union[Engine, AsyncEngine],
     only: Sequence[str] = None,
     exclude: Sequence[str] = None,
+    ajax_loaders: Mapping[str, QueryAjaxModelLoader] = None,
+    foreign_keys: bool = False,
 ) -> Type[Form]:
     type_name = model.__name__ + "Form"
     converter = ModelConverter()
     mapper = sqlalchemy_inspect(model)
 
+    # Fields are created in the order of `only`
+    names = only or mapper.attrs.keys()
+
     attributes = []
-    for name, attr in mapper.attrs.items():
-        if only and name not in only:
+    for name in names:
+        if name not in mapper.attrs:
             continue
         elif exclude and name in exclude:
             continue
 
-        attributes.append((name, attr))
+        attributes.append((name, mapper.attrs[name]))
 
     field_dict = {}
     for name, attr in attributes:
-        field = await converter.convert(model, mapper, attr, engine)
+        loader = ajax_loaders.get(name) if ajax_loaders else None
+        field = converter.convert(model, mapper, attr, loader, foreign_keys)
         if field is not None:
             field_dict[name] = field
 
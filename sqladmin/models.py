@@ -1,40 +1,130 @@
+import codecs
+import csv
+import datetime
+import hashlib
+import io
+import itertools
+import json
+import operator
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import (
     Any,
+    AsyncGenerator,
+    BinaryIO,
+    Callable,
     ClassVar,
     Dict,
+    FrozenSet,
+    Iterator,
     List,
+    Mapping,
+    Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
+    TypeVar,
     Union,
     no_type_check,
 )
+from urllib.parse import quote
 
 import anyio
-from sqlalchemy import Column, func, inspect, select
+from sqlalchemy import (
+    Column,
+    Table,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.engine.base import Engine
-from sqlalchemy.exc import NoInspectionAvailable
+from sqlalchemy.exc import DBAPIError, NoInspectionAvailable, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import (
     ColumnProperty,
     RelationshipProperty,
+    Session,
+    load_only,
     selectinload,
     sessionmaker,
 )
 from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import LoaderOption
 from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.selectable import Select
+from starlette.datastructures import ImmutableMultiDict
 from starlette.requests import Request
 from wtforms import Form
-
-from sqladmin.exceptions import InvalidColumnError, InvalidModelError
+from wtforms.fields.core import UnboundField
+
+from sqladmin.ajax import QueryAjaxModelLoader
+from sqladmin.caching import ListCache
+from sqladmin.counting import CountStrategy, ExactCount, NoCount, RowCount
+from sqladmin.exceptions import (
+    InvalidColumnError,
+    InvalidCursorError,
+    InvalidModelError,
+)
+from sqladmin.filters import ColumnFilter, FilterValues, get_column_filter
 from sqladmin.forms import get_model_form
 from sqladmin.helpers import prettify_class_name, slugify_class_name
-from sqladmin.pagination import Pagination
+from sqladmin.pagination import PK_PLACEHOLDER, Cursor, Pagination, RowView
+from sqladmin.searching import PrefixSearch, SearchBackend
+from sqladmin.workers import WorkerPool
 
 __all__ = [
     "ModelAdmin",
 ]
 
+T = TypeVar("T")
+
+# Keeps the IN list below the bound parameter limits of databases
+DELETE_CHUNK_SIZE = 500
+
+# Rows fetched from the database cursor at a time when exporting
+EXPORT_BATCH_SIZE = 1000
+
+# Row errors kept in an import report, the rest are only counted
+MAX_IMPORT_ERRORS = 1000
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """Model attribute resolved from the column options of ModelAdmin."""
+
+    key: str
+    label: str
+    prop: Union[ColumnProperty, RelationshipProperty]
+    is_relationship: bool
+
+
+@dataclass
+class ImportReport:
+    """Result of importing a CSV file."""
+
+    rows: int = 0
+    inserted: int = 0
+    error_count: int = 0
+    errors: List[Tuple[int, Dict[str, List[str]]]] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def add_error(self, row: int, errors: Dict[str, List[str]]) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_IMPORT_ERRORS:
+            self.errors.append((row, errors))
+
 
 class ModelAdminMeta(type):
     """Metaclass used to specify class variables in ModelAdmin.
@@ -73,6 +163,20 @@ class ModelAdminMeta(type):
         mcls._check_conflicting_options(
             ["column_details_list", "column_details_exclude_list"], attrs
         )
+        mcls._check_conflicting_options(
+            ["form_columns", "form_excluded_columns"], attrs
+        )
+
+        for export_type in cls.export_types:
+            assert export_type in (
+                "csv",
+                "jsonl",
+            ), f"Invalid export type '{export_type}'."
+
+        assert cls.pagination_mode in (
+            "offset",
+            "keyset",
+        ), f"Invalid pagination_mode '{cls.pagination_mode}'."
 
         return cls
 
@@ -122,6 +226,8 @@ class ModelAdmin(BaseModelAdmin, metaclass=ModelAdminMeta):
     sessionmaker: ClassVar[sessionmaker]
     engine: ClassVar[Union[Engine, AsyncEngine]]
     async_engine: ClassVar[bool]
+    workers: ClassVar[WorkerPool]
+    list_cache: ClassVar[Optional[ListCache]]
 
     # Metadata
     name: ClassVar[str] = ""
@@ -160,6 +266,32 @@ class ModelAdmin(BaseModelAdmin, metaclass=ModelAdminMeta):
     Default value is set to `True`.
     """
 
+    can_export: ClassVar[bool] = False
+    """Permission for exporting lists of Models.
+    Default value is set to `False`.
+    """
+
+    can_import: ClassVar[bool] = False
+    """Permission for importing Models from CSV files,
+    `can_create` is also required. Default value is set to `False`.
+    """
+
+    import_batch_size: ClassVar[int] = 1000
+    """Number of valid rows inserted together when importing a CSV file.
+    Default value is set to `1000`.
+    """
+
+    export_types: ClassVar[Sequence[str]] = ["csv", "jsonl"]
+    """Formats available to export `List` page.
+    Default value is set to `["csv", "jsonl"]`.
+
+    ???+ example
+        ```python
+        class UserAdmin(ModelAdmin, model=User):
+            export_types = ["csv"]
+        ```
+    """
+
     # List page
     column_list: ClassVar[Sequence[Union[str, InstrumentedAttribute]]] = []
     """List of columns to display in `List` page.
@@ -208,6 +340,126 @@ class ModelAdmin(BaseModelAdmin, metaclass=ModelAdminMeta):
         ```
     """
 
+    pagination_mode: ClassVar[str] = "offset"
+    """Pagination mode of `List` page, either `"offset"` or `"keyset"`.
+    Default value is set to `"offset"`.
+
+    Keyset pagination addresses pages by an opaque cursor
+    built from the sort columns and primary key instead of an offset,
+    so deep pages cost the same as the first one.
+    Only previous and next pages can be linked to.
+
+    ???+ example
+        ```python
+        class UserAdmin(ModelAdmin, model=User):
+            pagination_mode = "keyset"
+        ```
+    """
+
+    column_default_sort: ClassVar[
+        Union[
+            None,
+            str,
+            InstrumentedAttribute,
+            Tuple[Union[str, InstrumentedAttribute], bool],
+        ]
+    ] = None
+    """Default sort column of `List` page.
+    Can be a column or a tuple of column and `True` for descending order.
+    Primary key is always used to break ties.
+
+    ???+ note
+        By default rows are sorted by primary key.
+        Keyset pagination needs a non-nullable sort column,
+        checked when the ModelAdmin is created.
+
+    ???+ example
+        ```python
+        class UserAdmin(ModelAdmin, model=User):
+            column_default_sort = (User.created_at, True)
+        ```
+    """
+
+    column_searchable_list: ClassVar[Sequence[Union[str, InstrumentedAttribute]]] = []
+    """List of columns searched from the search box of `List` page.
+    The search box is only shown when columns are set.
+
+    ???+ example
+        ```python
+        class UserAdmin(ModelAdmin, model=User):
+            column_searchable_list = [User.name, User.email]
+        ```
+    """
+
+    column_filters: ClassVar[Sequence[Union[str, InstrumentedAttribute]]] = []
+    """List of columns filtering `List` page.
+
+    Filters depend on the column type: ranges of numbers and dates,
+    values of enums, booleans and equality for other columns.
+    Nullable columns can also be filtered on `NULL` values.
+
+    ???+ example
+        ```python
+        class UserAdmin(ModelAdmin, model=User):
+            column_filters = [User.is_active, User.created_at]
+        ```
+    """
+
+    search_backend: ClassVar[SearchBackend] = PrefixSearch()
+    """Backend matching rows of `List` page with the search term.
+    Default value is set to `PrefixSearch()`.
+
+    Available backends in `sqladmin.searching` are `PrefixSearch`,
+    `ContainsSearch` and `FullTextSearch`.
+
+    ???+ example
+        ```python
+        from sqladmin.searching import ContainsSearch
+
+        class UserAdmin(ModelAdmin, model=User):
+            column_searchable_list = [User.name]
+            search_backend = ContainsSearch()
+        ```
+    """
+
+    count_strategy: ClassVar[CountStrategy] = ExactCount()
+    """Strategy used to count rows in `List` page.
+    Default value is set to `ExactCount()`.
+
+    Available strategies in `sqladmin.counting` are `ExactCount`,
+    `CachedCount`, `EstimatedCount` and `NoCount`.
+
+    ???+ example
+        ```python
+        from sqladmin.counting import EstimatedCount
+
+        class UserAdmin(ModelAdmin, model=User):
+            count_strategy = EstimatedCount(threshold=100_000)
+        ```
+    """
+
+    column_version: ClassVar[Union[None, str, InstrumentedAttribute]] = None
+    """Column changed by every update of a row,
+    such as `updated_at` or a version counter.
+    Default value is set to `None`.
+
+    When set, `List` and `Details` pages are sent with an `ETag`
+    built from the primary keys and versions of the displayed rows
+    and the row count. Refreshing an unchanged page returns
+    `304 Not Modified` without loading the rows or rendering the page.
+
+    ???+ note
+        Relationship columns are only covered when changes
+        of the related rows also update the version.
+        Override `get_fingerprint_query` to fingerprint pages differently.
+
+    ???+ example
+        ```python
+        class UserAdmin(ModelAdmin, model=User):
+            column_version = User.updated_at
+        ```
+    """
+
     # Details page
     column_details_list: ClassVar[Sequence[Union[str, InstrumentedAttribute]]] = []
     """List of columns to display in `Detail` page.
@@ -247,6 +499,63 @@ class ModelAdmin(BaseModelAdmin, metaclass=ModelAdminMeta):
         ```
     """
 
+    column_always_load: ClassVar[Sequence[Union[str, InstrumentedAttribute]]] = []
+    """List of columns always loaded in `List` and `Detail` pages.
+
+    Only the primary key and the displayed columns are loaded by default,
+    other columns are deferred. Add columns used by custom templates
+    or by `__str__` of the model here.
+
+    ???+ example
+        ```python
+        class UserAdmin(ModelAdmin, model=User):
+            column_list = [User.id]
+            column_always_load = [User.name]
+        ```
+    """
+
+    # Forms
+    form_columns: ClassVar[Sequence[Union[str, InstrumentedAttribute]]] = []
+    """List of columns to include in `Create` and `Edit` forms.
+    Columns can either be string names or SQLAlchemy columns.
+
+    ???+ note
+        By default all columns of the model are included.
+
+    ???+ example
+        ```python
+        class UserAdmin(ModelAdmin, model=User):
+            form_columns = [User.name, User.mail]
+        ```
+    """
+
+    form_excluded_columns: ClassVar[Sequence[Union[str, InstrumentedAttribute]]] = []
+    """List of columns to exclude from `Create` and `Edit` forms.
+    Columns can either be string names or SQLAlchemy columns.
+
+    ???+ example
+        ```python
+        class UserAdmin(ModelAdmin, model=User):
+            form_excluded_columns = [User.created_at]
+        ```
+    """
+
+    form_ajax_refs: ClassVar[Dict[str, Dict[str, Any]]] = {}
+    """Relationship fields whose choices are searched on demand
+    instead of loading the whole related table in the form.
+
+    Each relationship name maps to the options of `QueryAjaxModelLoader`:
+    `fields` to search by prefix and optionally `page_size`.
+
+    ???+ example
+        ```python
+        class OrderAdmin(ModelAdmin, model=Order):
+            form_ajax_refs = {
+                "customer": {"fields": [Customer.name, Customer.email]},
+            }
+        ```
+    """
+
     # Templates
     list_template: ClassVar[str] = "list.html"
     """List view template. Default is `list.html`."""
@@ -260,18 +569,86 @@ class ModelAdmin(BaseModelAdmin, metaclass=ModelAdminMeta):
     edit_template: ClassVar[str] = "edit.html"
     """Edit view template. Default is `edit.html`."""
 
+    import_template: ClassVar[str] = "import.html"
+    """Import view template. Default is `import.html`."""
+
+    def __init__(self) -> None:
+        # Column options are resolved once, templates and queries read the plans
+        mapper = inspect(self.model)
+        self.pk_attr: InstrumentedAttribute = getattr(
+            self.model, mapper.get_property_by_column(self.pk_column).key
+        )
+        self._column_labels = MappingProxyType(self._build_column_labels())
+        self.list_columns = self._build_column_plans(
+            self.column_list,
+            self.column_exclude_list,
+            default=[self.pk_attr.prop],
+        )
+        self.details_columns = self._build_column_plans(
+            self.column_details_list,
+            self.column_details_exclude_list,
+            default=self.get_model_attributes(),
+        )
+        # Overridden getters replace the plans they would have returned
+        if type(self).get_list_columns is not ModelAdmin.get_list_columns:
+            self.list_columns = self._get_column_plans(self.get_list_columns())
+        if type(self).get_details_columns is not ModelAdmin.get_details_columns:
+            self.details_columns = self._get_column_plans(self.get_details_columns())
+        self._list_relationships = tuple(
+            c.key for c in self.list_columns if c.is_relationship
+        )
+        self._list_getter = operator.attrgetter(*[c.key for c in self.list_columns])
+        self._get_attr_value_overridden = (
+            type(self).get_attr_value is not ModelAdmin.get_attr_value
+        )
+        self._details_relationships = tuple(
+            c.key for c in self.details_columns if c.is_relationship
+        )
+        self._sort_columns = tuple(self._build_sort_columns())
+        self._version_attr = self._build_version_attr()
+        self.search_columns: List[InstrumentedAttribute] = [
+            self._get_column_attr(attr, "Cannot search a relationship.")
+            for attr in self.column_searchable_list
+        ]
+        self.filters: List[ColumnFilter] = [
+            self._build_filter(attr) for attr in self.column_filters
+        ]
+        self._cache_tags = self._build_cache_tags()
+        self._list_load_options = self._build_load_options(
+            self.list_columns, [column for column, _ in self._sort_columns]
+        )
+        self._details_load_options = self._build_load_options(self.details_columns)
+        self._form_ajax_loaders = {
+            name: self._build_ajax_loader(name, options)
+            for name, options in self.form_ajax_refs.items()
+        }
+        self._form_class: Optional[Type[Form]] = None
+        self._import_form_class: Optional[Type[Form]] = None
+        self._form_relationships: Tuple[RelationshipProperty, ...] = ()
+
     def _run_query_sync(self, stmt: ClauseElement) -> Any:
-        with self.sessionmaker(expire_on_commit=False) as session:
+        with self.sessionmaker() as session:
             result = session.execute(stmt)
             return result.scalars().all()
 
     async def _run_query(self, stmt: ClauseElement) -> Any:
         if self.async_engine:
-            async with self.sessionmaker(expire_on_commit=False) as session:
+            async with self.sessionmaker() as session:
                 result = await session.execute(stmt)
                 return result.scalars().all()
         else:
-            return await anyio.to_thread.run_sync(self._run_query_sync, stmt)
+            return await self.workers.run(self._run_query_sync, stmt)
+
+    def _run_with_session_sync(self, func: Callable[..., T], *args: Any) -> T:
+        with self.sessionmaker() as session:
+            return func(session, *args)
+
+    async def _run_with_session(self, func: Callable[..., T], *args: Any) -> T:
+        if self.async_engine:
+            async with self.sessionmaker() as session:
+                return await session.run_sync(func, *args)
+        else:
+            return await self.workers.run(self._run_with_session_sync, func, *args)
 
     def _add_object_sync(self, obj: Any) -> None:
         with self.sessionmaker.begin() as session:
@@ -281,54 +658,589 @@ class ModelAdmin(BaseModelAdmin, metaclass=ModelAdminMeta):
         with self.sessionmaker.begin() as session:
             session.delete(obj)
 
-    def _update_modeL_sync(self, pk: Any, data: Dict[str, Any]) -> None:
-        stmt = select(self.model).where(self.pk_column == pk)
-        relationships = inspect(self.model).relationships
+    def get_count_query(self) -> Select:
+        return select(func.count(self.pk_column))
+
+    async def count(self) -> RowCount:
+        return await self._run_with_session(self._count_sync, "", None)
+
+    async def _count_list(
+        self, search: str, filters: Optional[FilterValues]
+    ) -> RowCount:
+        if self._uses_count_override(search, filters):
+            return await self._run_count_override()
+        return await self._run_with_session(self._count_sync, search, filters)
+
+    async def _run_count_override(self) -> RowCount:
+        count: Any = await self.count()
+        # Overrides written before RowCount return an int
+        return count if isinstance(count, RowCount) else RowCount(count)
+
+    def _uses_count_override(
+        self, search: str, filters: Optional[FilterValues]
+    ) -> bool:
+        # Overrides of count() cannot count the rows of a search or filters
+        if type(self).count is ModelAdmin.count:
+            return False
+        return not self._get_list_clauses(search, filters)
+
+    def _count_sync(
+        self, session: Session, search: str, filters: Optional[FilterValues]
+    ) -> RowCount:
+        clauses = self._get_list_clauses(search, filters)
+        if not clauses:
+            return self.count_strategy.count(session, self)
+
+        # Cached and estimated counts are of the whole table
+        stmt = self.get_count_query().where(*clauses)
+        return RowCount(session.execute(stmt).scalar_one())
+
+    def get_filter_values(self, params: ImmutableMultiDict) -> Dict[str, List[str]]:
+        """Values of `column_filters` in the query parameters of `List` page.
+
+        Raises:
+            InvalidFilterError: A value cannot be converted to the column type.
+        """
 
-        with self.sessionmaker.begin() as session:
-            result = session.execute(stmt).scalars().first()
-            for name, value in data.items():
-                if name in relationships and isinstance(value, list):
-                    # Load relationship objects into session
-                    session.add_all(value)
-                setattr(result, name, value)
-
-    async def count(self) -> int:
-        stmt = select(func.count(self.pk_column))
-        rows = await self._run_query(stmt)
-        return rows[0]
+        values: Dict[str, List[str]] = {}
+        for column_filter in self.filters:
+            for name in column_filter.params:
+                param_values = [value for value in params.getlist(name) if value]
+                if param_values:
+                    values[name] = param_values
+
+        # Invalid values fail here rather than when running the queries
+        self._get_list_clauses("", values)
+        return values
+
+    def _get_list_clauses(
+        self, search: str, filters: Optional[FilterValues]
+    ) -> List[ClauseElement]:
+        clauses: List[ClauseElement] = []
+        if search and self.search_columns:
+            clauses.append(self.search_backend.get_clause(self, search))
+        if filters:
+            for column_filter in self.filters:
+                clauses.extend(column_filter.get_clauses(filters))
+        return clauses
+
+    def _apply_filters(
+        self, stmt: Select, search: str, filters: Optional[FilterValues]
+    ) -> Select:
+        clauses = self._get_list_clauses(search, filters)
+        return stmt.where(*clauses) if clauses else stmt
+
+    async def list(
+        self,
+        page: int,
+        page_size: int,
+        cursor: Optional[str] = None,
+        search: str = "",
+        filters: Optional[FilterValues] = None,
+        *,
+        count: Optional[RowCount] = None,
+    ) -> Pagination:
+        """Rows of `List` page.
+
+        `count` is the row count computed beforehand, like for the ETag
+        of the page, the count query is then skipped.
+        """
 
-    async def list(self, page: int, page_size: int) -> Pagination:
-        page_size = min(page_size or self.page_size, max(self.page_size_options))
+        page_size = self._get_page_size(page_size)
+        position = self._get_position(cursor)
 
-        count = await self.count()
-        stmt = (
-            select(self.model)
-            .order_by(self.pk_column)
-            .limit(page_size)
+        stmt = select(self.model).options(*self._list_load_options)
+        stmt = self._apply_filters(stmt, search, filters)
+        stmt = self._get_page_query(stmt, page, page_size, position)
+
+        if self.list_cache is None:
+            result = await self._run_list_query(stmt, search, filters, count)
+        else:
+            params = sorted((filters or {}).items())
+            key = f"{self.identity}:{page}:{page_size}:{cursor or ''}:{params}:{search}"
+            cached = await self.list_cache.get(key)
+            if cached is None:
+                tags = self._cache_tags
+                generation = await self.list_cache.get_generation(tags)
+                cached = await self._run_list_query(stmt, search, filters, count)
+                await self.list_cache.set(key, cached, tags, generation)
+            result = cached
+
+        # A count given beforehand is at least as recent as a cached one
+        count = result[0] if count is None else count
+        rows = result[1]
+
+        if position is not None:
+            return self._get_keyset_pagination(rows, count, position, page_size)
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        # The total is known on the last page
+        if (count.value is None or count.estimated) and not has_more:
+            if rows or page == 1:
+                count = RowCount((page - 1) * page_size + len(rows))
+
+        pagination = Pagination(
+            rows=rows,
+            page=page,
+            page_size=page_size,
+            count=count.value,
+            count_estimated=count.estimated,
+            has_more=has_more,
+        )
+
+        return pagination
+
+    def _get_page_size(self, page_size: int) -> int:
+        return min(page_size or self.page_size, max(self.page_size_options))
+
+    def _get_position(self, cursor: Optional[str]) -> Optional[Cursor]:
+        if self.pagination_mode != "keyset":
+            return None
+        return Cursor.decode(cursor) if cursor else Cursor(page=1, values=[])
+
+    def _get_page_query(
+        self, stmt: Select, page: int, page_size: int, position: Optional[Cursor]
+    ) -> Select:
+        if position is not None:
+            return self._get_keyset_query(stmt, position, page_size)
+
+        # One extra row tells if there is a next page without counting
+        return (
+            stmt.order_by(*self._get_order_by())
+            .limit(page_size + 1)
             .offset((page - 1) * page_size)
         )
 
-        for _, attr in self.get_list_columns():
-            if isinstance(attr, RelationshipProperty):
-                stmt = stmt.options(selectinload(attr.key))
+    def get_fingerprint_query(self, stmt: Select) -> Optional[Select]:
+        """Query whose result changes when the rows selected by `stmt` change.
+
+        `stmt` selects the model rows of a `List` page,
+        ordered and limited, or the row of a `Details` page.
+        By default the primary key and `column_version` of those rows
+        are selected, or `None` is returned without `column_version`,
+        which disables ETags.
+
+        ???+ example
+            ```python
+            class OrderAdmin(ModelAdmin, model=Order):
+                # Every change of an order is recorded as an event
+                def get_fingerprint_query(self, stmt):
+                    return select(func.count(OrderEvent.id), func.max(OrderEvent.id))
+            ```
+        """
+
+        if self._version_attr is None:
+            return None
+        return stmt.with_only_columns(self.pk_attr, self._version_attr)
+
+    async def get_list_etag(
+        self,
+        page: int,
+        page_size: int,
+        cursor: Optional[str] = None,
+        search: str = "",
+        filters: Optional[FilterValues] = None,
+    ) -> Optional[str]:
+        """ETag of `List` page, `None` when ETags are disabled."""
+
+        etag, _ = await self._get_list_etag(page, page_size, cursor, search, filters)
+        return etag
+
+    async def _get_list_etag(
+        self,
+        page: int,
+        page_size: int,
+        cursor: Optional[str],
+        search: str,
+        filters: Optional[FilterValues],
+    ) -> Tuple[Optional[str], Optional[RowCount]]:
+        page_size = self._get_page_size(page_size)
+        position = self._get_position(cursor)
+
+        stmt = self._apply_filters(select(self.model), search, filters)
+        stmt = self._get_page_query(stmt, page, page_size, position)
+        query = self.get_fingerprint_query(stmt)
+        if query is None:
+            return None, None
+
+        # The page shows the row count as well, and reuses it
+        count = None
+        with_count = not isinstance(self.count_strategy, NoCount)
+        if with_count and self._uses_count_override(search, filters):
+            count = await self._run_count_override()
+
+        return await self._run_with_session(
+            self._get_etag_sync, query, with_count, search, filters, count
+        )
+
+    async def get_details_etag(self, value: Any) -> Optional[str]:
+        """ETag of `Details` page, `None` when ETags are disabled."""
+
+        stmt = select(self.model).where(self.pk_column == value)
+        query = self.get_fingerprint_query(stmt)
+        if query is None:
+            return None
+
+        etag, _ = await self._run_with_session(
+            self._get_etag_sync, query, False, "", None, None
+        )
+        return etag
+
+    def _get_etag_sync(
+        self,
+        session: Session,
+        query: Select,
+        with_count: bool,
+        search: str,
+        filters: Optional[FilterValues],
+        count: Optional[RowCount],
+    ) -> Tuple[str, Optional[RowCount]]:
+        if count is None and with_count:
+            count = self._count_sync(session, search, filters)
+        rows = [tuple(row) for row in session.execute(query)]
+
+        fingerprint = repr((self.identity, count, rows)).encode()
+        return f'W/"{hashlib.sha256(fingerprint).hexdigest()[:32]}"', count
+
+    def _run_list_query_sync(
+        self,
+        stmt: Select,
+        with_count: bool,
+        search: str,
+        filters: Optional[FilterValues],
+    ) -> Tuple[RowCount, List[Any]]:
+        with self.sessionmaker() as session:
+            count = RowCount(None)
+            if with_count:
+                count = self._count_sync(session, search, filters)
+
+            rows = session.execute(stmt).scalars().all()
+            return count, rows
+
+    async def _run_list_query(
+        self,
+        stmt: Select,
+        search: str,
+        filters: Optional[FilterValues],
+        count: Optional[RowCount] = None,
+    ) -> Tuple[RowCount, List[Any]]:
+        if count is not None:
+            return count, await self._run_query(stmt)
+
+        with_count = not isinstance(self.count_strategy, NoCount)
+
+        if not self.async_engine and not self._uses_count_override(search, filters):
+            # Both queries in a single worker thread hop
+            return await self.workers.run(
+                self._run_list_query_sync, stmt, with_count, search, filters
+            )
+
+        if not with_count:
+            return RowCount(None), await self._run_query(stmt)
+
+        count = RowCount(None)
+        rows: List[Any] = []
+
+        async def run_count() -> None:
+            nonlocal count
+            count = await self._count_list(search, filters)
+
+        async def run_rows() -> None:
+            nonlocal rows
+            rows = await self._run_query(stmt)
+
+        # Each query checks out its own connection so both run concurrently
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run_count)
+            tg.start_soon(run_rows)
+
+        return count, rows
+
+    def _get_keyset_query(
+        self, stmt: Select, position: Cursor, page_size: int
+    ) -> Select:
+        sort_columns = self._sort_columns
+
+        if position.values:
+            if len(position.values) != len(sort_columns):
+                raise InvalidCursorError("Invalid pagination cursor.")
+
+            values = [
+                self._coerce_cursor_value(column, value)
+                for (column, _), value in zip(sort_columns, position.values)
+            ]
+            stmt = stmt.where(
+                self._get_keyset_clause(sort_columns, values, position.backwards)
+            )
+
+        # Walking backwards reverses the order, rows are reversed after fetching
+        return stmt.order_by(
+            *[
+                column.desc() if descending != position.backwards else column.asc()
+                for column, descending in sort_columns
+            ]
+        ).limit(page_size + 1)
+
+    def _get_keyset_pagination(
+        self, rows: List[Any], count: RowCount, position: Cursor, page_size: int
+    ) -> Pagination:
+        sort_columns = self._sort_columns
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        if position.backwards:
+            rows.reverse()
+            has_previous, has_next = has_more, True
+            page = position.page if has_more else 1
+        else:
+            has_previous, has_next = bool(position.values), has_more
+            page = position.page
 
-        rows = await self._run_query(stmt)
         pagination = Pagination(
             rows=rows,
             page=page,
             page_size=page_size,
-            count=count,
+            count=count.value,
+            count_estimated=count.estimated,
+            keyset=True,
         )
 
+        if rows and has_previous:
+            values = [getattr(rows[0], column.key) for column, _ in sort_columns]
+            # Rows inserted before the first page can make it have previous rows
+            previous_page = max(page - 1, 1)
+            pagination.previous_cursor = Cursor(previous_page, values, True).encode()
+        if rows and has_next:
+            values = [getattr(rows[-1], column.key) for column, _ in sort_columns]
+            pagination.next_cursor = Cursor(page + 1, values).encode()
+
         return pagination
 
+    def _build_sort_columns(self) -> List[Tuple[InstrumentedAttribute, bool]]:
+        pk = self.pk_attr
+
+        # Read from the class, model attributes are descriptors
+        default_sort = type(self).column_default_sort
+        if not default_sort:
+            return [(pk, False)]
+
+        if isinstance(default_sort, tuple):
+            attr, descending = default_sort
+        else:
+            attr, descending = default_sort, False
+
+        prop = self.get_model_attr(attr)
+        assert isinstance(prop, ColumnProperty), "Cannot sort by a relationship."
+
+        column = getattr(self.model, prop.key)
+        if column is pk:
+            return [(pk, descending)]
+
+        # Comparisons with NULL would skip rows
+        if self.pagination_mode == "keyset":
+            nullable = any(c.nullable for c in prop.columns)
+            assert not nullable, "Keyset pagination needs a non-nullable sort column."
+
+        return [(column, descending), (pk, descending)]
+
+    def _build_cache_tags(self) -> FrozenSet[str]:
+        # Pages show related rows and changes of related rows, like
+        # foreign keys set to NULL on delete, show in the pages of the model
+        mapper = inspect(self.model)
+        tables = list(mapper.tables)
+        for prop in mapper.relationships:
+            tables.extend(prop.mapper.tables)
+            if isinstance(prop.secondary, Table):
+                tables.append(prop.secondary)
+
+        return frozenset(table.fullname for table in tables)
+
+    def _build_version_attr(self) -> Optional[InstrumentedAttribute]:
+        # Read from the class, model attributes are descriptors
+        version = type(self).column_version
+        if version is None:
+            return None
+
+        return self._get_column_attr(version, "Cannot version by a relationship.")
+
+    def _build_filter(self, attr: Union[str, InstrumentedAttribute]) -> ColumnFilter:
+        prop = self.get_model_attr(attr)
+        column = self._get_column_attr(attr, "Cannot filter by a relationship.")
+        return get_column_filter(column, self._column_labels.get(prop, prop.key))
+
+    def _get_column_attr(
+        self, attr: Union[str, InstrumentedAttribute], message: str
+    ) -> InstrumentedAttribute:
+        prop = self.get_model_attr(attr)
+        assert isinstance(prop, ColumnProperty), message
+        return getattr(self.model, prop.key)
+
+    def _get_order_by(self) -> List[ClauseElement]:
+        return [
+            column.desc() if descending else column.asc()
+            for column, descending in self._sort_columns
+        ]
+
+    def _get_keyset_clause(
+        self,
+        sort_columns: Sequence[Tuple[InstrumentedAttribute, bool]],
+        values: List[Any],
+        backwards: bool,
+    ) -> ClauseElement:
+        # Lexicographic comparison on the sort columns:
+        # (a > x) OR (a = x AND b > y) ...
+        clauses = []
+        for i, (column, descending) in enumerate(sort_columns):
+            compare = operator.lt if descending != backwards else operator.gt
+            equals = [c == v for (c, _), v in zip(sort_columns[:i], values[:i])]
+            clauses.append(and_(*equals, compare(column, values[i])))
+
+        return or_(*clauses)
+
+    def _coerce_cursor_value(self, column: InstrumentedAttribute, value: Any) -> Any:
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:  # pragma: no cover
+            return value
+
+        if value is None or isinstance(value, python_type):
+            return value
+
+        try:
+            if python_type in (datetime.datetime, datetime.date, datetime.time):
+                return python_type.fromisoformat(value)
+            # Enum members are encoded by value, calling the class looks them up
+            return python_type(value)
+        except (TypeError, ValueError):
+            raise InvalidCursorError("Invalid pagination cursor.")
+
+    async def export(
+        self,
+        export_type: str,
+        search: str = "",
+        filters: Optional[FilterValues] = None,
+    ) -> AsyncGenerator[str, None]:
+        """Stream the rows of `List` page as CSV or JSON Lines.
+
+        Rows are fetched in batches from a server side cursor,
+        columns and labels follow `column_list`.
+        """
+
+        labels = [c.label for c in self.list_columns]
+        stmt = (
+            select(self.model)
+            .options(*self._list_load_options)
+            .order_by(*self._get_order_by())
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        stmt = self._apply_filters(stmt, search, filters)
+
+        if export_type == "csv":
+            yield self._write_csv([labels])
+
+        async for rows in self._stream_query(stmt):
+            values = [self._get_list_cells(row) for row in rows]
+            if export_type == "csv":
+                yield self._write_csv(values)
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(labels, v)), default=str) + "\n" for v in values
+                )
+
+    def get_row_views(
+        self, rows: List[Any], url_templates: Mapping[str, str]
+    ) -> List[RowView]:
+        """Build what `List` page displays of `rows` in a single pass.
+
+        `url_templates` map `details`, `edit` and `delete` to their URL
+        with `PK_PLACEHOLDER` in place of the primary key.
+        """
+
+        get_pk = operator.attrgetter(self.pk_attr.key)
+        details, edit, delete = [
+            url_templates[name].rsplit(PK_PLACEHOLDER, 1)
+            for name in ("details", "edit", "delete")
+        ]
+
+        views = []
+        for row in rows:
+            pk = str(get_pk(row))
+            quoted = quote(pk)
+            views.append(
+                RowView(
+                    pk,
+                    self._get_list_cells(row),
+                    quoted.join(details),
+                    quoted.join(edit),
+                    quoted.join(delete),
+                )
+            )
+
+        return views
+
+    def _get_list_cells(self, row: Any) -> Tuple[Any, ...]:
+        # Same values as get_attr_value, read with a single getter
+        if self._get_attr_value_overridden:
+            return tuple(self.get_attr_value(row, c.prop) for c in self.list_columns)
+
+        values = self._list_getter(row)
+        if len(self.list_columns) == 1:
+            values = (values,)
+
+        return tuple(
+            ", ".join(map(str, value)) if isinstance(value, list) else value
+            for value in values
+        )
+
+    async def _stream_query(self, stmt: Select) -> AsyncGenerator[List[Any], None]:
+        if self.async_engine:
+            async with self.sessionmaker() as session:
+                result = await session.stream(stmt)
+                async for partition in result.scalars().partitions():
+                    yield partition
+            return
+
+        session = self.sessionmaker()
+        try:
+            result = await self.workers.run(session.execute, stmt)
+            partitions = result.scalars().partitions()
+            while True:
+                partition = await self.workers.run(next, partitions, None)
+                if partition is None:
+                    break
+                yield partition
+        finally:
+            await self.workers.run(session.close)
+
+    def _write_csv(self, rows: Sequence[Sequence[Any]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+
     async def get_model_by_pk(self, value: Any) -> Any:
-        stmt = select(self.model).where(self.pk_column == value)
+        stmt = (
+            select(self.model)
+            .where(self.pk_column == value)
+            .options(*[selectinload(key) for key in self._details_relationships])
+        )
 
-        for _, attr in self.get_details_columns():
-            if isinstance(attr, RelationshipProperty):
-                stmt = stmt.options(selectinload(attr.key))
+        rows = await self._run_query(stmt)
+        if rows:
+            return rows[0]
+        return None
+
+    async def get_details_model(self, value: Any) -> Any:
+        """Get the object displayed in `Detail` page,
+        loading only the details columns.
+        """
+
+        stmt = (
+            select(self.model)
+            .where(self.pk_column == value)
+            .options(*self._details_load_options)
+        )
 
         rows = await self._run_query(stmt)
         if rows:
@@ -368,84 +1280,653 @@ class ModelAdmin(BaseModelAdmin, metaclass=ModelAdminMeta):
     def get_model_attributes(self) -> List[Column]:
         return list(inspect(self.model).attrs)
 
-    def get_list_columns(self) -> List[Tuple[str, Column]]:
-        """Get list of columns to display in List page."""
+    def get_pk_value(self, obj: Any) -> Any:
+        return getattr(obj, self.pk_attr.key)
 
-        column_list = getattr(self, "column_list", None)
-        column_exclude_list = getattr(self, "column_exclude_list", None)
+    def get_list_columns(self) -> List[Tuple[str, Column]]:
+        """Get list of columns to display in List page.
 
-        if column_list:
-            attrs = [self.get_model_attr(attr) for attr in self.column_list]
-        elif column_exclude_list:
-            exclude_columns = [
-                self.get_model_attr(attr) for attr in column_exclude_list
-            ]
-            all_attrs = self.get_model_attributes()
-            attrs = list(set(all_attrs) - set(exclude_columns))
-        else:
-            attrs = [getattr(self.model, self.pk_column.name).prop]
+        Overrides are called once, when the ModelAdmin is created.
+        """
 
-        labels = self.get_column_labels()
-        return [(labels.get(attr, attr.key), attr) for attr in attrs]
+        return [(c.label, c.prop) for c in self.list_columns]
 
     def get_details_columns(self) -> List[Tuple[str, Column]]:
-        """Get list of columns to display in Detail page."""
+        """Get list of columns to display in Detail page.
 
-        column_details_list = getattr(self, "column_details_list", None)
-        column_details_exclude_list = getattr(self, "column_details_exclude_list", None)
+        Overrides are called once, when the ModelAdmin is created.
+        """
 
-        if column_details_list:
-            attrs = [self.get_model_attr(attr) for attr in column_details_list]
-        elif column_details_exclude_list:
-            exclude_columns = [
-                self.get_model_attr(attr) for attr in column_details_exclude_list
-            ]
-            all_attrs = self.get_model_attributes()
-            attrs = list(set(all_attrs) - set(exclude_columns))
-        else:
-            attrs = self.get_model_attributes()
+        return [(c.label, c.prop) for c in self.details_columns]
 
-        labels = self.get_column_labels()
-        return [(labels.get(attr, attr.key), attr) for attr in attrs]
+    def get_column_labels(self) -> Mapping[Column, str]:
+        return self._column_labels
 
-    def get_column_labels(self) -> Dict[Column, str]:
+    def _build_column_labels(self) -> Dict[Column, str]:
         return {
             self.get_model_attr(column_label): value
             for column_label, value in self.column_labels.items()
         }
 
+    def _build_column_plans(
+        self,
+        include: Sequence[Union[str, InstrumentedAttribute]],
+        exclude: Sequence[Union[str, InstrumentedAttribute]],
+        default: Sequence[Union[ColumnProperty, RelationshipProperty]],
+    ) -> Tuple[ColumnPlan, ...]:
+        if include:
+            attrs = [self.get_model_attr(attr) for attr in include]
+        elif exclude:
+            exclude_attrs = {self.get_model_attr(attr) for attr in exclude}
+            attrs = [
+                attr
+                for attr in self.get_model_attributes()
+                if attr not in exclude_attrs
+            ]
+        else:
+            attrs = list(default)
+
+        return self._get_column_plans(
+            [(self._column_labels.get(attr, attr.key), attr) for attr in attrs]
+        )
+
+    def _get_column_plans(
+        self, columns: Sequence[Tuple[str, Any]]
+    ) -> Tuple[ColumnPlan, ...]:
+        plans = []
+        for label, attr in columns:
+            if isinstance(attr, (str, InstrumentedAttribute)):
+                attr = self.get_model_attr(attr)
+            plans.append(
+                ColumnPlan(
+                    key=attr.key,
+                    label=label,
+                    prop=attr,
+                    is_relationship=isinstance(attr, RelationshipProperty),
+                )
+            )
+
+        return tuple(plans)
+
+    def _build_load_options(
+        self,
+        columns: Sequence[ColumnPlan],
+        extra: Sequence[InstrumentedAttribute] = (),
+    ) -> Tuple[LoaderOption, ...]:
+        keys = [c.key for c in columns if not c.is_relationship]
+        keys += [attr.key for attr in extra]
+        keys += [self.get_model_attr(attr).key for attr in self.column_always_load]
+
+        # Many-to-one relationships are loaded by the local foreign keys
+        mapper = inspect(self.model)
+        for column in columns:
+            if column.is_relationship:
+                for local in column.prop.local_columns:
+                    if local.table is mapper.local_table:
+                        keys.append(mapper.get_property_by_column(local).key)
+
+        attrs = [getattr(self.model, key) for key in dict.fromkeys(keys)]
+        relationships = [selectinload(c.key) for c in columns if c.is_relationship]
+        return (load_only(*attrs), *relationships)
+
+    async def _invalidate_list_cache(self) -> None:
+        if self.list_cache is not None:
+            await self.list_cache.invalidate(self._cache_tags)
+
     async def delete_model(self, obj: Any) -> None:
+        """Delete `obj`, rows deleted from the admin go through it
+        when it is overridden.
+        """
+
         if self.async_engine:
             async with self.sessionmaker.begin() as session:
                 await session.delete(obj)
         else:
-            await anyio.to_thread.run_sync(self._delete_object_sync, obj)
+            await self.workers.run(self._delete_object_sync, obj)
+
+        self.count_strategy.invalidate(self)
+        await self._invalidate_list_cache()
+
+    async def delete_models(self, pks: Sequence[Any]) -> int:
+        """Delete the rows of `pks` in one transaction.
+
+        Rows are deleted with `DELETE ... WHERE pk IN (...)` in chunks,
+        objects are only loaded and deleted through the ORM
+        when delete cascades or mapper events require it.
+        When `delete_model` is overridden, like for soft deletes,
+        each object is loaded and passed to it instead.
+
+        Returns:
+            Number of deleted rows.
+        """
+
+        values = [self._coerce_pk(pk) for pk in pks]
+        if type(self).delete_model is not ModelAdmin.delete_model:
+            deleted = 0
+            for value in values:
+                obj = await self.get_model_by_pk(value)
+                if obj is not None:
+                    await self.delete_model(obj)
+                    deleted += 1
+            return deleted
+
+        deleted = await self._run_with_session(self._delete_models_sync, values)
+        self.count_strategy.invalidate(self)
+        await self._invalidate_list_cache()
+        return deleted
+
+    def _delete_models_sync(self, session: Session, pks: List[Any]) -> int:
+        statements = self._get_delete_statements()
+        deleted = 0
+
+        for start in range(0, len(pks), DELETE_CHUNK_SIZE):
+            chunk = pks[start : start + DELETE_CHUNK_SIZE]
+
+            if statements is None:
+                stmt = select(self.model).where(self.pk_column.in_(chunk))
+                for obj in session.execute(stmt).scalars():
+                    session.delete(obj)
+                    deleted += 1
+                session.flush()
+                continue
+
+            for stmt in statements:
+                session.execute(stmt, {"pks": chunk})
+
+            stmt = delete(inspect(self.model).local_table).where(
+                self.pk_column.in_(bindparam("pks", expanding=True))
+            )
+            deleted += session.execute(stmt, {"pks": chunk}).rowcount
+
+        session.commit()
+        return deleted
+
+    def _coerce_pk(self, value: Any) -> Any:
+        try:
+            python_type = self.pk_column.type.python_type
+        except NotImplementedError:  # pragma: no cover
+            return value
+
+        return value if isinstance(value, python_type) else python_type(value)
+
+    def _get_delete_statements(self) -> Optional[List[ClauseElement]]:
+        """Statements run before deleting rows without the ORM,
+        `None` when the ORM is required.
+        """
+
+        mapper = inspect(self.model)
+        if (
+            len(mapper.tables) > 1
+            or mapper.version_id_col is not None
+            or mapper.dispatch.before_delete
+            or mapper.dispatch.after_delete
+        ):
+            return None
+
+        pks = bindparam("pks", expanding=True)
+        statements: List[ClauseElement] = []
+
+        for prop in mapper.relationships:
+            if prop.viewonly or prop.direction.name == "MANYTOONE":
+                continue
+            elif "delete" in prop.cascade:
+                return None
+            elif prop.passive_deletes:
+                continue
+
+            # Mirror the ORM, which unlinks children and association rows
+            pairs = prop.synchronize_pairs
+            if len(pairs) != 1 or pairs[0][0] is not self.pk_column:
+                return None
+
+            remote = pairs[0][1]
+            if prop.secondary is not None:
+                stmt = delete(prop.secondary).where(remote.in_(pks))
+            else:
+                stmt = (
+                    update(remote.table).where(remote.in_(pks)).values({remote: None})
+                )
+            statements.append(stmt)
+
+        return statements
 
     async def insert_model(self, obj: type) -> Any:
         if self.async_engine:
             async with self.sessionmaker.begin() as session:
                 session.add(obj)
         else:
-            await anyio.to_thread.run_sync(self._add_object_sync, obj)
+            await self.workers.run(self._add_object_sync, obj)
+
+        self.count_strategy.invalidate(self)
+        await self._invalidate_list_cache()
 
     async def update_model(self, pk: Any, data: Dict[str, Any]) -> None:
-        if self.async_engine:
-            stmt = select(self.model).where(self.pk_column == pk)
-            relationships = inspect(self.model).relationships
+        """Update the row of `pk` with the form `data` in one transaction.
 
-            for name in relationships.keys():
-                stmt = stmt.options(selectinload(name))
+        The row is not loaded when a single `UPDATE` statement is enough.
 
-            async with self.sessionmaker.begin() as session:
-                result = await session.execute(stmt)
-                result = result.scalars().first()
-                for name, value in data.items():
-                    if name in relationships and isinstance(value, list):
-                        # Load relationship objects into session
-                        session.add_all(value)
-                    setattr(result, name, value)
+        Raises:
+            NoResultFound: There is no row with primary key `pk`.
+        """
+
+        await self._run_with_session(self._update_model_sync, pk, data)
+        await self._invalidate_list_cache()
+
+    def _update_model_sync(
+        self, session: Session, pk: Any, data: Dict[str, Any]
+    ) -> None:
+        values, collections, related = self._split_update_data(data)
+
+        # Added and removed related primary keys of changed collections
+        changes = {}
+        for key, value in collections.items():
+            current = self._get_collection_pks(session, pk, key)
+            submitted = self._get_pks(key, value)
+            if current != submitted:
+                changes[key] = (submitted - current, current - submitted)
+
+        relationships = inspect(self.model).relationships
+        if (
+            related
+            or not self._can_update_directly()
+            or not all(
+                self._can_update_collection(relationships[key]) for key in changes
+            )
+        ):
+            stmt = select(self.model).where(self.pk_column == pk)
+            obj = session.execute(stmt).scalars().one()
+            for key, value in values.items():
+                setattr(obj, key, value)
+            for key in changes:
+                setattr(obj, key, self._get_related(session, key, collections[key]))
+            for key, value in related.items():
+                objects = self._get_related(
+                    session, key, [] if value is None else [value]
+                )
+                setattr(obj, key, objects[0] if objects else None)
+            session.commit()
+            return
+
+        if values:
+            stmt = (
+                update(self.model)
+                .where(self.pk_column == pk)
+                .values({getattr(self.model, k): v for k, v in values.items()})
+                .execution_options(synchronize_session=False)
+            )
+            if not session.execute(stmt).rowcount:
+                raise NoResultFound("No row was found when one was required")
         else:
-            await anyio.to_thread.run_sync(self._update_modeL_sync, pk, data)
+            stmt = select(self.pk_column).where(self.pk_column == pk)
+            session.execute(stmt).one()
+
+        # Only the difference is written, the collections are never loaded
+        for key, (added, removed) in changes.items():
+            self._update_collection_sync(
+                session, relationships[key], pk, added, removed
+            )
+
+        session.commit()
+
+    def _split_update_data(
+        self, data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, List[Any]], Dict[str, Any]]:
+        """Split form `data` into column values, collections
+        and other scalar relationships, which need the ORM.
+        """
+
+        mapper = inspect(self.model)
+        values: Dict[str, Any] = {}
+        collections = {}
+        related = {}
+
+        for key, value in data.items():
+            prop = mapper.attrs[key]
+            if not isinstance(prop, RelationshipProperty):
+                values[key] = value
+            elif prop.uselist:
+                collections[key] = value or []
+            elif prop.direction.name == "MANYTOONE":
+                # Many-to-one relationships are stored in the foreign keys
+                for local, remote in prop.local_remote_pairs:
+                    remote_key = prop.mapper.get_property_by_column(remote).key
+                    local_key = mapper.get_property_by_column(local).key
+                    values[local_key] = getattr(value, remote_key, None)
+            else:
+                # One-to-one relationships are stored in the foreign keys
+                # of the related rows
+                related[key] = value
+
+        return values, collections, related
+
+    def _can_update_directly(self) -> bool:
+        # Validators and attribute events only run when setting attributes
+        mapper = inspect(self.model)
+        return (
+            len(mapper.tables) == 1
+            and mapper.version_id_col is None
+            and not mapper.validators
+            and not mapper.dispatch.before_update
+            and not mapper.dispatch.after_update
+            and not any(
+                attr.dispatch.set or attr.dispatch.modified
+                for attr in (getattr(self.model, p.key) for p in mapper.column_attrs)
+            )
+        )
+
+    def _can_update_collection(self, prop: RelationshipProperty) -> bool:
+        """If collection `prop` can be changed without loading it."""
+
+        mapper = prop.mapper
+        pairs = prop.synchronize_pairs
+        if (
+            len(pairs) != 1
+            or pairs[0][0] is not self.pk_column
+            or len(mapper.primary_key) != 1
+        ):
+            return False
+
+        if prop.secondary is not None:
+            pairs = prop.secondary_synchronize_pairs
+            return len(pairs) == 1 and pairs[0][0] is mapper.primary_key[0]
+
+        # Children are updated in place unless the ORM would delete them
+        return (
+            "delete-orphan" not in prop.cascade
+            and len(mapper.tables) == 1
+            and mapper.version_id_col is None
+            and not mapper.dispatch.before_update
+            and not mapper.dispatch.after_update
+        )
+
+    def _update_collection_sync(
+        self,
+        session: Session,
+        prop: RelationshipProperty,
+        pk: Any,
+        added: Set[Any],
+        removed: Set[Any],
+    ) -> None:
+        local = prop.synchronize_pairs[0][1]
+        pks = bindparam("pks", expanding=True)
+
+        if prop.secondary is not None:
+            remote = prop.secondary_synchronize_pairs[0][1]
+            if removed:
+                stmt = delete(prop.secondary).where(local == pk, remote.in_(pks))
+                for chunk in self._chunk(removed):
+                    session.execute(stmt, {"pks": chunk})
+            if added:
+                rows = [{local.key: pk, remote.key: value} for value in added]
+                session.execute(insert(prop.secondary), rows)
+            return
+
+        related_pk = prop.mapper.primary_key[0]
+        if removed:
+            stmt = (
+                update(local.table)
+                .where(related_pk.in_(pks), local == pk)
+                .values({local: None})
+            )
+            for chunk in self._chunk(removed):
+                session.execute(stmt, {"pks": chunk})
+        if added:
+            stmt = update(local.table).where(related_pk.in_(pks)).values({local: pk})
+            for chunk in self._chunk(added):
+                session.execute(stmt, {"pks": chunk})
+
+    def _chunk(self, values: Set[Any]) -> Iterator[List[Any]]:
+        items = list(values)
+        for start in range(0, len(items), DELETE_CHUNK_SIZE):
+            yield items[start : start + DELETE_CHUNK_SIZE]
+
+    def _get_pks(self, key: str, objects: List[Any]) -> Set[Any]:
+        mapper = inspect(self.model).relationships[key].mapper
+        pk = mapper.get_property_by_column(mapper.primary_key[0]).key
+        return {getattr(obj, pk) for obj in objects}
+
+    def _get_related(self, session: Session, key: str, objects: List[Any]) -> List[Any]:
+        # Submitted objects come from another session and may be stale
+        mapper = inspect(self.model).relationships[key].mapper
+        stmt = select(mapper.class_).where(
+            mapper.primary_key[0].in_(self._get_pks(key, objects))
+        )
+        return session.execute(stmt).scalars().all()
+
+    def _get_collection_pks(self, session: Session, pk: Any, key: str) -> Set[Any]:
+        mapper = inspect(self.model).relationships[key].mapper
+        related_pk = mapper.primary_key[0]
+        stmt = (
+            select(related_pk)
+            .join_from(self.model, getattr(self.model, key))
+            .where(self.pk_column == pk)
+        )
+        return set(session.execute(stmt).scalars())
 
     async def scaffold_form(self) -> Type[Form]:
-        return await get_model_form(model=self.model, engine=self.engine)
+        # The form class is built once, only relationship choices change
+        if self._form_class is None:
+            self._form_class = self._build_form_class()
+        return self._form_class
+
+    async def load_form_choices(self, form: Form) -> None:
+        """Load the related objects to choose from in relationship fields.
+
+        Fields in `form_ajax_refs` only load the selected objects.
+        """
+
+        selected = {}
+        for prop in self._form_relationships:
+            if prop.key not in self._form_ajax_loaders:
+                continue
+
+            form_field = form[prop.key]
+            if form_field.selected_pks:
+                selected[prop.key] = form_field.selected_pks
+            else:
+                # Current value of the edited object
+                data = form_field.data
+                data = data if isinstance(data, list) else [data]
+                loader = self._form_ajax_loaders[prop.key]
+                form_field._object_list = [(loader.get_pk(o), o) for o in data if o]
+
+        loaders = self._form_ajax_loaders
+        if not selected and all(p.key in loaders for p in self._form_relationships):
+            return
+
+        choices = await self._run_with_session(self._load_form_choices_sync, selected)
+        for key, object_list in choices.items():
+            form[key]._object_list = object_list
+
+    async def lookup(
+        self, name: str, term: str, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """Search related objects of the `form_ajax_refs` field `name`.
+
+        Returns a page of `{"id", "text"}` results and the next page cursor.
+        """
+
+        loader = self._form_ajax_loaders[name]
+        position = Cursor.decode(cursor) if cursor else None
+        return await self._run_with_session(loader.get_list, term, position)
+
+    async def import_csv(self, file: BinaryIO) -> ImportReport:
+        """Validate and insert the rows of a CSV file.
+
+        The file is read in batches of `import_batch_size` rows, each row is
+        validated with the form of `scaffold_import_form`.
+        Valid rows of a batch are inserted with a single `INSERT`,
+        when the database rejects it the rows are inserted one by one
+        and the rejected rows are reported. Columns missing from the file
+        are not inserted, so their defaults apply.
+
+        Raises:
+            ValueError: The file is empty or has unknown columns.
+        """
+
+        start = time.perf_counter()
+        Form = await self.scaffold_import_form()
+        reader = csv.reader(codecs.getreader("utf-8-sig")(file))
+
+        header: Optional[List[str]] = await self.workers.run(next, reader, None)
+        if not header:
+            raise ValueError("The CSV file is empty.")
+
+        fields = [
+            name for name in dir(Form) if isinstance(getattr(Form, name), UnboundField)
+        ]
+        unknown = [name for name in header if name not in fields]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}.")
+
+        # Fields of missing columns are removed, they would validate empty values
+        missing = {name: None for name in fields if name not in header}
+        form_class = type(Form.__name__, (Form,), missing)
+
+        report = ImportReport()
+        try:
+            while True:
+                rows = await self.workers.run(
+                    self._read_import_batch_sync, reader, header, form_class, report
+                )
+                if rows is None:
+                    break
+                if rows:
+                    report.inserted += await self._run_with_session(
+                        self._insert_rows_sync, rows, report
+                    )
+        finally:
+            # Batches inserted before a failure stay committed
+            if report.inserted:
+                self.count_strategy.invalidate(self)
+                await self._invalidate_list_cache()
+
+        report.seconds = time.perf_counter() - start
+        return report
+
+    async def scaffold_import_form(self) -> Type[Form]:
+        """Form of `Create` page with the foreign key columns
+        of many-to-one relationships instead of relationship fields.
+        """
+
+        if self._import_form_class is None:
+            Form = await self.scaffold_form()
+            mapper = inspect(self.model)
+            only: Dict[str, None] = {}
+            for name, value in vars(Form).items():
+                if not isinstance(value, UnboundField):
+                    continue
+
+                prop = mapper.attrs[name]
+                if not isinstance(prop, RelationshipProperty):
+                    only[name] = None
+                elif prop.direction.name == "MANYTOONE":
+                    for column in prop.local_columns:
+                        only[mapper.get_property_by_column(column).key] = None
+
+            self._import_form_class = get_model_form(
+                model=self.model, only=list(only), foreign_keys=True
+            )
+
+        return self._import_form_class
+
+    def _read_import_batch_sync(
+        self,
+        reader: Iterator[List[str]],
+        header: List[str],
+        form_class: Type[Form],
+        report: ImportReport,
+    ) -> Optional[List[Tuple[int, Dict[str, Any]]]]:
+        lines = list(itertools.islice(reader, self.import_batch_size))
+        if not lines:
+            return None
+
+        mapper = inspect(self.model)
+        rows = []
+        for line in lines:
+            report.rows += 1
+            form = form_class(ImmutableMultiDict(list(zip(header, line))))
+            if form.validate():
+                values = {
+                    mapper.attrs[k].columns[0].key: v for k, v in form.data.items()
+                }
+                rows.append((report.rows, values))
+            else:
+                report.add_error(report.rows, form.errors)
+
+        return rows
+
+    def _insert_rows_sync(
+        self,
+        session: Session,
+        rows: List[Tuple[int, Dict[str, Any]]],
+        report: ImportReport,
+    ) -> int:
+        table = inspect(self.model).local_table
+        try:
+            session.execute(insert(table), [values for _, values in rows])
+            session.commit()
+            return len(rows)
+        except DBAPIError:
+            session.rollback()
+
+        # Rows are inserted one by one to report the rows the database rejects
+        inserted = 0
+        for row, values in rows:
+            try:
+                session.execute(insert(table), values)
+                session.commit()
+            except DBAPIError as exc:
+                session.rollback()
+                report.add_error(row, {"database": [str(exc.orig)]})
+            else:
+                inserted += 1
+
+        return inserted
+
+    def _build_ajax_loader(
+        self, name: str, options: Dict[str, Any]
+    ) -> QueryAjaxModelLoader:
+        prop = self.get_model_attr(name)
+        if not isinstance(prop, RelationshipProperty):
+            raise InvalidColumnError(
+                f"Model '{self.model.__name__}' has no relationship '{name}'."
+            )
+
+        return QueryAjaxModelLoader(prop.key, prop, **options)
+
+    def _build_form_class(self) -> Type[Form]:
+        only = [self.get_model_attr(attr).key for attr in self.form_columns]
+        exclude = [self.get_model_attr(attr).key for attr in self.form_excluded_columns]
+        form_class = get_model_form(
+            model=self.model,
+            only=only,
+            exclude=exclude,
+            ajax_loaders=self._form_ajax_loaders,
+        )
+
+        self._form_relationships = tuple(
+            prop
+            for prop in inspect(self.model).relationships
+            if hasattr(form_class, prop.key)
+        )
+        return form_class
+
+    def _load_form_choices_sync(
+        self, session: Session, selected: Dict[str, List[str]]
+    ) -> Dict[str, List[Tuple[str, Any]]]:
+        choices = {}
+        for prop in self._form_relationships:
+            if prop.key in selected:
+                loader = self._form_ajax_loaders[prop.key]
+                choices[prop.key] = loader.get_objects(session, selected[prop.key])
+                continue
+            elif prop.key in self._form_ajax_loaders:
+                continue
+
+            mapper = prop.mapper
+            pk = mapper.get_property_by_column(mapper.primary_key[0]).key
+            objects = session.execute(select(mapper.class_)).scalars().all()
+            choices[prop.key] = [(str(getattr(obj, pk)), obj) for obj in objects]
+
+        return choices
@@ -1,8 +1,20 @@
+import base64
+import binascii
+import datetime
+import json
 from dataclasses import dataclass, field
-from typing import Any, List
+from decimal import Decimal
+from enum import Enum
+from typing import Any, List, NamedTuple, Optional, Tuple
+from uuid import UUID
 
 from starlette.datastructures import URL
 
+from sqladmin.exceptions import InvalidCursorError
+
+# Stands for the primary key in row URL templates
+PK_PLACEHOLDER = "__pk__"
+
 
 @dataclass
 class PageControl:
@@ -10,23 +22,89 @@ class PageControl:
     url: str
 
 
+class RowView(NamedTuple):
+    """A row of `List` page with everything the template displays."""
+
+    pk: str
+    cells: Tuple[Any, ...]
+    details_url: str
+    edit_url: str
+    delete_url: str
+
+
+@dataclass
+class Cursor:
+    """Opaque position in a keyset paginated list.
+
+    Holds the values of the sort columns of the row the page starts after
+    (or before, when `backwards` is set) and the page number for display.
+    """
+
+    page: int
+    values: List[Any]
+    backwards: bool = False
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [self.page, int(self.backwards), self.values],
+            default=_json_default,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            page, backwards, values = json.loads(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, TypeError, ValueError):
+            raise InvalidCursorError("Invalid pagination cursor.")
+
+        if not isinstance(page, int) or page < 1 or not isinstance(values, list):
+            raise InvalidCursorError("Invalid pagination cursor.")
+
+        return cls(page=page, values=values, backwards=bool(backwards))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+
+    raise TypeError(f"Cannot use {type(value).__name__} value in a cursor.")
+
+
 @dataclass
 class Pagination:
     rows: List[Any]
     page: int
     page_size: int
-    count: int
+    count: Optional[int]
+    count_estimated: bool = False
+    has_more: Optional[bool] = None
     page_controls: List[PageControl] = field(default_factory=list)
     max_page_controls: int = 7
+    keyset: bool = False
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+    row_views: List[RowView] = field(default_factory=list)
 
     @property
     def has_previous(self) -> bool:
+        if self.keyset:
+            return self.previous_cursor is not None
+
         return self.page > 1
 
     @property
     def has_next(self) -> bool:
-        next_page = (self.page + 1) * self.page_size
-        return next_page <= self.count or next_page - self.count < self.page_size
+        if self.keyset:
+            return self.next_cursor is not None
+
+        return self._page_exists(self.page + 1)
 
     @property
     def previous_page(self) -> PageControl:
@@ -45,6 +123,10 @@ class Pagination:
         raise RuntimeError("Next page not found.")
 
     def add_pagination_urls(self, base_url: URL) -> None:
+        if self.keyset:
+            self._add_cursor_controls(base_url)
+            return
+
         # Previous pages
         for p in range(self.page - min(self.max_page_controls, 3), self.page):
             if p > 0:
@@ -55,8 +137,7 @@ class Pagination:
 
         # Next pages
         for p in range(self.page + 1, self.page + self.max_page_controls + 1):
-            current = p * self.page_size
-            if current <= self.count or current - self.count < self.page_size:
+            if self._page_exists(p):
                 self._add_page_control(base_url, p)
 
         # Rebalance previous pages if next pages less than 3
@@ -66,9 +147,39 @@ class Pagination:
 
         self.page_controls.sort(key=lambda p: p.number)
 
+    def _page_exists(self, page: int) -> bool:
+        # Rows fetched past the page tell if the next page exists without a count
+        if self.has_more is not None:
+            if page == self.page + 1 or not self.has_more and page > self.page:
+                return self.has_more
+
+        if self.count is None:
+            return False
+
+        current = page * self.page_size
+        return current <= self.count or current - self.count < self.page_size
+
     def _add_page_control(self, base_url: URL, page: int) -> None:
         self.max_page_controls -= 1
 
         url = str(base_url.include_query_params(page=page))
         page_control = PageControl(number=page, url=url)
         self.page_controls.append(page_control)
+
+    def _add_cursor_controls(self, base_url: URL) -> None:
+        # Keyset pages can only link to their neighbours,
+        # pages are numbered only for display.
+        first_page_url = base_url.remove_query_params(["page", "cursor"])
+
+        if self.previous_cursor is not None:
+            if self.page - 1 > 1:
+                url = first_page_url.include_query_params(cursor=self.previous_cursor)
+            else:
+                url = first_page_url
+            self.page_controls.append(PageControl(self.page - 1, str(url)))
+
+        self.page_controls.append(PageControl(self.page, str(base_url)))
+
+        if self.next_cursor is not None:
+            url = first_page_url.include_query_params(cursor=self.next_cursor)
+            self.page_controls.append(PageControl(self.page + 1, str(url)))
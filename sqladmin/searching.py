@@ -0,0 +1,164 @@
+import datetime
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from sqlalchemy import String, cast, false, func, or_, select, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.elements import ClauseElement
+
+if TYPE_CHECKING:
+    from sqladmin.models import ModelAdmin
+
+
+__all__ = [
+    "ContainsSearch",
+    "FullTextSearch",
+    "PrefixSearch",
+    "SearchBackend",
+]
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def _is_string(column: InstrumentedAttribute) -> bool:
+    return isinstance(column.type, String)
+
+
+def _coerce(column: InstrumentedAttribute, term: str) -> Any:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:  # pragma: no cover
+        return None
+
+    try:
+        if python_type is bool:
+            return None
+        elif python_type in (datetime.datetime, datetime.date, datetime.time):
+            return python_type.fromisoformat(term)
+        return python_type(term)
+    except (TypeError, ValueError, ArithmeticError):
+        return None
+
+
+class SearchBackend:
+    """Base class for searching rows of `List` page
+    in the `column_searchable_list` columns.
+    """
+
+    def validate(self, model_admin: "ModelAdmin") -> None:
+        """Check the backend can search `model_admin` when it is registered."""
+
+    def get_clause(self, model_admin: "ModelAdmin", term: str) -> ClauseElement:
+        """`WHERE` clause of the rows matching `term`."""
+
+        raise NotImplementedError()  # pragma: no cover
+
+
+class PrefixSearch(SearchBackend):
+    """Match text columns starting with the search term with `LIKE 'term%'`,
+    and other columns equal to it. This is the default backend.
+
+    Both can use btree indexes of the columns, on PostgreSQL
+    text columns need a `text_pattern_ops` index, unless the database
+    uses the `C` collation.
+    """
+
+    def get_clause(self, model_admin: "ModelAdmin", term: str) -> ClauseElement:
+        clauses = []
+        for column in model_admin.search_columns:
+            if _is_string(column):
+                # The pattern is a single value, as required to use the index
+                clauses.append(column.like(_escape_like(term) + "%", escape="/"))
+                continue
+
+            value = _coerce(column, term)
+            if value is not None:
+                clauses.append(column == value)
+
+        return or_(false(), *clauses)
+
+
+class ContainsSearch(SearchBackend):
+    """Match columns containing the search term anywhere,
+    ignoring case, with `ILIKE '%term%'`.
+
+    The columns are scanned, which is slow on large tables.
+    """
+
+    def get_clause(self, model_admin: "ModelAdmin", term: str) -> ClauseElement:
+        pattern = f"%{_escape_like(term)}%"
+        return or_(
+            false(),
+            *[
+                cast(column, String).ilike(pattern, escape="/")
+                for column in model_admin.search_columns
+            ],
+        )
+
+
+class FullTextSearch(SearchBackend):
+    """Match rows with the full-text search of the database.
+
+    On PostgreSQL the columns are matched with
+    `to_tsvector(config, column) @@ plainto_tsquery(config, term)`,
+    `tsvector` columns are matched directly. A GIN index on the same
+    expression, or on the `tsvector` column, is used by the query.
+
+    On SQLite rows are matched in `fts_table`, an FTS5 table whose
+    `rowid` is the primary key of the model, usually an external
+    content table of the model table.
+    """
+
+    def __init__(self, config: str = "simple", fts_table: Optional[str] = None) -> None:
+        self.config = config
+        self.fts_table = fts_table
+
+    def validate(self, model_admin: "ModelAdmin") -> None:
+        dialect = model_admin.engine.dialect.name
+        supported = dialect in ("postgresql", "sqlite")
+        assert supported, f"Full-text search is not supported for '{dialect}'."
+        if dialect == "sqlite":
+            assert self.fts_table is not None, "FTS5 search needs fts_table on SQLite."
+
+    def get_clause(self, model_admin: "ModelAdmin", term: str) -> ClauseElement:
+        dialect = model_admin.engine.dialect.name
+
+        if dialect == "postgresql":
+            return self._get_postgresql_clause(model_admin.search_columns, term)
+        elif dialect == "sqlite":
+            return self._get_sqlite_clause(model_admin, term)
+
+        raise NotImplementedError(f"Full-text search is not supported for '{dialect}'.")
+
+    def _get_postgresql_clause(
+        self, columns: List[InstrumentedAttribute], term: str
+    ) -> ClauseElement:
+        query = func.plainto_tsquery(self.config, term)
+
+        clauses = []
+        for column in columns:
+            if isinstance(column.type, TSVECTOR):
+                clauses.append(column.op("@@")(query))
+            else:
+                vector = func.to_tsvector(self.config, column)
+                clauses.append(vector.op("@@")(query))
+
+        return or_(false(), *clauses)
+
+    def _get_sqlite_clause(self, model_admin: "ModelAdmin", term: str) -> ClauseElement:
+        assert self.fts_table is not None, "FTS5 search needs fts_table on SQLite."
+
+        # Each word is quoted so the term cannot use the FTS5 query syntax
+        query = " ".join('"' + word.replace('"', '""') + '"' for word in term.split())
+        if not query:
+            return false()
+
+        table = model_admin.engine.dialect.identifier_preparer.quote(self.fts_table)
+        rowids = (
+            select(text("rowid"))
+            .select_from(text(table))
+            .where(text(f"{table} MATCH :fts_query").bindparams(fts_query=query))
+        )
+        return model_admin.pk_column.in_(rowids)
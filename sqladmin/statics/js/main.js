@@ -3,18 +3,85 @@ $(document).on('shown.bs.modal', '#modal-delete', function (event) {
   var element = $(event.relatedTarget);
 
   var name = element.data("name");
-  var pk = element.data("pk");
-  $("#modal-delete-text").text("This will permanently delete " + name + " " + pk + " ?");
+  var pks = null;
 
-  $("#modal-delete-button").attr("data-url", element.data("url"));
+  if (element.is('#bulk-delete')) {
+    pks = $('.select-row:checked').map(function () { return this.value; }).get();
+    $("#modal-delete-text").text("This will permanently delete " + pks.length + " " + name + " ?");
+  } else {
+    var pk = element.data("pk");
+    $("#modal-delete-text").text("This will permanently delete " + name + " " + pk + " ?");
+  }
+
+  $("#modal-delete-button").attr("data-url", element.data("url")).data("pks", pks);
 });
 
 $(document).on('click','#modal-delete-button',function() {
+  var pks = $(this).data('pks');
+
   $.ajax({
     url: $(this).attr('data-url'),
     method: 'DELETE',
+    data: pks ? { pks: pks } : null,
+    traditional: true,
     success: function(result) {
         window.location.href = result;
     }
   });
 });
+
+// Handle row selection for bulk actions
+$(document).on('change', '#select-all', function () {
+  $('.select-row').prop('checked', this.checked).trigger('change');
+});
+
+$(document).on('change', '.select-row', function () {
+  $('#bulk-delete').toggleClass('disabled', !$('.select-row:checked').length);
+});
+
+// Search options of relationship fields from the lookup endpoint
+$(document).ready(function () {
+  $('select[data-role="ajax-select"]').each(function () {
+    var select = $(this);
+    var search = $('<input type="search" class="form-control mb-2" placeholder="Search...">');
+    var more = $('<button type="button" class="btn btn-link px-0">Load more</button>').hide();
+    var nextCursor = null;
+    var timer = null;
+
+    select.before(search);
+    select.after(more);
+
+    function load(term, cursor) {
+      var params = { q: term };
+      if (cursor) {
+        params.cursor = cursor;
+      }
+
+      $.getJSON(select.data('url'), params, function (data) {
+        if (!cursor) {
+          select.find('option:not(:selected)').remove();
+        }
+
+        $.each(data.results, function (_, result) {
+          if (!select.find('option[value="' + result.id + '"]').length) {
+            select.append($('<option>').val(result.id).text(result.text));
+          }
+        });
+
+        nextCursor = data.next_cursor;
+        more.toggle(nextCursor !== null);
+      });
+    }
+
+    search.on('input', function () {
+      clearTimeout(timer);
+      timer = setTimeout(function () { load(search.val(), null); }, 250);
+    });
+
+    more.on('click', function () {
+      load(search.val(), nextCursor);
+    });
+
+    load('', null);
+  });
+});
@@ -0,0 +1,33 @@
+"""Precompile the bundled templates for `Admin(compiled_templates=...)`.
+
+    python -m sqladmin.templating compiled_templates
+"""
+import argparse
+import os
+from typing import Union
+
+from jinja2 import Environment, PackageLoader
+
+__all__ = [
+    "compile_templates",
+]
+
+
+def compile_templates(target: Union[str, "os.PathLike[str]"]) -> None:
+    """Compile the bundled templates into Python modules in `target`.
+
+    The modules only work with the Jinja2 version that compiled them,
+    compile them again when upgrading Jinja2 or SQLAdmin.
+    """
+
+    # Same options as the Admin environment, autoescape is applied at compile time
+    env = Environment(loader=PackageLoader("sqladmin", "templates"), autoescape=True)
+    env.compile_templates(target, zip=None, ignore_errors=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("target", help="directory to write the compiled templates")
+    args = parser.parse_args()
+
+    compile_templates(args.target)
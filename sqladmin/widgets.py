@@ -3,6 +3,7 @@ from typing import Any
 from wtforms import Field, widgets
 
 __all__ = [
+    "AjaxSelectWidget",
     "DatePickerWidget",
     "DateTimePickerWidget",
     "Select2Widget",
@@ -25,6 +26,23 @@ class Select2Widget(widgets.Select):
         return super().__call__(field, **kwargs)
 
 
+class AjaxSelectWidget(widgets.Select):
+    """
+    Select widget rendering only the selected options,
+    other options are searched from the lookup URL of the field.
+    """
+
+    def __call__(self, field: Field, **kwargs: Any) -> str:
+        kwargs.setdefault("data-role", "ajax-select")
+        kwargs.setdefault("data-url", getattr(field, "lookup_url", ""))
+
+        allow_blank = getattr(field, "allow_blank", False)
+        if allow_blank and not self.multiple:
+            kwargs["data-allow-blank"] = "1"
+
+        return super().__call__(field, **kwargs)
+
+
 class Select2TagsWidget(widgets.TextInput):
     """
     `Select2 <https://github.com/select2/select2>`_ styled text widget.
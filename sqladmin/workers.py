@@ -0,0 +1,106 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+import anyio
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+__all__ = [
+    "WorkerPool",
+    "WorkerStats",
+]
+
+T = TypeVar("T")
+
+# Worker threads of anyio's default limiter
+DEFAULT_WORKER_LIMIT = 40
+
+
+@dataclass(frozen=True)
+class WorkerStats:
+    """Usage of the Admin worker threads.
+
+    `wait_seconds` is the time calls spent queued for a worker thread.
+    """
+
+    limit: float
+    busy: int
+    waiting: int
+    calls: int
+    wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def average_wait_seconds(self) -> float:
+        return self.wait_seconds / self.calls if self.calls else 0.0
+
+
+class WorkerPool:
+    """Worker threads running the database calls of sync engines.
+
+    Calls are limited by a `CapacityLimiter` of the Admin, so they neither
+    take nor wait for the worker threads of the rest of the application.
+    """
+
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self._limiter: Optional[anyio.CapacityLimiter] = None
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        # Limiters can only be created in an event loop
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.limit)
+        return self._limiter
+
+    @classmethod
+    def for_engine(cls, engine: Engine, limit: Optional[float] = None) -> "WorkerPool":
+        """Create a pool sized to the connections `engine` can open unless `limit`."""
+
+        if limit is None:
+            # More threads than connections would only wait for a connection
+            pool = engine.pool
+            # A negative overflow does not limit the connections
+            if isinstance(pool, QueuePool) and pool._max_overflow >= 0:
+                limit = pool.size() + pool._max_overflow
+            else:
+                limit = DEFAULT_WORKER_LIMIT
+
+        return cls(limit)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        queued = time.perf_counter()
+
+        def call() -> T:
+            self._record_wait(time.perf_counter() - queued)
+            return func(*args)
+
+        return await anyio.to_thread.run_sync(call, limiter=self.limiter)
+
+    def _record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._calls += 1
+            self._wait_seconds += seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, seconds)
+
+    def stats(self) -> WorkerStats:
+        busy = waiting = 0
+        if self._limiter is not None:
+            statistics = self._limiter.statistics()
+            busy, waiting = statistics.borrowed_tokens, statistics.tasks_waiting
+
+        with self._lock:
+            return WorkerStats(
+                limit=self.limit,
+                busy=busy,
+                waiting=waiting,
+                calls=self._calls,
+                wait_seconds=self._wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+            )
@@ -1,7 +1,9 @@
-from typing import Any, AsyncGenerator
+import io
+from typing import Any, AsyncGenerator, Dict, List
 
+import anyio
 import pytest
-from sqlalchemy import Column, Date, ForeignKey, Integer, String, func, select
+from sqlalchemy import Column, Date, ForeignKey, Integer, String, event, func, select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, selectinload, sessionmaker
@@ -10,6 +12,7 @@ from starlette.requests import Request
 from starlette.testclient import TestClient
 
 from sqladmin import Admin, ModelAdmin
+from sqladmin.counting import RowCount
 from tests.common import TEST_DATABASE_URI_ASYNC
 
 pytestmark = pytest.mark.anyio
@@ -73,6 +76,7 @@ async def prepare_database() -> AsyncGenerator[None, None]:
 
 class UserAdmin(ModelAdmin, model=User):
     column_list = [User.id, User.name, User.email, User.addresses]
+    can_export = True
     column_labels = {User.email: "Email"}
 
 
@@ -182,6 +186,30 @@ async def test_list_view_multi_page() -> None:
     assert response.text.count('<li class="page-item ">') == 5
 
 
+async def test_list_runs_count_and_rows_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rows_started = anyio.Event()
+    run_query = UserAdmin._run_query
+
+    async def count(self: UserAdmin) -> RowCount:
+        # Would time out if rows were only fetched after the count
+        await rows_started.wait()
+        return RowCount(0)
+
+    async def _run_query(self: UserAdmin, stmt: Any) -> Any:
+        rows_started.set()
+        return await run_query(self, stmt)
+
+    monkeypatch.setattr(UserAdmin, "count", count)
+    monkeypatch.setattr(UserAdmin, "_run_query", _run_query)
+
+    with anyio.fail_after(5):
+        pagination = await admin._find_model_admin("user").list(1, 10)
+
+    assert pagination.count == 0
+
+
 async def test_list_page_permission_actions() -> None:
     for _ in range(10):
         user = User(name="John Doe")
@@ -255,6 +283,30 @@ async def test_detail_page() -> None:
     assert response.text.count("Delete") == 2
 
 
+async def test_list_and_detail_page_etag(monkeypatch: pytest.MonkeyPatch) -> None:
+    class VersionedUserAdmin(UserAdmin):
+        column_version = User.name
+
+    monkeypatch.setitem(admin._model_admins, "user", VersionedUserAdmin())
+
+    user = User(name="Amin Alaee")
+    session.add(user)
+    await session.commit()
+
+    with TestClient(app) as client:
+        for url in ["/admin/user/list", "/admin/user/details/1"]:
+            etag = client.get(url).headers["etag"]
+            response = client.get(url, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+
+    user.name = "Jane Doe"
+    await session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/details/1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+
 async def test_column_labels() -> None:
     user = User(name="Foo")
     session.add(user)
@@ -435,6 +487,15 @@ async def test_not_found_edit_page() -> None:
     assert response.status_code == 404
 
 
+async def test_not_found_edit_submit() -> None:
+    with TestClient(app) as client:
+        response = client.post("/admin/user/edit/1", data={"name": "Joe"})
+        assert response.status_code == 404
+
+        response = client.post("/admin/address/edit/1", data={})
+        assert response.status_code == 404
+
+
 async def test_update_get_page() -> None:
     user = User(name="Joe")
     session.add(user)
@@ -505,3 +566,127 @@ async def test_update_submit_form() -> None:
         response = client.post("/admin/user/edit/1", data=data)
 
     assert response.status_code == 400
+
+
+async def test_ajax_lookup_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    class AjaxUserAdmin(UserAdmin):
+        form_ajax_refs = {"addresses": {"fields": ["id"]}}
+
+    monkeypatch.setitem(admin._model_admins, "user", AjaxUserAdmin())
+
+    session.add_all([Address(), Address()])
+    await session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/lookup/addresses?q=2")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "results": [{"id": "2", "text": "Address 2"}],
+            "next_cursor": None,
+        }
+
+        data = {"name": "Jack", "addresses": ["1", "2"]}
+        response = client.post("/admin/user/create", data=data)
+        assert response.status_code == 302
+
+    stmt = select(Address).where(Address.user_id == 1)
+    result = await session.execute(stmt)
+    assert len(result.scalars().all()) == 2
+
+
+async def test_update_model_query_count() -> None:
+    user = User(name="Joe")
+    session.add_all([user, Address(user=user)])
+    await session.commit()
+
+    result = await session.execute(select(Address))
+    address = result.scalar_one()
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    user_admin = admin._model_admins["user"]
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await user_admin.update_model(1, {"name": "Jack"})
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE users")
+
+        statements.clear()
+        await user_admin.update_model(1, {"name": "Jane", "addresses": [address]})
+        assert len(statements) == 2
+        assert statements[1].startswith("UPDATE users")
+
+        statements.clear()
+        await user_admin.update_model(1, {"name": "Jane", "addresses": []})
+        assert statements[-1].startswith("UPDATE addresses")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    result = await session.execute(select(User.name))
+    assert result.scalar_one() == "Jane"
+
+    result = await session.execute(select(Address.user_id))
+    assert result.scalar_one() is None
+
+
+async def test_bulk_delete_endpoint() -> None:
+    user = User(name="Joe")
+    session.add_all([user, Address(user=user), Address(user=user)])
+    await session.commit()
+
+    with TestClient(app) as client:
+        data: Dict[str, Any] = {"pks": ["1"]}
+        response = client.request("DELETE", "/admin/user/delete", data=data)
+
+    assert response.status_code == 200
+
+    result = await session.execute(select(func.count(User.id)))
+    assert result.scalar_one() == 0
+
+    result = await session.execute(select(Address.user_id))
+    assert result.scalars().all() == [None, None]
+
+    assert await admin._model_admins["address"].delete_models([1, 2]) == 2
+
+
+async def test_export_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sqladmin.models.EXPORT_BATCH_SIZE", 2)
+
+    session.add_all([User(name=f"User {i}") for i in range(5)])
+    await session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/export?format=csv")
+
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert lines[0] == "id,name,Email,addresses"
+    assert lines[1:] == [f"{i + 1},User {i},," for i in range(5)]
+
+    chunks = [chunk async for chunk in admin._model_admins["user"].export("jsonl")]
+    assert len(chunks) == 3
+
+
+async def test_import_csv(monkeypatch: pytest.MonkeyPatch) -> None:
+    user_admin = admin._model_admins["user"]
+    monkeypatch.setattr(user_admin, "import_batch_size", 2)
+
+    file = io.BytesIO(
+        b"\xef\xbb\xbfname,date_of_birth\nJoe,2000-01-01\nBob,bad\nAnn,\n"
+    )
+    report = await user_admin.import_csv(file)
+
+    assert (report.rows, report.inserted, report.error_count) == (3, 2, 1)
+    assert report.errors[0][0] == 2
+    assert "date_of_birth" in report.errors[0][1]
+
+    result = await session.execute(select(User.name).order_by(User.id))
+    assert result.scalars().all() == ["Joe", "Ann"]
+
+    with pytest.raises(ValueError):
+        await user_admin.import_csv(io.BytesIO(b"name,password\n"))
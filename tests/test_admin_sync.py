@@ -1,5 +1,10 @@
-from typing import Any, Generator
+import io
+import json
+import re
+from datetime import date
+from typing import Any, Dict, Generator, List, Tuple
 
+import anyio
 import pytest
 from sqlalchemy import (
     Column,
@@ -7,17 +12,22 @@ from sqlalchemy import (
     ForeignKey,
     Integer,
     String,
+    Table,
     create_engine,
+    event,
     func,
     select,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, relationship, sessionmaker
+from sqlalchemy.orm import Session, relationship, sessionmaker, validates
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.testclient import TestClient
 
 from sqladmin import Admin, ModelAdmin
+from sqladmin.caching import MemoryListCache
+from sqladmin.counting import EstimatedCount, NoCount, RowCount
 from tests.common import TEST_DATABASE_URI_SYNC
 
 Base = declarative_base()  # type: Any
@@ -60,11 +70,51 @@ class Address(Base):
         return f"Address {self.id}"
 
 
+movie_tags = Table(
+    "movie_tags",
+    Base.metadata,
+    Column("movie_id", ForeignKey("movies.id"), primary_key=True),
+    Column("tag_id", ForeignKey("tags.id"), primary_key=True),
+)
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True)
+
+
 class Movie(Base):
     __tablename__ = "movies"
 
     id = Column(Integer, primary_key=True)
 
+    tags = relationship("Tag", secondary=movie_tags)
+
+
+class Person(Base):
+    __tablename__ = "people"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+    passport = relationship("Passport", back_populates="person", uselist=False)
+
+
+class Passport(Base):
+    __tablename__ = "passports"
+
+    id = Column(Integer, primary_key=True)
+    number = Column(String, unique=True)
+    country = Column(String, nullable=False, server_default="NL")
+    person_id = Column(Integer, ForeignKey("people.id"))
+
+    person = relationship("Person", back_populates="passport")
+
+    @validates("number")
+    def validate_number(self, key: str, value: str) -> str:
+        return value.upper()
+
 
 @pytest.fixture(autouse=True, scope="function")
 def prepare_database() -> Generator[None, None, None]:
@@ -75,6 +125,7 @@ def prepare_database() -> Generator[None, None, None]:
 
 class UserAdmin(ModelAdmin, model=User):
     column_list = [User.id, User.name, User.email, User.addresses]
+    can_export = True
     column_labels = {User.email: "Email"}
 
 
@@ -141,6 +192,88 @@ def test_list_view_single_page() -> None:
     assert response.text.count('<li class="page-item disabled">') == 2
 
 
+def test_list_view_row_views() -> None:
+    user = User(name="Joe", email="joe@example.com")
+    session.add_all([user, Address(user=user), Address(user=user)])
+    session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+
+    assert response.status_code == 200
+    assert "<td>Address 1, Address 2</td>" in response.text
+    assert 'href="http://testserver/admin/user/details/1"' in response.text
+    assert 'href="http://testserver/admin/user/edit/1"' in response.text
+    assert 'data-url="http://testserver/admin/user/delete/1"' in response.text
+
+    user_admin = admin._model_admins["user"]
+    url_templates = {
+        "details": "/user/details/__pk__",
+        "edit": "/user/edit/__pk__",
+        "delete": "/user/delete/__pk__",
+    }
+    row = User(
+        id="a b",
+        name="Joe",
+        email="joe@example.com",
+        addresses=[Address(id=1), Address(id=2)],
+    )
+    (view,) = user_admin.get_row_views([row], url_templates)
+
+    assert view.pk == "a b"
+    assert view.cells == ("a b", "Joe", "joe@example.com", "Address 1, Address 2")
+    assert view.details_url == "/user/details/a%20b"
+    assert view.edit_url == "/user/edit/a%20b"
+    assert view.delete_url == "/user/delete/a%20b"
+
+
+def test_list_view_get_attr_value_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    class MaskedUserAdmin(UserAdmin):
+        def get_attr_value(self, obj: Any, attr: Any) -> Any:
+            if attr.key == "email":
+                return "hidden"
+            return super().get_attr_value(obj, attr)
+
+    monkeypatch.setitem(admin._model_admins, "user", MaskedUserAdmin())
+
+    session.add(User(name="Joe", email="joe@example.com"))
+    session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+        assert "<td>hidden</td>" in response.text
+        assert "joe@example.com" not in response.text
+
+        response = client.get("/admin/user/export?format=csv")
+        assert response.text.splitlines()[1] == "1,Joe,hidden,"
+
+
+def test_list_view_get_columns_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    class ColumnsUserAdmin(UserAdmin):
+        def get_list_columns(self) -> List[Tuple[str, Any]]:
+            return [("Full name", User.name), ("Mail", User.email.prop)]
+
+        def get_details_columns(self) -> List[Tuple[str, Any]]:
+            return [*super().get_details_columns(), ("Mail", User.email)]
+
+    monkeypatch.setitem(admin._model_admins, "user", ColumnsUserAdmin())
+
+    session.add(User(name="Joe", email="joe@example.com"))
+    session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+        assert "<th>Full name</th>" in response.text
+        assert "<th>Mail</th>" in response.text
+        assert "<td>joe@example.com</td>" in response.text
+
+        response = client.get("/admin/user/export?format=csv")
+        assert response.text.splitlines() == ["Full name,Mail", "Joe,joe@example.com"]
+
+        response = client.get("/admin/user/details/1")
+        assert "<td>Mail</td>" in response.text
+
+
 def test_list_view_multi_page() -> None:
     for _ in range(45):
         user = User(name="John Doe")
@@ -184,6 +317,495 @@ def test_list_view_multi_page() -> None:
     assert response.text.count('<li class="page-item ">') == 5
 
 
+def test_list_view_single_thread_hop(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    run_sync = anyio.to_thread.run_sync
+
+    async def counting_run_sync(func: Any, *args: Any, **kwargs: Any) -> Any:
+        calls.append(func)
+        return await run_sync(func, *args, **kwargs)
+
+    monkeypatch.setattr(anyio.to_thread, "run_sync", counting_run_sync)
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+
+    assert response.status_code == 200
+    assert len(calls) == 1
+
+
+def test_list_and_details_load_only_displayed_columns() -> None:
+    user = User(name="Daniel", email="daniel@example.com", birthdate=None)
+    session.add(user)
+    session.add(Address(user=user))
+    session.commit()
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with TestClient(app) as client:
+            response = client.get("/admin/user/list")
+            assert response.status_code == 200
+
+            response = client.get("/admin/address/details/1")
+            assert response.status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    user_rows = [s for s in statements if "FROM users" in s and "count" not in s]
+    assert "users.email" in user_rows[0]
+    assert "users.birthdate" not in user_rows[0]
+
+    address_rows = [s for s in statements if "FROM addresses" in s]
+    assert "addresses.user_id" in address_rows[-1]
+
+
+def test_column_always_load(monkeypatch: pytest.MonkeyPatch) -> None:
+    class BirthdateUserAdmin(UserAdmin):
+        column_always_load = [User.birthdate]
+
+    monkeypatch.setitem(admin._model_admins, "user", BirthdateUserAdmin())
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with TestClient(app) as client:
+            response = client.get("/admin/user/list")
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert any("users.birthdate" in s for s in statements)
+
+
+def test_list_view_keyset_pagination(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Every user has a name, as keyset pagination requires
+    monkeypatch.setattr(User.__table__.c.name, "nullable", False)
+
+    class KeysetUserAdmin(UserAdmin):
+        pagination_mode = "keyset"
+        column_default_sort = (User.name, True)
+
+    monkeypatch.setitem(admin._model_admins, "user", KeysetUserAdmin())
+
+    for i in range(25):
+        session.add(User(name=f"User {i:02}"))
+    session.commit()
+
+    def get_page(url: str) -> Tuple[str, List[str]]:
+        with TestClient(app) as client:
+            response = client.get(url)
+
+        assert response.status_code == 200
+        return response.text, re.findall(r"<td>(User \d+)</td>", response.text)
+
+    text, names = get_page("/admin/user/list")
+    assert names == [f"User {i:02}" for i in range(24, 14, -1)]
+    assert text.count('<li class="page-item disabled">') == 1
+
+    next_url = re.findall(r'class="page-link" href="([^"]*cursor=[^"]*)"', text)[-1]
+    text, names = get_page(next_url)
+    assert names == [f"User {i:02}" for i in range(14, 4, -1)]
+
+    next_url = re.findall(r'class="page-link" href="([^"]*cursor=[^"]*)"', text)[-1]
+    text, names = get_page(next_url)
+    assert names == [f"User {i:02}" for i in range(4, -1, -1)]
+    assert "Showing <span>21</span> to <span>25</span>" in text
+    assert text.count('<li class="page-item disabled">') == 1
+
+    previous_url = re.findall(r'class="page-link" href="([^"]*cursor=[^"]*)"', text)[0]
+    text, names = get_page(previous_url)
+    assert names == [f"User {i:02}" for i in range(14, 4, -1)]
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list?cursor=invalid")
+
+    assert response.status_code == 400
+
+
+def test_list_view_count_strategies(monkeypatch: pytest.MonkeyPatch) -> None:
+    for _ in range(15):
+        session.add(User(name="John Doe"))
+    session.commit()
+
+    monkeypatch.setattr(UserAdmin, "count_strategy", NoCount())
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+
+    assert "Showing <span>1</span> to <span>10</span> of many items" in response.text
+    assert response.text.count('<li class="page-item disabled">') == 1
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list?page=2")
+
+    assert (
+        "Showing <span>11</span> to <span>15</span> of <span>15</span> items"
+        in response.text
+    )
+    assert response.text.count('<li class="page-item disabled">') == 1
+
+    monkeypatch.setattr(UserAdmin, "count_strategy", EstimatedCount(threshold=10))
+    monkeypatch.setattr(EstimatedCount, "estimate", lambda *args: 1000)
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+
+    assert (
+        "Showing <span>1</span> to <span>10</span> of about <span>1000</span> items"
+        in response.text
+    )
+
+
+def test_list_view_etag(monkeypatch: pytest.MonkeyPatch) -> None:
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+    assert "etag" not in response.headers
+
+    class VersionedUserAdmin(UserAdmin):
+        column_version = User.name
+
+    monkeypatch.setitem(admin._model_admins, "user", VersionedUserAdmin())
+
+    user = User(name="John Doe")
+    session.add(user)
+    session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        response = client.get("/admin/user/list", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.text == ""
+
+        # Other pages have their own rows
+        response = client.get(
+            "/admin/user/list?page=2", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+        user.name = "Jane Doe"
+        session.commit()
+        response = client.get("/admin/user/list", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+        etag = response.headers["etag"]
+        session.add(User(name="John Doe"))
+        session.commit()
+        response = client.get("/admin/user/list", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+
+def test_list_view_etag_skips_page_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    class VersionedUserAdmin(UserAdmin):
+        column_version = "name"
+        pagination_mode = "keyset"
+
+    monkeypatch.setitem(admin._model_admins, "user", VersionedUserAdmin())
+
+    session.add(User(name="John Doe", addresses=[Address()]))
+    session.commit()
+
+    with TestClient(app) as client:
+        etag = client.get("/admin/user/list").headers["etag"]
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with TestClient(app) as client:
+            response = client.get(
+                "/admin/user/list", headers={"If-None-Match": f"other, {etag}"}
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 304
+    # Row count and fingerprint, no rows or relationships are loaded
+    assert len(statements) == 2
+    assert not any("addresses" in s for s in statements)
+
+
+def test_list_view_etag_counts_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    class VersionedUserAdmin(UserAdmin):
+        column_version = "name"
+
+    monkeypatch.setitem(admin._model_admins, "user", VersionedUserAdmin())
+
+    session.add(User(name="John Doe"))
+    session.commit()
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with TestClient(app) as client:
+            response = client.get("/admin/user/list")
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert "of <span>1</span> items" in response.text
+    assert sum("count(" in s.lower() for s in statements) == 1
+
+
+def test_detail_page_etag(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FingerprintUserAdmin(UserAdmin):
+        def get_fingerprint_query(self, stmt: Any) -> Any:
+            return select(func.max(Address.id))
+
+    monkeypatch.setitem(admin._model_admins, "user", FingerprintUserAdmin())
+
+    user = User(name="John Doe")
+    session.add(user)
+    session.commit()
+
+    with TestClient(app) as client:
+        etag = client.get("/admin/user/details/1").headers["etag"]
+
+        response = client.get("/admin/user/details/1", headers={"If-None-Match": "*"})
+        assert response.status_code == 304
+
+        response = client.get(
+            "/admin/user/details/1", headers={"If-None-Match": etag[2:]}
+        )
+        assert response.status_code == 304
+
+        session.add(Address(user=user))
+        session.commit()
+        response = client.get("/admin/user/details/1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+
+def test_list_view_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = MemoryListCache()
+    monkeypatch.setattr(UserAdmin, "list_cache", cache)
+    monkeypatch.setattr(AddressAdmin, "list_cache", cache)
+    monkeypatch.setattr(MovieAdmin, "list_cache", cache)
+
+    session.add(User(name="John Doe", addresses=[Address()]))
+    session.commit()
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    def get_list(url: str) -> str:
+        statements.clear()
+        with TestClient(app) as client:
+            response = client.get(url)
+        assert response.status_code == 200
+        return response.text
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        get_list("/admin/user/list")
+        assert statements
+
+        text = get_list("/admin/user/list")
+        assert statements == []
+        assert "<td>Address 1</td>" in text
+
+        # Other pages are cached apart
+        get_list("/admin/user/list?page_size=25")
+        assert statements
+
+        # Changes of related models invalidate the page
+        with TestClient(app) as client:
+            response = client.delete("/admin/address/delete/1")
+        assert response.status_code == 200
+
+        text = get_list("/admin/user/list")
+        assert statements
+        assert "<td>Address 1</td>" not in text
+
+        # Unrelated models keep their pages
+        get_list("/admin/user/list")
+        anyio.run(admin._model_admins["movie"]._invalidate_list_cache)
+        get_list("/admin/user/list")
+        assert statements == []
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def test_list_view_cache_write_during_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = MemoryListCache()
+    monkeypatch.setattr(UserAdmin, "list_cache", cache)
+
+    user_admin = admin._model_admins["user"]
+    run_list_query = user_admin._run_list_query
+
+    async def run_list_query_then_write(*args: Any) -> Any:
+        result = await run_list_query(*args)
+        # Another request changes a row before the page is cached
+        await user_admin.insert_model(User(name="Jane Doe"))
+        return result
+
+    monkeypatch.setattr(user_admin, "_run_list_query", run_list_query_then_write)
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+    assert "of <span>0</span> items" in response.text
+    assert len(cache) == 0
+
+    monkeypatch.setattr(user_admin, "_run_list_query", run_list_query)
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+    assert "of <span>1</span> items" in response.text
+
+
+def test_list_view_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    session.add_all([User(name=f"John {i}") for i in range(15)])
+    session.add_all([User(name=f"Jane {i}") for i in range(5)])
+    session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list?q=john")
+
+    assert 'name="q"' not in response.text
+    assert "of <span>20</span> items" in response.text
+
+    class SearchUserAdmin(UserAdmin):
+        column_searchable_list = [User.name, User.email]
+
+    monkeypatch.setitem(admin._model_admins, "user", SearchUserAdmin())
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list?q=+john+&page_size=25")
+        assert response.status_code == 200
+        assert 'name="q" value="john"' in response.text
+        assert "of <span>15</span> items" in response.text
+        assert len(re.findall(r"<td>John \d+</td>", response.text)) == 15
+        assert "format=csv&amp;q=john" in response.text
+
+        response = client.get("/admin/user/list?q=john&page=2")
+        assert "Showing <span>11</span> to <span>15</span>" in response.text
+        assert "<td>Jane" not in response.text
+        assert "q=john&amp;page=1" in response.text
+
+        response = client.get("/admin/user/list?q=nobody")
+        assert "of <span>0</span> items" in response.text
+
+        response = client.get("/admin/user/export?format=csv&q=jane")
+        assert len(response.text.splitlines()) == 6
+
+
+def test_list_view_count_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    class CountUserAdmin(UserAdmin):
+        column_searchable_list = [User.name]
+
+        async def count(self) -> RowCount:
+            return RowCount(100)
+
+    monkeypatch.setitem(admin._model_admins, "user", CountUserAdmin())
+
+    session.add_all([User(name="John Doe"), User(name="Jane Doe")])
+    session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+        assert "of <span>100</span> items" in response.text
+
+        # The override cannot count the rows matching a search
+        response = client.get("/admin/user/list?q=jane")
+        assert "of <span>1</span> items" in response.text
+
+
+def test_list_view_int_count_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    class CountUserAdmin(UserAdmin):
+        async def count(self) -> int:  # type: ignore[override]
+            return 100
+
+    class VersionedUserAdmin(CountUserAdmin):
+        column_version = "name"
+
+    session.add(User(name="John Doe"))
+    session.commit()
+
+    # Counted for the page, and for the ETag
+    for model_admin in (CountUserAdmin(), VersionedUserAdmin()):
+        monkeypatch.setitem(admin._model_admins, "user", model_admin)
+        with TestClient(app) as client:
+            response = client.get("/admin/user/list")
+
+        assert response.status_code == 200
+        assert "of <span>100</span> items" in response.text
+
+
+def test_list_view_filters(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Every user has a name, as keyset pagination requires
+    monkeypatch.setattr(User.__table__.c.name, "nullable", False)
+
+    class FilterUserAdmin(UserAdmin):
+        column_filters = [User.name, User.email, User.birthdate]
+        column_searchable_list = [User.name]
+        pagination_mode = "keyset"
+        column_default_sort = (User.name, True)
+
+    monkeypatch.setitem(admin._model_admins, "user", FilterUserAdmin())
+
+    for i in range(15):
+        session.add(User(name=f"User {i:02}", birthdate=date(2000 + i, 1, 1)))
+    session.add(User(name="Mail", email="mail@example.com"))
+    session.commit()
+
+    def names(text: str) -> List[str]:
+        return re.findall(r"<td>(User \d+|Mail)</td>", text)
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+        assert 'name="birthdate__gte"' in response.text
+        assert 'name="email__null"' in response.text
+        assert "of <span>16</span> items" in response.text
+
+        url = "/admin/user/list?birthdate__gte=2002-01-01&birthdate__lte=2013-01-01"
+        response = client.get(url)
+        assert response.status_code == 200
+        assert "of <span>12</span> items" in response.text
+        assert names(response.text) == [f"User {i:02}" for i in range(13, 3, -1)]
+        assert 'value="2002-01-01"' in response.text
+
+        # Keyset pages keep the filters and the sort order
+        next_url = re.findall(
+            r'class="page-link" href="([^"]*cursor=[^"]*)"', response.text
+        )[-1].replace("&amp;", "&")
+        assert "birthdate__gte=2002-01-01" in next_url
+        response = client.get(next_url)
+        assert names(response.text) == ["User 03", "User 02"]
+
+        response = client.get("/admin/user/list?email__null=false&birthdate__null=")
+        assert names(response.text) == ["Mail"]
+
+        response = client.get("/admin/user/list?q=user+1&birthdate__lte=2011-06-01")
+        assert names(response.text) == ["User 11", "User 10"]
+        assert "q=user+1&amp;birthdate__lte=2011-06-01" in response.text
+
+        response = client.get("/admin/user/export?format=csv&name__eq=Mail")
+        assert len(response.text.splitlines()) == 2
+
+        response = client.get("/admin/user/list?birthdate__gte=tomorrow")
+        assert response.status_code == 400
+
+        response = client.get("/admin/user/export?birthdate__gte=tomorrow")
+        assert response.status_code == 400
+
+
 def test_list_page_permission_actions() -> None:
     for _ in range(10):
         user = User(name="John Doe")
@@ -378,6 +1000,25 @@ def test_create_endpoint_post_form() -> None:
     assert user.addresses == [address]
 
 
+def test_form_class_is_cached() -> None:
+    class FormUserAdmin(ModelAdmin, model=User):
+        form_columns = [User.name, "addresses"]
+
+    Admin(app=Starlette(), engine=engine).register_model(FormUserAdmin)
+    user_admin = FormUserAdmin()
+    Form = anyio.run(user_admin.scaffold_form)
+
+    assert anyio.run(user_admin.scaffold_form) is Form
+    assert list(Form()._fields) == ["name", "addresses"]
+
+    session.add(Address(id=7))
+    session.commit()
+
+    form = Form()
+    anyio.run(user_admin.load_form_choices, form)
+    assert [pk for pk, _ in form["addresses"]._object_list] == ["7"]
+
+
 def test_list_view_page_size_options() -> None:
     with TestClient(app) as client:
         response = client.get("/admin/user/list")
@@ -487,3 +1128,473 @@ def test_update_submit_form() -> None:
         response = client.post("/admin/user/edit/1", data=data)
 
     assert response.status_code == 400
+
+
+def test_update_model_query_count() -> None:
+    user = User(name="Joe")
+    address = Address(user=user)
+    session.add_all([user, address, User(name="Jane")])
+    session.commit()
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    user_admin = admin._model_admins["user"]
+    address_admin = admin._model_admins["address"]
+    jane = session.get(User, 2)
+    session.refresh(address)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        anyio.run(address_admin.update_model, 1, {"user": jane})
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE addresses")
+
+        statements.clear()
+        data = {"name": "Jack", "addresses": [address]}
+        anyio.run(user_admin.update_model, 2, data)
+        assert len(statements) == 2
+        assert statements[1].startswith("UPDATE users")
+
+        statements.clear()
+        data = {"name": "Jack", "addresses": [address]}
+        anyio.run(user_admin.update_model, 1, data)
+        assert not statements[-1].startswith("UPDATE users")
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    session.expire_all()
+    assert address.user_id == 1
+    assert jane.name == "Jack"
+    assert user.name == "Jack"
+
+
+def test_update_model_one_to_one() -> None:
+    person = Person(name="Joe")
+    passport = Passport(number="A1")
+    session.add_all([person, passport])
+    session.commit()
+
+    class PersonAdmin(ModelAdmin, model=Person):
+        pass
+
+    Admin(app=Starlette(), engine=engine).register_model(PersonAdmin)
+    session.refresh(passport)
+
+    # The foreign key is on the passport, the person row keeps its primary key
+    anyio.run(PersonAdmin().update_model, 1, {"name": "Jack", "passport": passport})
+
+    session.expire_all()
+    assert person.id == 1
+    assert person.name == "Jack"
+    assert passport.person_id == 1
+
+    anyio.run(PersonAdmin().update_model, 1, {"name": "Jack", "passport": None})
+
+    session.expire_all()
+    assert passport.person_id is None
+
+
+def test_update_model_runs_validators() -> None:
+    session.add(Passport(number="A1"))
+    session.commit()
+
+    class PassportAdmin(ModelAdmin, model=Passport):
+        pass
+
+    Admin(app=Starlette(), engine=engine).register_model(PassportAdmin)
+    anyio.run(PassportAdmin().update_model, 1, {"number": "b2"})
+
+    assert session.get(Passport, 1).number == "B2"
+
+
+def test_update_model_collection_difference() -> None:
+    tags = [Tag() for _ in range(100)]
+    movie = Movie(tags=tags[:50])
+    user = User(name="Joe", addresses=[Address(), Address()])
+    session.add_all([movie, user, Address(), *tags])
+    session.commit()
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    movie_admin = admin._model_admins["movie"]
+    user_admin = admin._model_admins["user"]
+    addresses = [user.addresses[1], session.get(Address, 3)]
+    for obj in [*tags, *addresses]:
+        session.refresh(obj)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        # One tag removed and one added, the other 49 are left alone
+        anyio.run(movie_admin.update_model, 1, {"tags": tags[1:51]})
+        assert [s.split()[0] for s in statements] == [
+            "SELECT",
+            "SELECT",
+            "DELETE",
+            "INSERT",
+        ]
+
+        statements.clear()
+        anyio.run(user_admin.update_model, 1, {"name": "Joe", "addresses": addresses})
+        assert [s.split()[0] for s in statements] == [
+            "SELECT",
+            "UPDATE",
+            "UPDATE",
+            "UPDATE",
+        ]
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    session.expire_all()
+    assert [tag.id for tag in movie.tags] == list(range(2, 52))
+    assert [address.id for address in user.addresses] == [2, 3]
+    assert session.get(Address, 1).user_id is None
+
+
+def test_edit_and_delete_endpoints_single_transaction() -> None:
+    session.add_all([User(name="Joe"), Address()])
+    session.commit()
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with TestClient(app) as client:
+            # The row is updated without loading it first
+            response = client.post("/admin/address/edit/1", data={"user": "1"})
+            assert response.status_code == 302
+            assert [s.split()[0] for s in statements] == ["SELECT", "UPDATE"]
+
+            response = client.post("/admin/address/edit/2", data={"user": "1"})
+            assert response.status_code == 404
+
+            statements.clear()
+            response = client.delete("/admin/address/delete/1")
+            assert response.status_code == 200
+            assert [s.split()[0] for s in statements] == ["DELETE"]
+
+            response = client.delete("/admin/address/delete/1")
+            assert response.status_code == 404
+
+            response = client.delete("/admin/address/delete/abc")
+            assert response.status_code == 404
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert session.query(Address).count() == 0
+
+
+def test_delete_endpoints_call_delete_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    deleted: List[int] = []
+
+    class SoftDeleteAddressAdmin(AddressAdmin):
+        async def delete_model(self, obj: Any) -> None:
+            deleted.append(obj.id)
+
+    monkeypatch.setitem(admin._model_admins, "address", SoftDeleteAddressAdmin())
+
+    session.add_all([Address(), Address(), Address()])
+    session.commit()
+
+    with TestClient(app) as client:
+        response = client.delete("/admin/address/delete/1")
+        assert response.status_code == 200
+
+        data: Dict[str, Any] = {"pks": ["2", "3", "4"]}
+        response = client.request("DELETE", "/admin/address/delete", data=data)
+        assert response.status_code == 200
+
+        response = client.delete("/admin/address/delete/4")
+        assert response.status_code == 404
+
+    assert deleted == [1, 2, 3]
+    assert session.query(Address).count() == 3
+
+
+def test_edit_endpoint_not_found_invalid_form() -> None:
+    with TestClient(app) as client:
+        response = client.post("/admin/user/edit/1", data={"name": "Jack" * 10})
+
+    assert response.status_code == 404
+
+
+def test_ajax_lookup_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    class AjaxAddressAdmin(AddressAdmin):
+        form_ajax_refs = {"user": {"fields": [User.name], "page_size": 2}}
+
+    monkeypatch.setitem(admin._model_admins, "address", AjaxAddressAdmin())
+
+    session.add_all([User(name="Ann"), User(name="Anna"), User(name="Annie")])
+    session.add(User(name="Bob"))
+    session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/address/lookup/user?q=an")
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["results"] == [
+            {"id": "1", "text": "User 1"},
+            {"id": "2", "text": "User 2"},
+        ]
+
+        response = client.get(
+            "/admin/address/lookup/user",
+            params={"q": "an", "cursor": data["next_cursor"]},
+        )
+        assert response.json() == {
+            "results": [{"id": "3", "text": "User 3"}],
+            "next_cursor": None,
+        }
+
+        response = client.get("/admin/address/lookup/user?q=an&cursor=invalid")
+        assert response.status_code == 400
+
+        response = client.get("/admin/address/lookup/addresses")
+        assert response.status_code == 404
+
+        response = client.get("/admin/address/create")
+        assert 'data-role="ajax-select"' in response.text
+        assert 'data-url="http://testserver/admin/address/lookup/user"' in response.text
+        options = response.text.split('id="user"')[1].split("</select>")[0]
+        assert options.count("<option") == 1
+
+        response = client.post("/admin/address/create", data={"user": "4"})
+        assert response.status_code == 302
+
+        response = client.get("/admin/address/edit/1")
+        assert '<option selected value="4">User 4</option>' in response.text
+
+    address = session.execute(select(Address)).scalar_one()
+    assert address.user_id == 4
+
+
+def test_bulk_delete_endpoint() -> None:
+    user = User(name="Joe")
+    session.add(user)
+    session.add_all([Address(user=user) for _ in range(1200)])
+    session.commit()
+
+    statements: List[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with TestClient(app) as client:
+            data: Dict[str, Any] = {"pks": [str(i) for i in range(1, 1101)]}
+            response = client.request("DELETE", "/admin/address/delete", data=data)
+
+            assert response.status_code == 200
+            assert response.text == "http://testserver/admin/address/list"
+            assert len(statements) == 3
+            assert all(s.startswith("DELETE FROM addresses") for s in statements)
+
+            statements.clear()
+            response = client.request("DELETE", "/admin/user/delete", data={"pks": "1"})
+
+            assert response.status_code == 200
+            assert statements[0].startswith("UPDATE addresses SET user_id")
+            assert statements[1].startswith("DELETE FROM users")
+
+            response = client.request("DELETE", "/admin/user/delete", data={"pks": "x"})
+            assert response.status_code == 400
+
+            response = client.request(
+                "DELETE", "/admin/movie/delete", data={"pks": "1"}
+            )
+            assert response.status_code == 403
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert session.execute(select(func.count(User.id))).scalar_one() == 0
+    stmt = select(func.count(Address.id)).where(Address.user_id.is_(None))
+    assert session.execute(stmt).scalar_one() == 100
+
+
+def test_delete_models_orm_fallback() -> None:
+    session.add_all([Address(), Address()])
+    session.commit()
+
+    deleted = []
+
+    def before_delete(mapper: Any, connection: Any, target: Any) -> None:
+        deleted.append(target.id)
+
+    address_admin = admin._model_admins["address"]
+
+    event.listen(Address, "before_delete", before_delete)
+    try:
+        assert anyio.run(address_admin.delete_models, ["1", "2", "3"]) == 2
+    finally:
+        event.remove(Address, "before_delete", before_delete)
+
+    assert sorted(deleted) == [1, 2]
+
+
+def test_export_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sqladmin.models.EXPORT_BATCH_SIZE", 2)
+
+    user = User(name="Joe", email="joe@example.com")
+    session.add_all([user, Address(user=user), Address(user=user)])
+    session.add_all([User(name=f"User {i}") for i in range(4)])
+    session.commit()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/export?format=csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="user.csv"' in response.headers["content-disposition"]
+        lines = response.text.splitlines()
+        assert lines[0] == "id,name,Email,addresses"
+        assert lines[1] == '1,Joe,joe@example.com,"Address 1, Address 2"'
+        assert len(lines) == 6
+
+        response = client.get("/admin/user/export?format=jsonl")
+
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert rows[0] == {
+            "id": 1,
+            "name": "Joe",
+            "Email": "joe@example.com",
+            "addresses": "Address 1, Address 2",
+        }
+        assert len(rows) == 5
+
+        response = client.get("/admin/user/export?format=xml")
+        assert response.status_code == 400
+
+        response = client.get("/admin/movie/export")
+        assert response.status_code == 403
+
+        # Exports are disabled by default
+        response = client.get("/admin/address/export")
+        assert response.status_code == 403
+
+    async def collect() -> List[str]:
+        return [chunk async for chunk in admin._model_admins["user"].export("csv")]
+
+    # Header and one chunk per batch of rows
+    assert len(anyio.run(collect)) == 4
+
+
+def test_import_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    class ImportUserAdmin(UserAdmin):
+        can_import = True
+        import_batch_size = 2
+
+    monkeypatch.setitem(admin._model_admins, "user", ImportUserAdmin())
+
+    data = (
+        "name,email,birthdate\n"
+        "Joe,joe@example.com,2000-01-01\n"
+        "Jane,,\n"
+        "A name longer than sixteen,,\n"
+        "Bob,bob@example.com,not a date\n"
+        "Ann,ann@example.com,1990-12-31\n"
+    )
+
+    with TestClient(app) as client:
+        response = client.get("/admin/user/list")
+        assert 'href="http://testserver/admin/user/import"' in response.text
+
+        response = client.get("/admin/user/import")
+        assert response.status_code == 200
+        assert 'enctype="multipart/form-data"' in response.text
+
+        files = {"file": ("users.csv", data.encode(), "text/csv")}
+        response = client.post("/admin/user/import", files=files)
+
+        assert response.status_code == 200
+        assert "Imported <span>3</span> of <span>5</span> rows" in response.text
+        assert "<td>3</td>" in response.text
+        assert "<td>4</td>" in response.text
+
+        files = {"file": ("users.csv", b"name,password\nJoe,secret\n", "text/csv")}
+        response = client.post("/admin/user/import", files=files)
+        assert response.status_code == 400
+
+        response = client.get("/admin/address/import")
+        assert response.status_code == 403
+
+    stmt = select(User.name, User.birthdate).order_by(User.id)
+    users = session.execute(stmt).all()
+    assert [name for name, _ in users] == ["Joe", "Jane", "Ann"]
+    assert users[1].birthdate is None
+
+
+def test_import_rejected_rows_and_defaults() -> None:
+    session.add(Passport(number="A1"))
+    session.commit()
+
+    class PassportAdmin(ModelAdmin, model=Passport):
+        can_import = True
+        import_batch_size = 3
+
+    Admin(app=Starlette(), engine=engine).register_model(PassportAdmin)
+
+    # The duplicate rows fail their batch, which is then inserted row by row
+    data = b"number\nB2\nA1\nC3\nD4\nD4\n"
+    report = anyio.run(PassportAdmin().import_csv, io.BytesIO(data))
+
+    assert (report.rows, report.inserted) == (5, 3)
+    assert [row for row, _ in report.errors] == [2, 5]
+    assert "UNIQUE" in report.errors[0][1]["database"][0]
+
+    # Missing columns are left to their server defaults
+    stmt = select(Passport.number, Passport.country).order_by(Passport.id)
+    assert session.execute(stmt).all() == [
+        ("A1", "NL"),
+        ("B2", "NL"),
+        ("C3", "NL"),
+        ("D4", "NL"),
+    ]
+
+
+def test_import_database_errors() -> None:
+    # Fails with an OperationalError rather than an IntegrityError
+    session.execute(
+        text(
+            "CREATE TRIGGER fail_passports BEFORE INSERT ON passports "
+            "WHEN NEW.number = 'BAD' BEGIN SELECT abs(-9223372036854775807 - 1); END"
+        )
+    )
+    session.commit()
+
+    class PassportAdmin(ModelAdmin, model=Passport):
+        can_import = True
+        import_batch_size = 2
+
+    Admin(app=Starlette(), engine=engine).register_model(PassportAdmin)
+
+    data = b"number\nA1\nB2\nBAD\nC3\n"
+    report = anyio.run(PassportAdmin().import_csv, io.BytesIO(data))
+
+    assert (report.rows, report.inserted) == (4, 3)
+    assert [row for row, _ in report.errors] == [3]
+    assert report.errors[0][1] == {"database": ["integer overflow"]}
+
+
+def test_import_foreign_keys() -> None:
+    session.add(User(name="Joe"))
+    session.commit()
+
+    class ImportAddressAdmin(AddressAdmin):
+        can_import = True
+
+    Admin(app=Starlette(), engine=engine).register_model(ImportAddressAdmin)
+    report = anyio.run(ImportAddressAdmin().import_csv, io.BytesIO(b"user_id\n1\n"))
+
+    assert report.inserted == 1
+    assert session.execute(select(Address.user_id)).scalar_one() == 1
@@ -1,12 +1,22 @@
-from typing import Any
+import re
+from pathlib import Path
+from typing import Any, List
 
-from sqlalchemy import create_engine
+import anyio
+import pytest
+from sqlalchemy import Column, Integer, create_engine, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from starlette.applications import Starlette
 from starlette.testclient import TestClient
 
-from sqladmin import Admin
+from sqladmin import Admin, ModelAdmin
+from sqladmin.application import PoolStats
+from sqladmin.caching import MemoryListCache
+from sqladmin.exceptions import InvalidModelError
+from sqladmin.searching import FullTextSearch
+from sqladmin.templating import compile_templates
 from tests.common import TEST_DATABASE_URI_SYNC
 
 Base = declarative_base()  # type: Any
@@ -20,6 +30,12 @@ session: Session = LocalSession()
 app = Starlette()
 
 
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+
+
 def test_application_title() -> None:
     Admin(app=app, engine=engine)
 
@@ -28,6 +44,7 @@ def test_application_title() -> None:
 
     assert response.status_code == 200
     assert response.text.count("<h3>Admin</h3>") == 1
+    assert re.search(r"/admin/statics/css/main\.[0-9a-f]{12}\.css", response.text)
 
 
 def test_application_logo() -> None:
@@ -46,3 +63,163 @@ def test_application_logo() -> None:
         '<img src="https://example.com/logo.svg" width="64" height="64"'
         in response.text
     )
+
+
+def test_register_model() -> None:
+    class UserAdmin(ModelAdmin, model=User):
+        pass
+
+    class OtherUserAdmin(ModelAdmin, model=User):
+        pass
+
+    admin = Admin(app=Starlette(), engine=engine)
+    admin.register_model(UserAdmin)
+
+    assert [type(model_admin) for model_admin in admin.model_admins] == [UserAdmin]
+    assert isinstance(admin._find_model_admin("user"), UserAdmin)
+
+    with pytest.raises(InvalidModelError) as exc:
+        admin.register_model(OtherUserAdmin)
+
+    assert "identity 'user' is already registered" in str(exc.value)
+
+
+def test_register_model_validates_search_backend() -> None:
+    class UserAdmin(ModelAdmin, model=User):
+        column_searchable_list = [User.id]
+        search_backend = FullTextSearch()
+
+    admin = Admin(app=Starlette(), engine=engine)
+    with pytest.raises(AssertionError) as exc:
+        admin.register_model(UserAdmin)
+
+    assert exc.match("FTS5 search needs fts_table on SQLite.")
+    assert admin.model_admins == []
+
+
+def test_shared_session_factory() -> None:
+    class UserAdmin(ModelAdmin, model=User):
+        pass
+
+    admin = Admin(app=Starlette(), engine=engine, session_options={"autoflush": False})
+    admin.register_model(UserAdmin)
+
+    assert UserAdmin.sessionmaker is admin.sessionmaker
+    assert admin.sessionmaker.kw["autoflush"] is False
+    assert admin.sessionmaker.kw["expire_on_commit"] is False
+
+    with admin.sessionmaker() as session:
+        assert isinstance(session, admin.session_class)
+
+
+@pytest.mark.skipif(engine.dialect.name == "postgresql", reason="Supported")
+def test_statement_timeout_unsupported_dialect() -> None:
+    with pytest.raises(AssertionError):
+        Admin(app=Starlette(), engine=engine, statement_timeout=5)
+
+
+def test_pool_pre_ping_and_stats(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool_engine = create_engine(
+        TEST_DATABASE_URI_SYNC,
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+    )
+    Base.metadata.create_all(pool_engine)
+
+    class UserAdmin(ModelAdmin, model=User):
+        pass
+
+    admin = Admin(app=Starlette(), engine=pool_engine, pool_pre_ping=True)
+    admin.register_model(UserAdmin)
+
+    pings: List[bool] = []
+
+    def do_ping(dbapi_connection: Any) -> bool:
+        pings.append(True)
+        if len(pings) == 1:
+            raise Exception("Stale connection")
+        return True
+
+    monkeypatch.setattr(pool_engine.dialect, "do_ping", do_ping)
+
+    # The stale connection is replaced before the query runs
+    count = anyio.run(admin.model_admins[0].count)
+    assert count.value == 0
+    assert len(pings) == 1
+
+    # Connections of the application are left alone
+    with pool_engine.connect() as connection:
+        connection.execute(select(1))
+    assert len(pings) == 1
+
+    assert admin.pool_stats() == PoolStats(
+        size=5, checked_in=1, checked_out=0, overflow=-4
+    )
+
+    Base.metadata.drop_all(pool_engine)
+    pool_engine.dispose()
+
+    # Pools without the QueuePool counters
+    admin = Admin(app=Starlette(), engine=create_engine("sqlite://"))
+    assert admin.pool_stats() == PoolStats(None, None, None, None)
+
+
+def test_sync_worker_limit() -> None:
+    class UserAdmin(ModelAdmin, model=User):
+        pass
+
+    admin = Admin(app=Starlette(), engine=engine, sync_worker_limit=2)
+    admin.register_model(UserAdmin)
+
+    assert UserAdmin.workers is admin.workers
+    assert admin.worker_stats().limit == 2
+
+    Base.metadata.create_all(engine)
+    anyio.run(UserAdmin().count)
+    Base.metadata.drop_all(engine)
+
+    assert admin.worker_stats().calls == 1
+
+
+def test_list_cache() -> None:
+    class UserAdmin(ModelAdmin, model=User):
+        pass
+
+    cache = MemoryListCache()
+    admin = Admin(app=Starlette(), engine=engine, list_cache=cache)
+    admin.register_model(UserAdmin)
+
+    assert UserAdmin.list_cache is cache
+    assert admin.model_admins[0]._cache_tags == {"users"}
+
+
+def test_production_templates_cache(tmp_path: Path) -> None:
+    app = Starlette()
+    admin = Admin(
+        app=app, engine=engine, production=True, templates_cache_dir=str(tmp_path)
+    )
+
+    assert admin.templates.env.auto_reload is False
+
+    with TestClient(app) as client:
+        response = client.get("/admin")
+
+    assert response.status_code == 200
+    assert list(tmp_path.glob("__jinja2_*.cache"))
+
+
+def test_compiled_templates(tmp_path: Path) -> None:
+    compile_templates(tmp_path)
+
+    app = Starlette()
+    admin = Admin(app=app, engine=engine, compiled_templates=str(tmp_path))
+
+    template = admin.templates.env.get_template("index.html")
+    assert template.filename is not None
+    assert Path(template.filename).parent == tmp_path
+
+    with TestClient(app) as client:
+        response = client.get("/admin")
+
+    assert response.status_code == 200
+    assert response.text.count("<h3>Admin</h3>") == 1
@@ -0,0 +1,92 @@
+import gzip
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from sqladmin.assets import IMMUTABLE, StaticAssets, compress_directory
+
+CSS = "body { color: red; }\n" * 100
+
+
+def make_client(directory: Path) -> TestClient:
+    app = Starlette(routes=[Mount("/statics", app=StaticAssets(directory=directory))])
+    return TestClient(app)
+
+
+def test_fingerprinted_paths(tmp_path: Path) -> None:
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "main.min.css").write_text(CSS)
+    statics = StaticAssets(directory=tmp_path)
+
+    path = statics.fingerprint("css/main.min.css")
+    assert path.startswith("css/main.min.") and path.endswith(".css")
+    assert len(path) == len("css/main.min.css") + 13
+    assert statics.fingerprint("css/missing.css") == "css/missing.css"
+
+    with make_client(tmp_path) as client:
+        response = client.get(f"/statics/{path}")
+        assert response.status_code == 200
+        assert response.text == CSS
+        assert response.headers["cache-control"] == IMMUTABLE
+
+        # Outdated hash
+        response = client.get("/statics/css/main.min.0123456789ab.css")
+        assert response.status_code == 200
+        assert "cache-control" not in response.headers
+
+        response = client.get("/statics/css/main.min.css")
+        assert response.status_code == 200
+        assert "cache-control" not in response.headers
+
+        response = client.get("/statics/css/missing.0123456789ab.css")
+        assert response.status_code == 404
+
+
+def test_fingerprints_are_computed_once(tmp_path: Path) -> None:
+    (tmp_path / "main.css").write_text(CSS)
+    (tmp_path / "main.css.gz").write_bytes(gzip.compress(CSS.encode()))
+    statics = StaticAssets(directory=tmp_path)
+    app = Starlette(routes=[Mount("/statics", app=statics)])
+
+    assert list(statics._digests) == ["main.css"]
+
+    with TestClient(app) as client:
+        for i in range(10):
+            response = client.get(f"/statics/missing-{i}.0123456789ab.css")
+            assert response.status_code == 404
+
+        response = client.get(f"/statics/{statics.fingerprint('./main.css')}")
+        assert response.headers["cache-control"] == IMMUTABLE
+
+    # Requests of unknown files are not remembered
+    assert list(statics._digests) == ["main.css"]
+
+
+def test_precompressed_files(tmp_path: Path) -> None:
+    (tmp_path / "main.css").write_text(CSS)
+    (tmp_path / "tiny.js").write_text("x")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" * 100)
+
+    written = compress_directory(str(tmp_path))
+    assert written == [str(tmp_path / "main.css.gz")]
+    assert gzip.decompress((tmp_path / "main.css.gz").read_bytes()) == CSS.encode()
+
+    with make_client(tmp_path) as client:
+        response = client.get("/statics/main.css", headers={"accept-encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(CSS)
+        assert response.text == CSS
+
+        headers = {"accept-encoding": "br, gzip;q=0"}
+        response = client.get("/statics/main.css", headers=headers)
+        assert "content-encoding" not in response.headers
+        assert response.text == CSS
+
+        etag = response.headers["etag"]
+        headers = {"accept-encoding": "identity", "if-none-match": etag}
+        response = client.get("/statics/main.css", headers=headers)
+        assert response.status_code == 304
@@ -0,0 +1,106 @@
+import pytest
+
+from sqladmin.caching import MemoryListCache, _estimate_size
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_memory_list_cache_get_and_set() -> None:
+    cache = MemoryListCache()
+    assert await cache.get("user:1") is None
+
+    await cache.set("user:1", ["row"], ["users"])
+    assert await cache.get("user:1") == ["row"]
+
+    await cache.set("user:1", ["other row"], ["users"])
+    assert await cache.get("user:1") == ["other row"]
+    assert len(cache) == 1
+
+
+async def test_memory_list_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("sqladmin.caching.time.monotonic", lambda: now[0])
+
+    cache = MemoryListCache(ttl=10)
+    await cache.set("user:1", ["row"], ["users"])
+
+    now[0] += 9
+    assert await cache.get("user:1") == ["row"]
+
+    now[0] += 1
+    assert await cache.get("user:1") is None
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+async def test_memory_list_cache_lru_eviction() -> None:
+    cache = MemoryListCache(max_entries=2)
+    await cache.set("user:1", 1, ["users"])
+    await cache.set("user:2", 2, ["users"])
+
+    # Reading makes user:1 the most recently used entry
+    assert await cache.get("user:1") == 1
+    await cache.set("user:3", 3, ["users"])
+
+    assert await cache.get("user:1") == 1
+    assert await cache.get("user:2") is None
+    assert await cache.get("user:3") == 3
+
+
+async def test_memory_list_cache_max_bytes() -> None:
+    value = ["x" * 1000]
+    size = _estimate_size(value)
+
+    cache = MemoryListCache(max_bytes=size * 2)
+    await cache.set("user:1", value, ["users"])
+    await cache.set("user:2", ["y" * 1000], ["users"])
+    assert cache.size == size * 2
+
+    await cache.set("user:3", ["z" * 1000], ["users"])
+    assert await cache.get("user:1") is None
+    assert cache.size == size * 2
+
+    # Values larger than the cache are not stored
+    await cache.set("user:4", ["x" * 10000], ["users"])
+    assert await cache.get("user:4") is None
+    assert len(cache) == 2
+
+
+async def test_memory_list_cache_invalidate() -> None:
+    cache = MemoryListCache()
+    await cache.set("user:1", 1, ["users", "addresses"])
+    await cache.set("address:1", 2, ["addresses", "users"])
+    await cache.set("movie:1", 3, ["movies"])
+
+    await cache.invalidate(["addresses"])
+
+    assert await cache.get("user:1") is None
+    assert await cache.get("address:1") is None
+    assert await cache.get("movie:1") == 3
+    assert cache.size == _estimate_size(3)
+
+
+async def test_memory_list_cache_set_after_invalidate() -> None:
+    cache = MemoryListCache()
+    generation = await cache.get_generation(["users", "addresses"])
+
+    # A row changed while the page was queried
+    await cache.invalidate(["addresses"])
+    await cache.set("user:1", 1, ["users", "addresses"], generation)
+    assert await cache.get("user:1") is None
+
+    generation = await cache.get_generation(["users", "addresses"])
+    await cache.invalidate(["movies"])
+    await cache.set("user:1", 1, ["users", "addresses"], generation)
+    assert await cache.get("user:1") == 1
+
+
+def test_estimate_size_follows_attributes() -> None:
+    class Row:
+        def __init__(self, name: str) -> None:
+            self.name = name
+            self.children = [self]
+
+    small = _estimate_size([Row("x")])
+    large = _estimate_size([Row("x" * 1000)])
+    assert large - small > 900
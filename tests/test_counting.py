@@ -0,0 +1,90 @@
+from typing import Any, Generator
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, text
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import Session, sessionmaker
+
+from sqladmin import ModelAdmin
+from sqladmin.counting import CachedCount, EstimatedCount, ExactCount, NoCount, RowCount
+from tests.common import TEST_DATABASE_URI_SYNC
+
+Base: Any = declarative_base()
+
+engine = create_engine(
+    TEST_DATABASE_URI_SYNC, connect_args={"check_same_thread": False}
+)
+
+LocalSession = sessionmaker(bind=engine)
+
+session: Session = LocalSession()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class UserAdmin(ModelAdmin, model=User):
+    pass
+
+
+@pytest.fixture(autouse=True, scope="function")
+def prepare_database() -> Generator[None, None, None]:
+    Base.metadata.create_all(engine)
+    session.add_all([User(name=f"User {i}") for i in range(20)])
+    session.commit()
+    yield
+    session.execute(text("DROP TABLE IF EXISTS sqlite_stat1"))
+    session.commit()
+    Base.metadata.drop_all(engine)
+
+
+def test_exact_count() -> None:
+    assert ExactCount().count(session, UserAdmin()) == RowCount(20)
+
+
+def test_cached_count() -> None:
+    strategy = CachedCount(ttl=60)
+    model_admin = UserAdmin()
+
+    assert strategy.count(session, model_admin) == RowCount(20)
+
+    session.add(User(name="Cached"))
+    session.commit()
+    assert strategy.count(session, model_admin) == RowCount(20)
+
+    strategy.invalidate(model_admin)
+    assert strategy.count(session, model_admin) == RowCount(21)
+
+    strategy = CachedCount(ttl=0)
+    assert strategy.count(session, model_admin) == RowCount(21)
+    session.add(User(name="Expired"))
+    session.commit()
+    assert strategy.count(session, model_admin) == RowCount(22)
+
+
+def test_estimated_count_without_statistics() -> None:
+    strategy = EstimatedCount(threshold=10)
+
+    assert strategy.estimate(session, UserAdmin()) is None
+    assert strategy.count(session, UserAdmin()) == RowCount(20)
+
+
+def test_estimated_count_with_statistics() -> None:
+    session.execute(text("CREATE INDEX ix_users_name ON users (name)"))
+    session.execute(text("ANALYZE"))
+    session.add_all([User(name="Not analyzed") for _ in range(5)])
+    session.commit()
+
+    strategy = EstimatedCount(threshold=10)
+    assert strategy.count(session, UserAdmin()) == RowCount(20, estimated=True)
+
+    strategy = EstimatedCount(threshold=100)
+    assert strategy.count(session, UserAdmin()) == RowCount(25)
+
+
+def test_no_count() -> None:
+    assert NoCount().count(session, UserAdmin()) == RowCount(None)
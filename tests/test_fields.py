@@ -184,6 +184,10 @@ def test_query_select_field() -> None:
     class F(Form):
         select = QuerySelectField(object_list=object_list, get_label="__doc__")
 
+    form = F(DummyData(select=["1"]))
+    assert form.select.data is object_list[1][1]
+    assert form.validate() is True
+
     form = F(DummyData(select=["1"]))
     form.select._object_list = []
     assert form.validate() is False
@@ -221,3 +225,10 @@ def test_query_select_multiple_field() -> None:
     form.select._object_list = object_list
     assert form.select.data == []
     assert form.validate() is False
+
+    form = F(DummyData(select=["3", "1", "3"]))
+    assert form.select.data == [object_list[3][1], object_list[1][1]]
+    assert form.validate() is True
+
+    form = F(DummyData(select=["1", "100"]))
+    assert form.validate() is False
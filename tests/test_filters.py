@@ -0,0 +1,170 @@
+import datetime
+import enum
+from typing import Any, Dict, Generator, List
+
+import pytest
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    Enum,
+    Integer,
+    String,
+    create_engine,
+    select,
+)
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.datastructures import ImmutableMultiDict
+
+from sqladmin import ModelAdmin
+from sqladmin.exceptions import InvalidColumnError, InvalidFilterError
+from sqladmin.filters import BooleanFilter, EqualFilter, InFilter, RangeFilter
+from tests.common import TEST_DATABASE_URI_SYNC
+
+Base: Any = declarative_base()
+
+engine = create_engine(
+    TEST_DATABASE_URI_SYNC, connect_args={"check_same_thread": False}
+)
+
+LocalSession = sessionmaker(bind=engine)
+
+session: Session = LocalSession()
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    BANNED = "banned"
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    age = Column(Integer)
+    birthdate = Column(Date)
+    is_admin = Column(Boolean, nullable=False, default=False)
+    status = Column(Enum(Status), nullable=False, default=Status.ACTIVE)
+    role = Column(Enum("staff", "guest", name="role"))
+
+
+class UserAdmin(ModelAdmin, model=User):
+    column_filters = [
+        User.name,
+        User.age,
+        User.birthdate,
+        "is_admin",
+        User.status,
+        User.role,
+    ]
+    column_labels = {User.birthdate: "Birthday"}
+
+
+@pytest.fixture(autouse=True, scope="function")
+def prepare_database() -> Generator[None, None, None]:
+    Base.metadata.create_all(engine)
+    session.add_all(
+        [
+            User(name="Alice", age=30, birthdate=datetime.date(1990, 5, 1)),
+            User(name="Bob", age=20, is_admin=True, role="staff"),
+            User(name="Carol", status=Status.BANNED, role="guest"),
+        ]
+    )
+    session.commit()
+    yield
+    Base.metadata.drop_all(engine)
+
+
+def filter_names(values: Dict[str, List[str]]) -> List[str]:
+    model_admin = UserAdmin()
+    stmt = select(User.name).order_by(User.id)
+    for column_filter in model_admin.filters:
+        stmt = stmt.where(*column_filter.get_clauses(values))
+    return session.execute(stmt).scalars().all()
+
+
+def test_column_filters_resolved_by_type() -> None:
+    filters = UserAdmin().filters
+
+    assert [type(f) for f in filters] == [
+        EqualFilter,
+        RangeFilter,
+        RangeFilter,
+        BooleanFilter,
+        InFilter,
+        InFilter,
+    ]
+    assert filters[0].params == ["name__eq"]
+    assert filters[1].params == ["age__eq", "age__gte", "age__lte", "age__null"]
+    assert filters[1].input_type == "number"
+    assert filters[2].input_type == "date"
+    assert filters[2].label == "Birthday"
+    assert filters[4].choices == [("ACTIVE", "ACTIVE"), ("BANNED", "BANNED")]
+    assert filters[5].params == ["role__in", "role__null"]
+
+
+def test_column_filters_unknown_column() -> None:
+    class InvalidAdmin(ModelAdmin, model=User):
+        column_filters = ["unknown"]
+
+    with pytest.raises(InvalidColumnError):
+        InvalidAdmin()
+
+
+def test_filter_clauses() -> None:
+    assert filter_names({}) == ["Alice", "Bob", "Carol"]
+    assert filter_names({"name__eq": ["Bob"]}) == ["Bob"]
+    assert filter_names({"age__gte": ["20"], "age__lte": ["25"]}) == ["Bob"]
+    assert filter_names({"age__eq": ["30"]}) == ["Alice"]
+    assert filter_names({"age__null": ["true"]}) == ["Carol"]
+    assert filter_names({"age__null": ["false"]}) == ["Alice", "Bob"]
+    assert filter_names({"birthdate__gte": ["1990-01-01"]}) == ["Alice"]
+    assert filter_names({"is_admin__eq": ["true"]}) == ["Bob"]
+    assert filter_names({"is_admin__eq": ["false"]}) == ["Alice", "Carol"]
+    assert filter_names({"status__in": ["BANNED"]}) == ["Carol"]
+    assert filter_names({"role__in": ["staff", "guest"]}) == ["Bob", "Carol"]
+
+    # Empty form fields are ignored
+    assert filter_names({"age__gte": [""], "age__null": [""]}) == [
+        "Alice",
+        "Bob",
+        "Carol",
+    ]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {"age__gte": ["twenty"]},
+        {"birthdate__lte": ["yesterday"]},
+        {"is_admin__eq": ["maybe"]},
+        {"status__in": ["DELETED"]},
+        {"age__null": ["yes"]},
+    ],
+)
+def test_filter_invalid_values(values: Dict[str, List[str]]) -> None:
+    with pytest.raises(InvalidFilterError):
+        filter_names(values)
+
+
+def test_get_filter_values() -> None:
+    params = ImmutableMultiDict(
+        [
+            ("page", "2"),
+            ("age__gte", "18"),
+            ("age__lte", ""),
+            ("role__in", "staff"),
+            ("role__in", "guest"),
+            ("unknown__eq", "1"),
+        ]
+    )
+
+    assert UserAdmin().get_filter_values(params) == {
+        "age__gte": ["18"],
+        "role__in": ["staff", "guest"],
+    }
+
+    with pytest.raises(InvalidFilterError):
+        UserAdmin().get_filter_values(ImmutableMultiDict([("age__eq", "x")]))
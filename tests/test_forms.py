@@ -80,7 +80,7 @@ async def test_model_form_converter_exception() -> None:
         data = Column(JSON)
 
     with pytest.raises(Exception):
-        await get_model_form(model=Example, engine=engine)
+        get_model_form(model=Example)
 
 
 async def test_model_form_converter_with_defau() -> None:
@@ -90,14 +90,14 @@ async def test_model_form_converter_with_defau() -> None:
         id = Column(Integer, primary_key=True)
         user = User()
 
-    await get_model_form(model=Point, engine=engine)
+    get_model_form(model=Point)
 
 
 async def test_model_form_only() -> None:
-    Form = await get_model_form(model=User, engine=engine, only=["status"])
+    Form = get_model_form(model=User, only=["status"])
     assert len(Form()._fields) == 1
 
 
 async def test_model_form_exclude() -> None:
-    Form = await get_model_form(model=User, engine=engine, exclude=["status"])
+    Form = get_model_form(model=User, exclude=["status"])
     assert len(Form()._fields) == 8
@@ -1,13 +1,17 @@
+import enum
 from typing import Any
 
 import pytest
-from sqlalchemy import Column, ForeignKey, Integer, String, create_engine
+from sqlalchemy import Column, Enum, ForeignKey, Integer, String, create_engine, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from starlette.applications import Starlette
 
 from sqladmin import Admin, ModelAdmin
+from sqladmin.counting import RowCount
 from sqladmin.exceptions import InvalidColumnError, InvalidModelError
+from sqladmin.models import ColumnPlan
+from sqladmin.pagination import Cursor
 from tests.common import TEST_DATABASE_URI_SYNC
 
 Base = declarative_base()  # type: Any
@@ -40,6 +44,18 @@ class Address(Base):
     user = relationship("User", back_populates="addresses")
 
 
+class Status(enum.Enum):
+    ACTIVE = "active"
+    BLOCKED = "blocked"
+
+
+class Account(Base):
+    __tablename__ = "accounts"
+
+    id = Column(Integer, primary_key=True)
+    status = Column(Enum(Status), nullable=False)
+
+
 def test_model_setup() -> None:
     class UserAdmin(ModelAdmin, model=User):
         pass
@@ -158,6 +174,16 @@ def test_column_details_list_both_include_and_exclude() -> None:
     )
 
 
+def test_form_columns_both_include_and_exclude() -> None:
+    with pytest.raises(AssertionError) as exc:
+
+        class InvalidAdmin(ModelAdmin, model=User):
+            form_columns = [User.name]
+            form_excluded_columns = [User.id]
+
+    assert exc.match("Cannot use form_columns and form_excluded_columns together.")
+
+
 def test_column_details_list_default() -> None:
     class UserAdmin(ModelAdmin, model=User):
         pass
@@ -212,3 +238,70 @@ def test_column_labels_by_model_columns() -> None:
         column_labels = {Address.user_id: "User ID"}
 
     assert AddressAdmin().get_details_columns() == [("User ID", Address.user_id)]
+
+
+def test_column_plans_are_resolved_once() -> None:
+    class UserAdmin(ModelAdmin, model=User):
+        column_list = [User.id, "addresses"]
+        column_labels = {User.id: "ID"}
+
+    user_admin = UserAdmin()
+
+    assert all(isinstance(c, ColumnPlan) for c in user_admin.list_columns)
+    assert [(c.key, c.label, c.is_relationship) for c in user_admin.list_columns] == [
+        ("id", "ID", False),
+        ("addresses", "addresses", True),
+    ]
+    assert user_admin._list_relationships == ("addresses",)
+    assert isinstance(user_admin.list_columns, tuple)
+
+
+def test_keyset_cursor_enum_values() -> None:
+    class AccountAdmin(ModelAdmin, model=Account):
+        pagination_mode = "keyset"
+        column_default_sort = "status"
+
+    account_admin = AccountAdmin()
+    rows = [Account(id=1, status=Status.ACTIVE), Account(id=2, status=Status.BLOCKED)]
+
+    pagination = account_admin._get_keyset_pagination(
+        rows, RowCount(None), Cursor(page=1, values=[]), 1
+    )
+    assert pagination.next_cursor is not None
+    position = Cursor.decode(pagination.next_cursor)
+    stmt = account_admin._get_keyset_query(select(Account), position, 1)
+
+    assert Status.ACTIVE in stmt.compile().params.values()
+
+
+def test_keyset_nullable_sort_column() -> None:
+    with pytest.raises(AssertionError) as exc:
+
+        class UserAdmin(ModelAdmin, model=User):
+            pagination_mode = "keyset"
+            column_default_sort = "name"
+
+        UserAdmin()
+
+    assert exc.match("Keyset pagination needs a non-nullable sort column.")
+
+    class OffsetUserAdmin(ModelAdmin, model=User):
+        column_default_sort = "name"
+
+    OffsetUserAdmin()
+
+
+def test_keyset_previous_cursor_page_is_clamped() -> None:
+    class AccountAdmin(ModelAdmin, model=Account):
+        pagination_mode = "keyset"
+
+    # Walking backwards from page 2 after rows were inserted before page 1
+    rows = [Account(id=3), Account(id=2)]
+    position = Cursor(page=1, values=[4], backwards=True)
+    pagination = AccountAdmin()._get_keyset_pagination(
+        rows, RowCount(None), position, 1
+    )
+
+    assert pagination.page == 1
+    assert pagination.previous_cursor is not None
+    assert Cursor.decode(pagination.previous_cursor).page == 1
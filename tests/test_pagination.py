@@ -1,7 +1,11 @@
+import enum
+from datetime import date
+
 import pytest
 from starlette.datastructures import URL
 
-from sqladmin.pagination import PageControl, Pagination
+from sqladmin.exceptions import InvalidCursorError
+from sqladmin.pagination import Cursor, PageControl, Pagination
 
 BASE_URL = URL("http://testserver/users/list")
 
@@ -72,3 +76,108 @@ def test_multi_page_unequal_previous_and_next() -> None:
     ]
 
     assert pagination.page_controls == page_controls
+
+
+def test_cursor_encode_decode() -> None:
+    cursor = Cursor(page=3, values=[date(2022, 1, 1), 10], backwards=True)
+
+    decoded = Cursor.decode(cursor.encode())
+
+    assert decoded == Cursor(page=3, values=["2022-01-01", 10], backwards=True)
+
+
+def test_cursor_encode_enum() -> None:
+    class Status(enum.Enum):
+        ACTIVE = "active"
+
+    cursor = Cursor(page=2, values=[Status.ACTIVE, 10])
+
+    assert Cursor.decode(cursor.encode()).values == ["active", 10]
+
+
+def test_cursor_decode_invalid() -> None:
+    with pytest.raises(InvalidCursorError):
+        Cursor.decode("invalid")
+
+    with pytest.raises(InvalidCursorError):
+        Cursor.decode(Cursor(page=0, values=[1]).encode())
+
+
+def test_keyset_first_page() -> None:
+    pagination = Pagination(
+        rows=[], page=1, page_size=5, count=15, keyset=True, next_cursor="abc"
+    )
+    pagination.add_pagination_urls(BASE_URL)
+
+    assert pagination.has_previous is False
+    assert pagination.has_next is True
+    assert pagination.next_page.url == "http://testserver/users/list?cursor=abc"
+    with pytest.raises(RuntimeError):
+        pagination.previous_page
+
+
+def test_keyset_middle_page() -> None:
+    pagination = Pagination(
+        rows=[],
+        page=3,
+        page_size=5,
+        count=50,
+        keyset=True,
+        next_cursor="next",
+        previous_cursor="prev",
+    )
+    pagination.add_pagination_urls(URL(f"{BASE_URL}?cursor=current&page_size=5"))
+
+    assert pagination.page_controls == [
+        PageControl(
+            number=2, url="http://testserver/users/list?page_size=5&cursor=prev"
+        ),
+        PageControl(
+            number=3, url="http://testserver/users/list?cursor=current&page_size=5"
+        ),
+        PageControl(
+            number=4, url="http://testserver/users/list?page_size=5&cursor=next"
+        ),
+    ]
+
+
+def test_keyset_second_page_links_first_page() -> None:
+    pagination = Pagination(
+        rows=[], page=2, page_size=5, count=8, keyset=True, previous_cursor="prev"
+    )
+    pagination.add_pagination_urls(URL(f"{BASE_URL}?cursor=current"))
+
+    assert pagination.has_next is False
+    assert pagination.previous_page.url == "http://testserver/users/list"
+
+
+def test_unknown_count() -> None:
+    pagination = Pagination(rows=[], page=2, page_size=5, count=None, has_more=True)
+    pagination.add_pagination_urls(BASE_URL)
+
+    assert pagination.has_next is True
+    assert [p.number for p in pagination.page_controls] == [1, 2, 3]
+
+    pagination = Pagination(rows=[], page=2, page_size=5, count=None, has_more=False)
+    pagination.add_pagination_urls(BASE_URL)
+
+    assert pagination.has_next is False
+    assert [p.number for p in pagination.page_controls] == [1, 2]
+
+
+def test_estimated_count_with_has_more() -> None:
+    pagination = Pagination(
+        rows=[], page=2, page_size=5, count=10, count_estimated=True, has_more=True
+    )
+    pagination.add_pagination_urls(BASE_URL)
+
+    assert pagination.has_next is True
+    assert [p.number for p in pagination.page_controls] == [1, 2, 3]
+
+    pagination = Pagination(
+        rows=[], page=2, page_size=5, count=50, count_estimated=True, has_more=False
+    )
+    pagination.add_pagination_urls(BASE_URL)
+
+    assert pagination.has_next is False
+    assert [p.number for p in pagination.page_controls] == [1, 2]
@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+from typing import Any, Generator, List
+
+import pytest
+from sqlalchemy import Column, Date, Integer, String, create_engine, select, text
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import Session, sessionmaker
+
+from sqladmin import ModelAdmin
+from sqladmin.searching import ContainsSearch, FullTextSearch, PrefixSearch
+from tests.common import TEST_DATABASE_URI_SYNC
+
+Base = declarative_base()  # type: Any
+
+engine = create_engine(
+    TEST_DATABASE_URI_SYNC, connect_args={"check_same_thread": False}
+)
+
+LocalSession = sessionmaker(bind=engine)
+
+session: Session = LocalSession()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    age = Column(Integer)
+    birthdate = Column(Date)
+
+
+class UserAdmin(ModelAdmin, model=User):
+    column_searchable_list = [User.name, User.age, "birthdate"]
+
+
+@pytest.fixture(autouse=True, scope="function")
+def prepare_database(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    monkeypatch.setattr(UserAdmin, "engine", engine, raising=False)
+    Base.metadata.create_all(engine)
+    session.add_all(
+        [
+            User(name="Alice", age=42),
+            User(name="Albert", age=7),
+            User(name="al_x", age=30),
+            User(name="Bob", age=24),
+        ]
+    )
+    session.commit()
+    yield
+    session.execute(text("DROP TABLE IF EXISTS users_fts"))
+    session.commit()
+    Base.metadata.drop_all(engine)
+
+
+def search(backend: Any, term: str) -> List[str]:
+    clause = backend.get_clause(UserAdmin(), term)
+    stmt = select(User.name).where(clause).order_by(User.id)
+    return session.execute(stmt).scalars().all()
+
+
+def test_prefix_search() -> None:
+    backend = PrefixSearch()
+
+    assert search(backend, "Al") == ["Alice", "Albert", "al_x"]
+    assert search(backend, "al_") == ["al_x"]
+    assert search(backend, "%") == []
+    assert search(backend, "42") == ["Alice"]
+    assert search(backend, "4") == []
+
+    # The whole pattern is one parameter, so indexes can be used
+    compiled = backend.get_clause(UserAdmin(), "Al").compile()
+    assert "||" not in str(compiled)
+    assert "Al%" in compiled.params.values()
+
+
+def test_contains_search() -> None:
+    backend = ContainsSearch()
+
+    assert search(backend, "LIC") == ["Alice"]
+    assert search(backend, "_") == ["al_x"]
+    assert search(backend, "2") == ["Alice", "Bob"]
+
+
+def test_full_text_search_sqlite() -> None:
+    session.execute(
+        text(
+            "CREATE VIRTUAL TABLE users_fts USING fts5"
+            "(name, content='users', content_rowid='id')"
+        )
+    )
+    session.execute(text("INSERT INTO users_fts(users_fts) VALUES ('rebuild')"))
+    session.commit()
+
+    backend = FullTextSearch(fts_table="users_fts")
+
+    assert search(backend, "alice") == ["Alice"]
+    # Words are matched literally instead of as FTS5 queries
+    assert search(backend, "alice OR bob") == []
+    assert search(backend, 'alice"') == ["Alice"]
+    assert search(backend, "  ") == []
+
+
+def test_full_text_search_postgresql(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = FullTextSearch(config="english")
+
+    monkeypatch.setattr(
+        UserAdmin, "engine", SimpleNamespace(dialect=postgresql.dialect())
+    )
+    clause = backend.get_clause(UserAdmin(), "alice")
+    sql = str(clause.compile(dialect=postgresql.dialect()))
+    assert "to_tsvector(%(to_tsvector_1)s, users.name) @@ plainto_tsquery" in sql
+
+
+def test_full_text_search_validate(monkeypatch: pytest.MonkeyPatch) -> None:
+    FullTextSearch(fts_table="users_fts").validate(UserAdmin())
+
+    with pytest.raises(AssertionError) as exc:
+        FullTextSearch().validate(UserAdmin())
+    assert exc.match("FTS5 search needs fts_table on SQLite.")
+
+    monkeypatch.setattr(UserAdmin, "engine", SimpleNamespace(dialect=mysql.dialect()))
+    with pytest.raises(AssertionError) as exc:
+        FullTextSearch().validate(UserAdmin())
+    assert exc.match("Full-text search is not supported for 'mysql'.")
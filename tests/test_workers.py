@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import List
+
+import anyio
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool
+
+from sqladmin.workers import DEFAULT_WORKER_LIMIT, WorkerPool, WorkerStats
+
+pytestmark = pytest.mark.anyio
+
+
+def test_worker_pool_sized_to_engine_pool() -> None:
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=3)
+    assert WorkerPool.for_engine(engine).limit == 13
+    assert WorkerPool.for_engine(engine, 8).limit == 8
+
+    engine = create_engine(
+        "sqlite://", poolclass=QueuePool, pool_size=3, max_overflow=0
+    )
+    assert WorkerPool.for_engine(engine).limit == 3
+
+    engine = create_engine(
+        "sqlite://", poolclass=QueuePool, pool_size=3, max_overflow=-1
+    )
+    assert WorkerPool.for_engine(engine).limit == DEFAULT_WORKER_LIMIT
+
+    engine = create_engine("sqlite://", poolclass=NullPool)
+    assert WorkerPool.for_engine(engine).limit == DEFAULT_WORKER_LIMIT
+
+    engine = create_engine("sqlite://", poolclass=SingletonThreadPool)
+    assert WorkerPool.for_engine(engine).limit == DEFAULT_WORKER_LIMIT
+
+
+async def test_worker_pool_limits_threads() -> None:
+    workers = WorkerPool(2)
+    lock = threading.Lock()
+    running: List[int] = [0]
+    most_running: List[int] = [0]
+
+    def work() -> None:
+        with lock:
+            running[0] += 1
+            most_running[0] = max(most_running[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(6):
+            tg.start_soon(workers.run, work)
+
+    assert most_running[0] == 2
+
+    stats = workers.stats()
+    assert (stats.limit, stats.busy, stats.waiting, stats.calls) == (2, 0, 0, 6)
+    # Four calls waited for one or two rounds of work
+    assert stats.max_wait_seconds >= 0.09
+    assert stats.average_wait_seconds > 0
+
+
+async def test_worker_pool_returns_result() -> None:
+    workers = WorkerPool(1)
+    assert await workers.run(divmod, 7, 2) == (3, 1)
+    assert WorkerPool(1).stats() == WorkerStats(1, 0, 0, 0, 0.0, 0.0)